@@ -2,6 +2,6 @@
 # This file makes 'api' a Python package.
 
 from .routes import router
-from .controllers import chat_controller
+from .controllers import get_chat_controller
 
-__all__ = ["router", "chat_controller"]
+__all__ = ["router", "get_chat_controller"]
@@ -1,12 +1,19 @@
-from typing import Optional
-from fastapi import HTTPException, Depends
-from sqlalchemy.orm import Session
+import asyncio
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Type, Union
+from fastapi import BackgroundTasks, HTTPException, Depends
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from enum import Enum
-import uuid
+from types import MappingProxyType
+import orjson
 
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_async_db
 from app.database.models import (
     GeneralConversation,
     GeneralMessage,
@@ -14,12 +21,21 @@ from app.database.models import (
     PropertyMessage,
 )
 from app.modules.message_router import MessageRouter
+from app.modules.intent_classification import Intent
+from app.modules.context_manager import (
+    conversation_cache,
+    conversation_history_cache,
+    conversation_list_cache,
+    history_page_cache,
+)
+from app.modules.llm import ResponseCache
 from app.database.schemas import GeneralChatResponse, PropertyChatResponse
 from app.modules.communication.seller_buyer_communication import (
     SellerBuyerCommunicationModule,
 )
 from app.modules.property_context.property_context_module import PropertyContextModule
 from app.modules.session_management import SessionManager
+from app.utils.helpers import new_session_id
 
 
 class Role(str, Enum):
@@ -27,19 +43,67 @@ class Role(str, Enum):
     SELLER = "seller"
 
 
+# Statements for the per-turn queries, built once so only parameters vary
+_CONVERSATION_BY_SESSION = {
+    model: select(model).where(model.session_id == bindparam("session_id"))
+    for model in (GeneralConversation, PropertyConversation)
+}
+_RECENT_MESSAGES = {
+    model: (
+        select(model.role, model.content)
+        .where(model.conversation_id == bindparam("conversation_id"))
+        .order_by(model.timestamp.desc(), model.id.desc())
+        .limit(bindparam("window"))
+    )
+    for model in (GeneralMessage, PropertyMessage)
+}
+
+# Lets a chat turn's COMMIT return before its WAL record is flushed to disk
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit TO OFF")
+
+# Seller/buyer intents are relayed to the counterpart; of the rest, pricing and
+# booking have specialised property handlers and everything else is an inquiry
+_COUNTERPART_INTENTS = frozenset({Intent.BUYER_SELLER_COMMUNICATION, Intent.NEGOTIATION})
+_PROPERTY_HANDLER_BY_INTENT: Dict[Intent, str] = {
+    Intent.PRICE_INQUIRY: "handle_pricing",
+    Intent.AVAILABILITY_AND_BOOKING_REQUEST: "handle_booking",
+}
+
+
 class ChatController:
     def __init__(self):
-        self.message_router = MessageRouter()
-        self.seller_buyer_communication = SellerBuyerCommunicationModule()
-        self.property_context = PropertyContextModule()
-        self.session_manager = SessionManager()
+        self.history_cache = conversation_history_cache
+        self.history_page_cache = history_page_cache
+        self.conversation_list_cache = conversation_list_cache
+        self.conversation_cache = conversation_cache
+        self.response_cache = ResponseCache()
+
+    # Collaborators are built on first use, so a worker only pays for the
+    # modules behind the endpoints it actually serves
+
+    @cached_property
+    def message_router(self) -> MessageRouter:
+        return MessageRouter()
+
+    @cached_property
+    def seller_buyer_communication(self) -> SellerBuyerCommunicationModule:
+        # Share the router's modules rather than building (and loading) them twice
+        return self.message_router.seller_buyer_communication
+
+    @cached_property
+    def property_context(self) -> PropertyContextModule:
+        return self.message_router.property_context
+
+    @cached_property
+    def session_manager(self) -> SessionManager:
+        return SessionManager()
 
     async def handle_general_chat(
         self,
         message: str,
         session_id: str,
         user_id: Optional[str] = None,  # UUID string for Firebase user ID
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> GeneralChatResponse:
         """
         Handle general chat messages, manage conversation state, and generate responses.
@@ -50,89 +114,241 @@ class ChatController:
             user_id: Optional authenticated user's ID (UUID string from Firebase)
             db: Database session
         """
+        received_at = datetime.utcnow()
         try:
-            # Get or create general conversation
-            conversation = await self._get_or_create_general_conversation(
-                db=db, session_id=session_id, user_id=user_id
-            )
+            # The whole turn is one transaction: committed when the block
+            # exits, rolled back if anything in it raises
+            async with db.begin():
+                conversation, context = await self._start_general_turn(
+                    db=db, message=message, session_id=session_id, user_id=user_id
+                )
 
-            # Check if session is valid
-            if not self.session_manager.is_session_valid(conversation):
-                # For expired anonymous sessions, create a new one
-                if not conversation.is_logged_in:
-                    conversation = await self._get_or_create_general_conversation(
-                        db=db, session_id=str(uuid.uuid4()), user_id=user_id
-                    )
-                else:
-                    raise HTTPException(
-                        status_code=401,
-                        detail="Session has expired. Please log in again."
+                # Reuse a previous answer to the same stateless question, if any
+                response = self.response_cache.get(message)
+                if response is None:
+                    # Generate response using message router
+                    response = await self.message_router.route_message(
+                        message=message, context=context, chat_type="general"
                     )
+                    self.response_cache.set(message, response["response"], response["intent"])
+                response_text = response["response"]
+                intent = response["intent"]
+
+                await self._stage_general_turn(
+                    db, conversation, message, response_text, intent, received_at
+                )
+            self._remember_general_turn(db, conversation, message, response_text)
 
-            # Create user message
-            user_message = GeneralMessage(
+            # Every field comes from the committed row or the router, so skip
+            # re-validating them; the route's response_model still checks the output
+            return GeneralChatResponse.model_construct(
+                message=response_text,
                 conversation_id=conversation.id,
-                role="user",
-                content=message,
-                timestamp=datetime.utcnow(),
+                session_id=conversation.session_id,
+                intent=intent,
+                context=conversation.context,
             )
-            db.add(user_message)
 
-            # Get conversation history
-            conversation_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in conversation.messages[-5:]  # Last 5 messages for context
-            ]
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def handle_general_chat_stream(
+        self,
+        message: str,
+        session_id: str,
+        user_id: Optional[str],  # UUID string for Firebase user ID
+        db: AsyncSession,
+    ) -> AsyncIterator[str]:
+        """
+        Like handle_general_chat, but return the reply as server-sent events.
+
+        Conversation lookup and routing happen up front so failures still
+        surface as HTTP errors; the returned iterator then yields "chunk"
+        events as the LLM generates text, persists the turn, and finishes
+        with a "done" (or "error") event.
+        """
+        received_at = datetime.utcnow()
+        try:
+            # Commit the lookup (and any new conversation) now: the request's
+            # session is closed, and rolled back, before the body streams
+            async with db.begin():
+                conversation, context = await self._start_general_turn(
+                    db=db, message=message, session_id=session_id, user_id=user_id
+                )
+
+            cached = self.response_cache.get(message)
+            if cached is not None:
+                intent, chunks = cached["intent"], self._single_chunk(cached["response"])
+            else:
+                intent, chunks = await self.message_router.route_message_stream(
+                    message=message, context=context
+                )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        return self._stream_general_turn(
+            conversation.id, message, intent, chunks, received_at
+        )
 
-            # Get conversation context
-            context = {
+    async def _stream_general_turn(
+        self,
+        conversation_id: int,
+        message: str,
+        intent: str,
+        chunks: AsyncIterator[str],
+        received_at: datetime,
+    ) -> AsyncIterator[str]:
+        """Relay response chunks as SSE events, then persist the assembled reply.
+
+        Runs on its own session because the request's session is closed
+        before a streamed body is sent.
+        """
+        parts = []
+        try:
+            async for chunk in chunks:
+                parts.append(chunk)
+                yield self._sse_event({"type": "chunk", "content": chunk})
+
+            response_text = "".join(parts)
+            self.response_cache.set(message, response_text, intent)
+            async with AsyncSessionLocal() as db:
+                async with db.begin():
+                    await self._relax_commit(db)
+                    conversation = await db.get(GeneralConversation, conversation_id)
+                    if conversation is None:
+                        raise LookupError("Conversation no longer exists")
+                    await self._stage_general_turn(
+                        db, conversation, message, response_text, intent, received_at
+                    )
+                self._remember_general_turn(db, conversation, message, response_text)
+            yield self._sse_event({
+                "type": "done",
                 "conversation_id": conversation.id,
                 "session_id": conversation.session_id,
-                "user_id": conversation.user_id,
-                "conversation_history": conversation_history,
-                "context": conversation.context or {},
-            }
-
-            # Generate response using message router
-            response = await self.message_router.route_message(
-                message=message, context=context, chat_type="general"
-            )
-            response_text = response["response"]
-            intent = response["intent"]
+                "intent": intent,
+            })
+        except Exception as e:
+            yield self._sse_event({"type": "error", "detail": str(e)})
 
-            # Create assistant message
-            assistant_message = GeneralMessage(
-                conversation_id=conversation.id,
-                role="assistant",
-                content=response_text,
-                intent=intent,
-                timestamp=datetime.utcnow(),
-            )
-            db.add(assistant_message)
+    @staticmethod
+    async def _relax_commit(db: AsyncSession) -> None:
+        """Opt the current turn's transaction out of waiting on the WAL flush.
 
-            # Update conversation context
-            await self._update_conversation_context(
-                conversation, message, response_text
-            )
+        Postgres then flushes commits in groups from its WAL writer, so chat
+        writes stop being capped by the disk's fsync rate. A crash can lose
+        the last fraction of a second of turns but never corrupts data.
+        """
+        if settings.chat_async_commit:
+            await db.execute(_ASYNC_COMMIT)
 
-            # Update last message timestamp
-            conversation.last_message_at = datetime.utcnow()
-            db.commit()
+    @staticmethod
+    async def _single_chunk(text: str) -> AsyncIterator[str]:
+        yield text
 
-            # Refresh session activity
-            await self.session_manager.refresh_session(conversation)
+    @staticmethod
+    def _sse_event(data: Dict) -> str:
+        return f"data: {orjson.dumps(data).decode()}\n\n"
 
-            return GeneralChatResponse(
-                message=response_text,
-                conversation_id=conversation.id,
-                session_id=conversation.session_id,
-                intent=intent,
-                context=conversation.context,
-            )
+    async def _start_general_turn(
+        self,
+        db: AsyncSession,
+        message: str,
+        session_id: str,
+        user_id: Optional[str] = None,  # UUID string for Firebase user ID
+    ) -> Tuple[GeneralConversation, Dict]:
+        """Resolve the conversation for a general chat turn and build the routing context."""
+        await self._relax_commit(db)
+        # Get or create general conversation
+        conversation = await self._get_or_create_general_conversation(
+            db=db, session_id=session_id, user_id=user_id
+        )
 
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=500, detail=str(e))
+        # Check if session is valid
+        if not self.session_manager.is_session_valid(conversation):
+            # For expired anonymous sessions, create a new one
+            if not conversation.is_logged_in:
+                conversation = await self._get_or_create_general_conversation(
+                    db=db, session_id=new_session_id(), user_id=user_id
+                )
+            else:
+                raise HTTPException(
+                    status_code=401,
+                    detail="Session has expired. Please log in again."
+                )
+
+        # Get conversation history
+        conversation_history = await self._get_conversation_history(
+            db, GeneralMessage, conversation.id
+        )
+
+        # Get conversation context; the stored context is handed on read-only so
+        # no module can mark the column dirty and force a rewrite of the row
+        context = {
+            "conversation_id": conversation.id,
+            "session_id": conversation.session_id,
+            "user_id": conversation.user_id,
+            "conversation_history": conversation_history,
+            "context": MappingProxyType(conversation.context),
+        }
+        return conversation, context
+
+    async def _stage_general_turn(
+        self,
+        db: AsyncSession,
+        conversation: GeneralConversation,
+        message: str,
+        response_text: str,
+        intent: str,
+        received_at: datetime,
+    ) -> None:
+        """Add both sides of a general chat turn to the session's transaction."""
+        # Persist both sides of the turn in a single batched INSERT
+        now = datetime.utcnow()
+        user_message = GeneralMessage(
+            conversation_id=conversation.id,
+            role="user",
+            content=message,
+            timestamp=received_at,
+        )
+        assistant_message = GeneralMessage(
+            conversation_id=conversation.id,
+            role="assistant",
+            content=response_text,
+            intent=intent,
+            timestamp=now,
+        )
+        db.add_all([user_message, assistant_message])
+
+        # Update conversation context
+        await self._update_conversation_context(
+            conversation, message, response_text
+        )
+
+        # Update last message timestamp, which also refreshes session activity
+        conversation.last_message_at = now
+
+    def _remember_general_turn(
+        self,
+        db: AsyncSession,
+        conversation: GeneralConversation,
+        message: str,
+        response_text: str,
+    ) -> None:
+        """Keep the cached conversation and history window in step with a committed turn."""
+        self._cache_conversation(db, GeneralConversation, conversation)
+        cache_key = (GeneralMessage.__tablename__, conversation.id)
+        self.history_cache.append(
+            cache_key,
+            {"role": "user", "content": message},
+            {"role": "assistant", "content": response_text},
+        )
+        self.history_page_cache.invalidate(cache_key)
+        # The turn moved last_message_at, which orders the user's listing
+        self.conversation_list_cache.invalidate(conversation.user_id)
 
     async def handle_property_chat(
         self,
@@ -142,122 +358,152 @@ class ChatController:
         role: Role,
         counterpart_id: str,  # UUID string for the other party
         session_id: str,
-        db: Session,
+        db: AsyncSession,
+        background_tasks: Optional[BackgroundTasks] = None,
     ) -> PropertyChatResponse:
-        """Handle property-specific chat messages."""
-        try:
-            # Get or create conversation
-            conversation = await self._get_or_create_property_conversation(
-                db=db,
-                session_id=session_id,
-                user_id=user_id,
-                property_id=property_id,
-                role=role,
-                counterpart_id=counterpart_id,
-            )
+        """Handle property-specific chat messages.
 
-            # Check if session is valid
-            if not self.session_manager.is_property_session_valid(conversation):
-                raise HTTPException(
-                    status_code=400,
-                    detail="Property conversation session has expired or been archived.",
+        When background_tasks is given the counterpart is notified after the
+        response has been sent, otherwise within the request.
+        """
+        received_at = datetime.utcnow()
+        try:
+            # The whole turn is one transaction: committed when the block
+            # exits, rolled back if anything in it raises
+            async with db.begin():
+                await self._relax_commit(db)
+                # Get or create conversation
+                conversation = await self._get_or_create_property_conversation(
+                    db=db,
+                    session_id=session_id,
+                    user_id=user_id,
+                    property_id=property_id,
+                    role=role,
+                    counterpart_id=counterpart_id,
                 )
 
-            # Create user message
-            user_message = PropertyMessage(
-                conversation_id=conversation.id,
-                role=role,
-                content=message,
-                timestamp=datetime.utcnow(),
-            )
-            db.add(user_message)
-            db.commit()  # Commit to ensure message is in history
-            db.refresh(conversation)  # Refresh to get updated messages
-
-            # Get conversation history
-            conversation_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in conversation.messages[-5:]  # Last 5 messages for context
-            ]
-
-            # Get conversation context
-            context = {
-                "conversation_id": conversation.id,
-                "session_id": conversation.session_id,
-                "user_id": conversation.user_id,
-                "property_id": conversation.property_id,
-                "role": conversation.role,
-                "counterpart_id": conversation.counterpart_id,
-                "conversation_history": conversation_history,
-                "property_context": conversation.property_context or {},
-                "db": db,  # Add database session to context
-                "message_id": user_message.id  # Add message ID to context
-            }
-
-            # Use message router to classify intent
-            router_response = await self.message_router.route_message(
-                message=message,
-                context=context,
-                chat_type="property"
-            )
-            intent = router_response["intent"]
-
-            # Handle message based on intent
-            if intent in ["buyer_seller_communication", "negotiation"]:
-                # Use seller-buyer module for direct communications and negotiations
-                response_text = await self.seller_buyer_communication.handle_message(
-                    message=message,
-                    context=context
+                # Check if session is valid
+                if not self.session_manager.is_property_session_valid(conversation):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Property conversation session has expired or been archived.",
+                    )
+
+                # Get conversation history, ending with the incoming message
+                conversation_history = await self._get_conversation_history(
+                    db, PropertyMessage, conversation.id
                 )
-                # Notify counterpart for both negotiation and buyer_seller_communication
-                await self.seller_buyer_communication.notify_counterpart(
+                conversation_history.append({"role": Role(role).value, "content": message})
+                conversation_history = conversation_history[-self.history_cache.window:]
+
+                # Create user message; it is only flushed early when a handler
+                # needs its ID, otherwise it is inserted with the reply at commit
+                user_message = PropertyMessage(
                     conversation_id=conversation.id,
-                    message=message,
-                    db=db,
-                    context=context
-                )
-            elif intent == "price_inquiry":
-                # Use property context module's specialized pricing handler
-                response_text = await self.property_context.handle_pricing(
-                    message=message,
-                    context={"property_id": property_id}
+                    role=role,
+                    content=message,
+                    timestamp=received_at,
                 )
-            elif intent == "availability_and_booking":
-                # Use property context module's specialized booking handler
-                response_text = await self.property_context.handle_booking(
-                    message=message,
-                    context={"property_id": property_id}
+                db.add(user_message)
+
+                # Get conversation context
+                context = {
+                    "conversation_id": conversation.id,
+                    "session_id": conversation.session_id,
+                    "user_id": conversation.user_id,
+                    "property_id": conversation.property_id,
+                    "role": conversation.role,
+                    "counterpart_id": conversation.counterpart_id,
+                    "conversation_history": conversation_history,
+                    "property_context": MappingProxyType(conversation.property_context),
+                }
+
+                # Classify only; the handlers below generate the response
+                intent = await self.message_router.classify_intent(message=message, context=context)
+
+                # Handle message based on intent
+                if intent in _COUNTERPART_INTENTS:
+                    # Forwarded questions reference the user message, so
+                    # INSERT ... RETURNING it now to get its ID
+                    await db.flush()
+                    context["message_id"] = user_message.id
+
+                    # Use seller-buyer module for direct communications and negotiations,
+                    # formatting the counterpart's copy concurrently (no DB access)
+                    response_text, formatted_message = await asyncio.gather(
+                        self.seller_buyer_communication.handle_message(
+                            message=message,
+                            context=context,
+                            db=db,
+                        ),
+                        self.seller_buyer_communication.format_message_for_counterpart(
+                            message, context["role"], context["property_context"]
+                        ),
+                    )
+                    # Notify counterpart for both negotiation and buyer_seller_communication
+                    if background_tasks is not None:
+                        background_tasks.add_task(
+                            self.seller_buyer_communication.notify_counterpart_in_background,
+                            conversation_id=conversation.id,
+                            message=message,
+                            context=context,
+                            formatted_message=formatted_message,
+                        )
+                    else:
+                        await self.seller_buyer_communication.notify_counterpart(
+                            conversation_id=conversation.id,
+                            message=message,
+                            db=db,
+                            context=context,
+                            formatted_message=formatted_message,
+                        )
+                else:
+                    # Pricing and booking have specialised handlers; all other
+                    # intents are treated as general property inquiries
+                    handler = getattr(
+                        self.property_context,
+                        _PROPERTY_HANDLER_BY_INTENT.get(intent, "handle_inquiry"),
+                    )
+                    response_text = await handler(
+                        message=message,
+                        context={"property_id": property_id}
+                    )
+
+                # Create assistant message
+                now = datetime.utcnow()
+                assistant_message = PropertyMessage(
+                    conversation_id=conversation.id,
+                    role="assistant",
+                    content=response_text,
+                    timestamp=now,
                 )
-            else:
-                # All other intents are treated as general property inquiries
-                response_text = await self.property_context.handle_inquiry(
-                    message=message,
-                    context={"property_id": property_id}
+                db.add(assistant_message)
+
+                # Update conversation context
+                await self._update_property_conversation_context(
+                    conversation, message, response_text
                 )
 
-            # Create assistant message
-            assistant_message = PropertyMessage(
-                conversation_id=conversation.id,
-                role="assistant",
-                content=response_text,
-                timestamp=datetime.utcnow(),
-            )
-            db.add(assistant_message)
+                # Update last message timestamp
+                conversation.last_message_at = now
 
-            # Update conversation context
-            await self._update_property_conversation_context(
-                conversation, message, response_text
+            self._cache_conversation(db, PropertyConversation, conversation)
+            cache_key = (PropertyMessage.__tablename__, conversation.id)
+            self.history_cache.append(
+                cache_key,
+                {"role": Role(role).value, "content": message},
+                {"role": "assistant", "content": response_text},
+            )
+            self.history_page_cache.invalidate(cache_key)
+            self.conversation_list_cache.invalidate(
+                conversation.user_id, conversation.counterpart_id
             )
 
-            # Update last message timestamp
-            conversation.last_message_at = datetime.utcnow()
-            db.commit()
-
-            return PropertyChatResponse(
+            return PropertyChatResponse.model_construct(
                 message=response_text,
                 conversation_id=conversation.id,
                 session_id=conversation.session_id,
-                intent=intent,
+                intent=intent.value,
                 property_context=conversation.property_context,
             )
 
@@ -267,33 +513,29 @@ class ChatController:
             raise HTTPException(status_code=500, detail=str(e))
 
     async def _get_or_create_general_conversation(
-        self, db: Session, session_id: str, user_id: Optional[str] = None  # UUID string for Firebase user ID
+        self, db: AsyncSession, session_id: str, user_id: Optional[str] = None  # UUID string for Firebase user ID
     ) -> GeneralConversation:
         """Get or create a general conversation."""
-        conversation = (
-            db.query(GeneralConversation)
-            .filter(GeneralConversation.session_id == session_id)
-            .first()
-        )
+        conversation = await self._find_conversation(db, GeneralConversation, session_id)
 
         if not conversation:
-            conversation = GeneralConversation(
+            now = datetime.utcnow()
+            conversation = await self._insert_conversation(
+                db,
+                GeneralConversation,
                 session_id=session_id,
                 user_id=user_id,
                 is_logged_in=bool(user_id),
-                started_at=datetime.utcnow(),
-                last_message_at=datetime.utcnow(),
+                started_at=now,
+                last_message_at=now,
                 context={},
             )
-            db.add(conversation)
-            db.commit()
-            db.refresh(conversation)
 
         return conversation
 
     async def _get_or_create_property_conversation(
         self,
-        db: Session,
+        db: AsyncSession,
         session_id: str,
         user_id: str,  # UUID string for Firebase user ID
         property_id: str,
@@ -301,30 +543,118 @@ class ChatController:
         counterpart_id: str,  # UUID string for the other party
     ) -> PropertyConversation:
         """Get or create a property-specific conversation."""
-        conversation = (
-            db.query(PropertyConversation)
-            .filter(PropertyConversation.session_id == session_id)
-            .first()
-        )
+        conversation = await self._find_conversation(db, PropertyConversation, session_id)
 
         if not conversation:
-            conversation = PropertyConversation(
+            now = datetime.utcnow()
+            conversation = await self._insert_conversation(
+                db,
+                PropertyConversation,
                 session_id=session_id,
                 user_id=user_id,
                 property_id=property_id,
                 role=role,
                 counterpart_id=counterpart_id,
                 conversation_status="active",
-                started_at=datetime.utcnow(),
-                last_message_at=datetime.utcnow(),
+                started_at=now,
+                last_message_at=now,
                 property_context={},
             )
-            db.add(conversation)
-            db.commit()
-            db.refresh(conversation)
 
         return conversation
 
+    async def _find_conversation(
+        self,
+        db: AsyncSession,
+        model: Type[Union[GeneralConversation, PropertyConversation]],
+        session_id: str,
+    ) -> Optional[Union[GeneralConversation, PropertyConversation]]:
+        """Look up a session's conversation, from the cache when a previous turn left it there."""
+        cache_key = (model.__tablename__, session_id)
+        cached = self.conversation_cache.get(cache_key)
+        if cached is not None:
+            try:
+                # Attach the last committed state without re-selecting the row
+                return await db.merge(cached, load=False)
+            except InvalidRequestError:
+                # Not mergeable without a load (e.g. it carries unsaved
+                # changes); forget it and read the row instead
+                self.conversation_cache.invalidate(cache_key)
+
+        result = await db.execute(
+            _CONVERSATION_BY_SESSION[model], {"session_id": session_id}
+        )
+        return result.scalar_one_or_none()
+
+    def _cache_conversation(
+        self,
+        db: AsyncSession,
+        model: Type[Union[GeneralConversation, PropertyConversation]],
+        conversation: Union[GeneralConversation, PropertyConversation],
+    ) -> None:
+        """Remember a conversation for the session's next turn; call after commit.
+
+        Only a row still held by the session, with no changes beyond what
+        was committed, is cached; anything else is dropped from the cache.
+        """
+        cache_key = (model.__tablename__, conversation.session_id)
+        if conversation in db and not db.is_modified(conversation):
+            self.conversation_cache.set(cache_key, conversation)
+        else:
+            self.conversation_cache.invalidate(cache_key)
+
+    async def _insert_conversation(
+        self,
+        db: AsyncSession,
+        model: Type[Union[GeneralConversation, PropertyConversation]],
+        **values,
+    ) -> Union[GeneralConversation, PropertyConversation]:
+        """
+        Create a conversation with INSERT ... ON CONFLICT DO NOTHING RETURNING,
+        so concurrent first messages for the same session can't both insert.
+        """
+        result = await db.execute(
+            pg_insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[model.session_id])
+            .returning(model)
+        )
+        conversation = result.scalar_one_or_none()
+        if conversation is None:
+            # Another request created this session between our lookup and insert
+            result = await db.execute(
+                _CONVERSATION_BY_SESSION[model], {"session_id": values["session_id"]}
+            )
+            conversation = result.scalar_one()
+        return conversation
+
+    async def _get_conversation_history(
+        self,
+        db: AsyncSession,
+        message_model: Type[Union[GeneralMessage, PropertyMessage]],
+        conversation_id: int,
+    ) -> List[Dict[str, str]]:
+        """
+        Fetch the most recent messages of a conversation, oldest first.
+        Served from the in-memory window when cached, otherwise read from
+        the database and used to seed the window.
+        """
+        cache_key = (message_model.__tablename__, conversation_id)
+        cached = self.history_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = await db.execute(
+            _RECENT_MESSAGES[message_model],
+            {"conversation_id": conversation_id, "window": self.history_cache.window},
+        )
+        history = [
+            {"role": role, "content": content}
+            for role, content in reversed(result.all())
+        ]
+        self.history_cache.set(cache_key, history)
+        return history
+
     async def _update_conversation_context(
         self,
         conversation: GeneralConversation,
@@ -348,5 +678,7 @@ class ChatController:
         pass
 
 
-# Initialize controller
-chat_controller = ChatController()
+@lru_cache(maxsize=1)
+def get_chat_controller() -> ChatController:
+    """Dependency returning the process-wide controller, built on first use."""
+    return ChatController()
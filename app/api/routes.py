@@ -1,20 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, Cookie
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.database import get_db
+import asyncio
+import base64
+import hashlib
+import orjson
+from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Response, Cookie
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import and_, bindparam, delete, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from typing import AsyncIterator, Optional, Tuple
+from app.database import AsyncSessionLocal, get_async_db
 from app.database.schemas import (
     GeneralChatResponse,
     PropertyChatResponse,
 )
 from app.database.models import (
     GeneralConversation as GeneralConversationModel,
+    GeneralMessage as GeneralMessageModel,
     PropertyConversation as PropertyConversationModel,
+    PropertyMessage as PropertyMessageModel,
     ExternalReference,
     PropertyQuestion,
 )
-from .controllers import chat_controller
-from pydantic import BaseModel
-import uuid
+from .controllers import ChatController, get_chat_controller
+from app.modules.context_manager import (
+    conversation_cache,
+    conversation_list_cache,
+    history_page_cache,
+)
+from pydantic import BaseModel, ConfigDict, StrictStr
+from app.utils.helpers import new_session_id
 from enum import Enum
 
 
@@ -23,195 +38,432 @@ class Role(str, Enum):
     SELLER = "seller"
 
 
+# Counterpart conversations are listed under the other side's role
+_OPPOSITE_ROLE = {Role.BUYER: Role.SELLER.value, Role.SELLER: Role.BUYER.value}
+
+
 class ConversationStatus(str, Enum):
     ACTIVE = "active"
     PENDING = "pending"
     CLOSED = "closed"
 
 
+class QuestionStatus(str, Enum):
+    PENDING = "pending"
+    ANSWERED = "answered"
+    EXPIRED = "expired"
+
+
+# Request bodies are read-only and reject unknown fields, so validation
+# never falls back to coercion or carries extras along
+_REQUEST_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+
 class GeneralChatRequest(BaseModel):
-    message: str
-    user_id: Optional[str] = None  # UUID string for Firebase user ID
-    session_id: Optional[str] = None
+    model_config = _REQUEST_CONFIG
+
+    message: StrictStr
+    user_id: Optional[StrictStr] = None  # UUID string for Firebase user ID
+    session_id: Optional[StrictStr] = None
 
 
 class PropertyChatRequest(BaseModel):
-    message: str
-    user_id: str
-    property_id: str
+    model_config = _REQUEST_CONFIG
+
+    message: StrictStr
+    user_id: StrictStr
+    property_id: StrictStr
     role: Role
-    counterpart_id: str
-    session_id: Optional[str] = None
+    counterpart_id: StrictStr
+    session_id: Optional[StrictStr] = None
 
 
 class ConversationStatusUpdate(BaseModel):
+    model_config = _REQUEST_CONFIG
+
     status: ConversationStatus
 
 
 class PropertyQuestionResponse(BaseModel):
     """Schema for responding to a property question."""
+    model_config = _REQUEST_CONFIG
+
     question_id: int
-    answer: str
+    answer: StrictStr
 
 
 router = APIRouter()
 
+# Statements for the hot read paths, built once and bound per request
+_LATEST_MESSAGES = {
+    model: (
+        select(model.id, model.role, model.content, model.timestamp, model.intent)
+        .where(model.conversation_id == bindparam("conversation_id"))
+        .order_by(model.id.desc())
+        .limit(bindparam("limit"))
+    )
+    for model in (GeneralMessageModel, PropertyMessageModel)
+}
+_MESSAGES_BEFORE = {
+    model: statement.where(model.id < bindparam("before_id"))
+    for model, statement in _LATEST_MESSAGES.items()
+}
+# Only the columns the seller's list returns, as plain rows rather than entities
+_SELLER_QUESTIONS = (
+    select(
+        PropertyQuestion.id,
+        PropertyQuestion.property_id,
+        PropertyQuestion.buyer_id,
+        PropertyQuestion.question_text,
+        PropertyQuestion.status,
+        PropertyQuestion.created_at,
+        PropertyQuestion.answered_at,
+        PropertyQuestion.answer_text,
+    )
+    .where(PropertyQuestion.seller_id == bindparam("seller_id"))
+    .order_by(PropertyQuestion.created_at.desc())
+)
+_SELLER_QUESTIONS_BY_STATUS = _SELLER_QUESTIONS.where(PropertyQuestion.status == bindparam("status"))
+
+
+def _set_session_cookie(response: Response, session_id: str) -> None:
+    """Persist an anonymous user's session ID in a cookie."""
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        max_age=86400,  # 24 hours in seconds
+        httponly=True,   # Cookie not accessible via JavaScript
+        samesite="lax",  # Protects against CSRF
+        secure=True     # Only sent over HTTPS
+    )
+
+
+def _encode_cursor(conversation) -> str:
+    """Encode a conversation's position in a most-recent-first listing."""
+    position = f"{conversation.last_message_at.isoformat()}|{conversation.id}"
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor from _encode_cursor, rejecting anything malformed."""
+    try:
+        last_message_at, conversation_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(last_message_at), int(conversation_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _paginate(statement, model, limit: int, after: Optional[Tuple[datetime, int]]):
+    """Return one page of a conversation query, most recent first, its total and the next cursor.
+
+    Pages are keyed on (last_message_at, id) so each one is an index seek
+    past the previous page's last row rather than an OFFSET scan. Each call
+    uses its own session, so several listings can be fetched concurrently.
+    """
+    async with AsyncSessionLocal() as db:
+        total = await db.scalar(statement.with_only_columns(func.count(model.id)))
+        if after:
+            statement = statement.where(tuple_(model.last_message_at, model.id) < after)
+        # One extra row tells us whether there is another page
+        result = await db.execute(
+            statement.order_by(model.last_message_at.desc(), model.id.desc()).limit(limit + 1)
+        )
+        rows = result.all()
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], total, next_cursor
+
+
+async def _history_page(
+    db: AsyncSession, model, conversation_id: int, limit: int, before_id: Optional[int]
+):
+    """Return up to limit messages older than before_id, oldest first, and the next before_id.
+
+    Queries the message table directly so the conversation's unbounded
+    messages relationship is never loaded.
+    """
+    # One extra row tells us whether there is an older page
+    params = {"conversation_id": conversation_id, "limit": limit + 1}
+    if before_id is None:
+        result = await db.execute(_LATEST_MESSAGES[model], params)
+    else:
+        result = await db.execute(_MESSAGES_BEFORE[model], {**params, "before_id": before_id})
+    rows = result.all()
+    page = rows[:limit]
+    next_before_id = page[-1].id if len(rows) > limit else None
+    messages = [
+        {
+            "id": message.id,
+            "role": message.role,
+            "content": message.content,
+            "timestamp": message.timestamp,
+            "intent": message.intent,
+        }
+        for message in reversed(page)
+    ]
+    return messages, next_before_id
+
+
+async def _history_response(
+    db: AsyncSession,
+    conversation_model,
+    message_model,
+    conversation_id: int,
+    limit: int,
+    before_id: Optional[int],
+    fields: Tuple[str, ...],
+    context_field: str,
+    if_none_match: Optional[str],
+) -> Response:
+    """Build (or serve from cache) one history page for either conversation type.
+
+    The body carries the conversation's own fields, the page of messages,
+    the cursor to older ones and the conversation's context column. A
+    client that already holds the current page gets an empty 304, straight
+    from the cache when the page is in it.
+    """
+    cache_key = (message_model.__tablename__, conversation_id)
+    cached = history_page_cache.get(cache_key, (limit, before_id))
+    if cached is not None:
+        return _history_page_response(*cached, if_none_match)
+
+    # Messages come from _history_page; any relationship access here is a bug
+    conversation = await db.get(conversation_model, conversation_id, options=[raiseload("*")])
+
+    if not conversation:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    messages, next_before_id = await _history_page(
+        db, message_model, conversation_id, limit, before_id
+    )
+
+    body = orjson.dumps({
+        "conversation_id": conversation_id,
+        **{field: getattr(conversation, field) for field in fields},
+        "messages": messages,
+        "next_before_id": next_before_id,
+        context_field: getattr(conversation, context_field),
+    })
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    history_page_cache.set(cache_key, (limit, before_id), body, etag)
+    return _history_page_response(body, etag, if_none_match)
+
+
+def _history_page_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """Answer with the page, or with 304 if the client's copy is current."""
+    if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def _stream_history(model, conversation_id: int) -> AsyncIterator[bytes]:
+    """Stream a conversation's full message history as a JSON document, oldest first.
+
+    Rows come from a server-side cursor in batches, so memory stays flat
+    however long the conversation is. Runs on its own session because the
+    request's session is closed before a streamed body is sent.
+    """
+    yield b'{"conversation_id":' + orjson.dumps(conversation_id) + b',"messages":['
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            select(model.id, model.role, model.content, model.timestamp, model.intent)
+            .where(model.conversation_id == conversation_id)
+            .order_by(model.id)
+            .execution_options(yield_per=500)
+        )
+        separator = b""
+        async for message in result:
+            yield separator + orjson.dumps({
+                "id": message.id,
+                "role": message.role,
+                "content": message.content,
+                "timestamp": message.timestamp,
+                "intent": message.intent,
+            })
+            separator = b","
+    yield b"]}"
+
 
 @router.post("/chat/general", response_model=GeneralChatResponse)
 async def general_chat_endpoint(
     request: GeneralChatRequest,
     response: Response,
     session_id: Optional[str] = Cookie(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    chat_controller: ChatController = Depends(get_chat_controller),
 ):
     """
     Handle general chat messages and return AI responses.
     This endpoint handles both logged-in and anonymous users.
     """
-    try:
-        # Use existing session ID from cookie if available, otherwise generate new one
-        current_session_id = session_id or request.session_id or str(uuid.uuid4())
-
-        # Set cookie for anonymous users
-        if not request.user_id:
-            response.set_cookie(
-                key="session_id",
-                value=current_session_id,
-                max_age=86400,  # 24 hours in seconds
-                httponly=True,   # Cookie not accessible via JavaScript
-                samesite="lax",  # Protects against CSRF
-                secure=True     # Only sent over HTTPS
-            )
-
-        chat_response = await chat_controller.handle_general_chat(
-            message=request.message,
-            user_id=request.user_id,
-            session_id=current_session_id,
-            db=db,
-        )
-        return chat_response
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Use existing session ID from cookie if available, otherwise generate new one
+    current_session_id = session_id or request.session_id or new_session_id()
+
+    # Set cookie for anonymous users
+    if not request.user_id:
+        _set_session_cookie(response, current_session_id)
+
+    chat_response = await chat_controller.handle_general_chat(
+        message=request.message,
+        user_id=request.user_id,
+        session_id=current_session_id,
+        db=db,
+    )
+    return chat_response
+
+
+@router.post("/chat/general/stream")
+async def general_chat_stream_endpoint(
+    request: GeneralChatRequest,
+    session_id: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_async_db),
+    chat_controller: ChatController = Depends(get_chat_controller),
+):
+    """
+    Handle general chat messages, streaming the AI response as server-sent
+    events so the client can render it while it is being generated.
+    """
+    current_session_id = session_id or request.session_id or new_session_id()
+
+    events = await chat_controller.handle_general_chat_stream(
+        message=request.message,
+        user_id=request.user_id,
+        session_id=current_session_id,
+        db=db,
+    )
+    response = StreamingResponse(events, media_type="text/event-stream")
+
+    # Set cookie for anonymous users
+    if not request.user_id:
+        _set_session_cookie(response, current_session_id)
+    return response
 
 
 @router.post("/chat/property", response_model=PropertyChatResponse)
 async def property_chat_endpoint(
-    request: PropertyChatRequest, db: Session = Depends(get_db)
+    request: PropertyChatRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    chat_controller: ChatController = Depends(get_chat_controller),
 ):
     """
     Handle property-specific chat messages between buyers and sellers.
     This endpoint requires user authentication and handles bidirectional communication.
     """
-    try:
-        # Generate session ID if not provided
-        session_id = request.session_id or str(uuid.uuid4())
-
-        # Start a single database transaction for the entire request
-        db.begin()
-        try:
-            response = await chat_controller.handle_property_chat(
-                message=request.message,
-                user_id=request.user_id,
-                property_id=request.property_id,
-                role=request.role,
-                counterpart_id=request.counterpart_id,
-                session_id=session_id,
-                db=db,
-            )
-            db.commit()
-            return response
-        except Exception as e:
-            db.rollback()
-            raise e
-    except Exception as e:
-        if not isinstance(e, HTTPException):
-            raise HTTPException(status_code=500, detail=str(e))
-        raise e
+    # Generate session ID if not provided
+    session_id = request.session_id or new_session_id()
+
+    # The controller runs the entire turn in a single database transaction
+    return await chat_controller.handle_property_chat(
+        message=request.message,
+        user_id=request.user_id,
+        property_id=request.property_id,
+        role=request.role,
+        counterpart_id=request.counterpart_id,
+        session_id=session_id,
+        db=db,
+        background_tasks=background_tasks,
+    )
 
 
 @router.get("/conversations/general/{conversation_id}/history")
 async def get_general_conversation_history(
-    conversation_id: int, db: Session = Depends(get_db)
+    conversation_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get the message history for a specific general conversation."""
-    conversation = (
-        db.query(GeneralConversationModel)
-        .filter(GeneralConversationModel.id == conversation_id)
-        .first()
-    )
+    """Get a page of the message history for a specific general conversation.
 
-    if not conversation:
-        raise HTTPException(status_code=404, detail="Conversation not found")
-
-    return {
-        "conversation_id": conversation_id,
-        "session_id": conversation.session_id,
-        "messages": [
-            {
-                "role": message.role,
-                "content": message.content,
-                "timestamp": message.timestamp,
-                "intent": message.intent,
-            }
-            for message in conversation.messages
-        ],
-        "context": conversation.context,
-    }
+    Returns the most recent messages; pass next_before_id back as before_id
+    to fetch older ones.
+    """
+    return await _history_response(
+        db, GeneralConversationModel, GeneralMessageModel, conversation_id, limit, before_id,
+        fields=("session_id",), context_field="context", if_none_match=if_none_match,
+    )
 
 
 @router.get("/conversations/property/{conversation_id}/history")
 async def get_property_conversation_history(
-    conversation_id: int, db: Session = Depends(get_db)
+    conversation_id: int,
+    limit: int = Query(50, ge=1, le=200),
+    before_id: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """Get the message history for a specific property conversation."""
-    conversation = (
-        db.query(PropertyConversationModel)
-        .filter(PropertyConversationModel.id == conversation_id)
-        .first()
+    """Get a page of the message history for a specific property conversation.
+
+    Returns the most recent messages; pass next_before_id back as before_id
+    to fetch older ones.
+    """
+    return await _history_response(
+        db, PropertyConversationModel, PropertyMessageModel, conversation_id, limit, before_id,
+        fields=(
+            "session_id",
+            "property_id",
+            "user_id",
+            "role",
+            "counterpart_id",
+            "conversation_status",
+        ),
+        context_field="property_context",
+        if_none_match=if_none_match,
     )
 
-    if not conversation:
+
+@router.get("/conversations/general/{conversation_id}/export")
+async def export_general_conversation_history(
+    conversation_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    """Stream the complete message history of a general conversation."""
+    if await db.scalar(
+        select(GeneralConversationModel.id).where(GeneralConversationModel.id == conversation_id)
+    ) is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {
-        "conversation_id": conversation_id,
-        "session_id": conversation.session_id,
-        "property_id": conversation.property_id,
-        "user_id": conversation.user_id,
-        "role": conversation.role,
-        "counterpart_id": conversation.counterpart_id,
-        "conversation_status": conversation.conversation_status,
-        "messages": [
-            {
-                "role": message.role,
-                "content": message.content,
-                "timestamp": message.timestamp,
-                "intent": message.intent,
-            }
-            for message in conversation.messages
-        ],
-        "property_context": conversation.property_context,
-    }
+    return StreamingResponse(
+        _stream_history(GeneralMessageModel, conversation_id), media_type="application/json"
+    )
+
+
+@router.get("/conversations/property/{conversation_id}/export")
+async def export_property_conversation_history(
+    conversation_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    """Stream the complete message history of a property conversation."""
+    if await db.scalar(
+        select(PropertyConversationModel.id).where(PropertyConversationModel.id == conversation_id)
+    ) is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    return StreamingResponse(
+        _stream_history(PropertyMessageModel, conversation_id), media_type="application/json"
+    )
 
 
 @router.patch("/conversations/property/{conversation_id}/status")
 async def update_property_conversation_status(
     conversation_id: int,
     status_update: ConversationStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Update the status of a property conversation."""
-    conversation = (
-        db.query(PropertyConversationModel)
-        .filter(PropertyConversationModel.id == conversation_id)
-        .first()
-    )
+    conversation = await db.get(PropertyConversationModel, conversation_id)
 
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     conversation.conversation_status = status_update.status
-    db.commit()
+    await db.commit()
+    # The chat flow checks the status on its cached copy of the conversation
+    conversation_cache.invalidate((PropertyConversationModel.__tablename__, conversation.session_id))
+    # ...and the history endpoint serves it from cached pages
+    history_page_cache.invalidate((PropertyMessageModel.__tablename__, conversation.id))
+    # ...and listings filter on it
+    conversation_list_cache.invalidate(conversation.user_id, conversation.counterpart_id)
 
     return {"message": "Conversation status updated successfully"}
 
@@ -221,137 +473,137 @@ async def get_user_conversations(
     user_id: str,  # UUID string for Firebase user ID
     role: Optional[Role] = None,
     status: Optional[ConversationStatus] = None,
-    db: Session = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100),
+    general_cursor: Optional[str] = None,
+    property_cursor: Optional[str] = None,
 ):
     """
-    Get all conversations for a specific user.
+    Get a page of conversations for a specific user, most recent first.
     Optionally filter by role (buyer/seller) and conversation status.
+    Pass the next_*_cursor values from a response to fetch the following page.
     """
-    try:
-        # Get general conversations where user is directly involved
-        general_conversations = (
-            db.query(GeneralConversationModel)
-            .filter(GeneralConversationModel.user_id == user_id)
-            .all()
-        )
+    # Frontends poll this, so serve repeats from the cache until a chat writes
+    cache_query = (role, status, limit, general_cursor, property_cursor)
+    cached = conversation_list_cache.get(user_id, cache_query)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    general_after = _decode_cursor(general_cursor) if general_cursor else None
+    property_after = _decode_cursor(property_cursor) if property_cursor else None
+
+    # Get general conversations where user is directly involved
+    # Listings select only the columns they return; the context blobs
+    # are served by the history endpoints
+    general_query = select(
+        GeneralConversationModel.id,
+        GeneralConversationModel.session_id,
+        GeneralConversationModel.started_at,
+        GeneralConversationModel.last_message_at,
+    ).where(GeneralConversationModel.user_id == user_id)
+
+    # Property conversations where user is directly involved
+    direct = PropertyConversationModel.user_id == user_id
+    # ...and those where user is referenced as a counterpart
+    counterpart = PropertyConversationModel.id.in_(
+        select(ExternalReference.property_conversation_id)
+        .where(ExternalReference.external_id == user_id)
+        .where(ExternalReference.service_name == "seller_buyer_communication")
+    )
 
-        # Get property conversations where user is directly involved
-        property_query = db.query(PropertyConversationModel).filter(
-            PropertyConversationModel.user_id == user_id
+    if role:
+        # For counterpart conversations, we need to filter by the opposite role
+        opposite_role = _OPPOSITE_ROLE[role]
+        direct = and_(direct, PropertyConversationModel.role == role.value)
+        counterpart = and_(counterpart, PropertyConversationModel.role == opposite_role)
+
+    # One query over both, so a conversation matching both is listed once
+    property_query = select(
+        PropertyConversationModel.id,
+        PropertyConversationModel.session_id,
+        PropertyConversationModel.user_id,
+        PropertyConversationModel.property_id,
+        PropertyConversationModel.role,
+        PropertyConversationModel.counterpart_id,
+        PropertyConversationModel.conversation_status,
+        PropertyConversationModel.started_at,
+        PropertyConversationModel.last_message_at,
+    ).where(or_(direct, counterpart))
+    if status:
+        property_query = property_query.where(
+            PropertyConversationModel.conversation_status == status.value
         )
 
-        if role:
-            property_query = property_query.filter(PropertyConversationModel.role == role.value)
-        if status:
-            property_query = property_query.filter(
-                PropertyConversationModel.conversation_status == status.value
-            )
-
-        property_conversations = property_query.all()
-        
-        # Get property conversations where user is referenced as a counterpart
-        counterpart_query = (
-            db.query(PropertyConversationModel)
-            .join(
-                ExternalReference,
-                ExternalReference.property_conversation_id == PropertyConversationModel.id,
-                isouter=True
-            )
-            .filter(ExternalReference.external_id == user_id)
-            .filter(ExternalReference.service_name == "seller_buyer_communication")
-        )
-        
-        # Apply the same filters as for direct conversations
-        if role:
-            # For counterpart conversations, we need to filter by the opposite role
-            opposite_role = "seller" if role.value == "buyer" else "buyer"
-            counterpart_query = counterpart_query.filter(PropertyConversationModel.role == opposite_role)
-        if status:
-            counterpart_query = counterpart_query.filter(
-                PropertyConversationModel.conversation_status == status.value
-            )
-        
-        counterpart_conversations = counterpart_query.all()
-        
-        # Combine direct and counterpart property conversations, avoiding duplicates
-        seen_ids = {conv.id for conv in property_conversations}
-        for conv in counterpart_conversations:
-            if conv.id not in seen_ids:
-                property_conversations.append(conv)
-                seen_ids.add(conv.id)
-
-        return {
-            "general_conversations": [
-                {
-                    "id": conv.id,
-                    "session_id": conv.session_id,
-                    "started_at": conv.started_at,
-                    "last_message_at": conv.last_message_at,
-                    "context": conv.context,
-                }
-                for conv in general_conversations
-            ],
-            "property_conversations": [
-                {
-                    "id": conv.id,
-                    "session_id": conv.session_id,
-                    "property_id": conv.property_id,
-                    "role": conv.role,
-                    "counterpart_id": conv.counterpart_id,
-                    "conversation_status": conv.conversation_status,
-                    "started_at": conv.started_at,
-                    "last_message_at": conv.last_message_at,
-                    "property_context": conv.property_context,
-                    "is_counterpart": conv.user_id != user_id,  # Flag to indicate if user is the counterpart
-                }
-                for conv in property_conversations
-            ],
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving conversations: {str(e)}"
-        )
+    # The two listings are independent, so fetch them side by side
+    (
+        (general_conversations, total_general, next_general_cursor),
+        (property_conversations, total_property, next_property_cursor),
+    ) = await asyncio.gather(
+        _paginate(general_query, GeneralConversationModel, limit, general_after),
+        _paginate(property_query, PropertyConversationModel, limit, property_after),
+    )
+
+    # Hand orjson the rows' native values directly, skipping FastAPI's
+    # jsonable_encoder walk over every listed conversation
+    body = orjson.dumps({
+        "general_conversations": [
+            {
+                "id": conv.id,
+                "session_id": conv.session_id,
+                "started_at": conv.started_at,
+                "last_message_at": conv.last_message_at,
+            }
+            for conv in general_conversations
+        ],
+        "property_conversations": [
+            {
+                "id": conv.id,
+                "session_id": conv.session_id,
+                "property_id": conv.property_id,
+                "role": conv.role,
+                "counterpart_id": conv.counterpart_id,
+                "conversation_status": conv.conversation_status,
+                "started_at": conv.started_at,
+                "last_message_at": conv.last_message_at,
+                "is_counterpart": conv.user_id != user_id,  # Flag to indicate if user is the counterpart
+            }
+            for conv in property_conversations
+        ],
+        "total_general_conversations": total_general,
+        "total_property_conversations": total_property,
+        "next_general_cursor": next_general_cursor,
+        "next_property_cursor": next_property_cursor,
+        "has_more": bool(next_general_cursor or next_property_cursor),
+    })
+    conversation_list_cache.set(user_id, cache_query, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/seller/questions/{seller_id}")
 async def get_seller_questions(
     seller_id: str,
-    status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    status: Optional[QuestionStatus] = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Get all questions for a seller, optionally filtered by status.
     """
-    query = db.query(PropertyQuestion).filter(PropertyQuestion.seller_id == seller_id)
-    
     if status:
-        query = query.filter(PropertyQuestion.status == status)
-    
-    questions = query.order_by(PropertyQuestion.created_at.desc()).all()
-    
-    return {
-        "questions": [
-            {
-                "id": q.id,
-                "property_id": q.property_id,
-                "buyer_id": q.buyer_id,
-                "question_text": q.question_text,
-                "status": q.status,
-                "created_at": q.created_at,
-                "answered_at": q.answered_at,
-                "answer_text": q.answer_text,
-            }
-            for q in questions
-        ]
-    }
+        result = await db.execute(
+            _SELLER_QUESTIONS_BY_STATUS, {"seller_id": seller_id, "status": status}
+        )
+    else:
+        result = await db.execute(_SELLER_QUESTIONS, {"seller_id": seller_id})
+
+    # Each row's keys are exactly the response fields
+    return ORJSONResponse({"questions": [dict(row._mapping) for row in result.all()]})
 
 
 @router.post("/seller/questions/{question_id}/answer")
 async def answer_property_question(
     question_id: int,
     response: PropertyQuestionResponse,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    chat_controller: ChatController = Depends(get_chat_controller),
 ):
     """
     Handle a seller's response to a property question.
@@ -371,25 +623,14 @@ async def answer_property_question(
 @router.delete("/seller/questions/{seller_id}")
 async def delete_seller_questions(
     seller_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Delete all questions for a specific seller.
     """
-    try:
-        # Start a transaction
-        db.begin()
-        
-        # Delete all questions for this seller
-        questions = db.query(PropertyQuestion).filter(
-            PropertyQuestion.seller_id == seller_id
-        ).all()
-        
-        for question in questions:
-            db.delete(question)
-        
-        db.commit()
-        return {"status": "success", "message": f"Deleted all questions for seller {seller_id}"}
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+    # Delete all questions for this seller in one statement; the
+    # transaction rolls back on error
+    async with db.begin():
+        await db.execute(delete(PropertyQuestion).where(PropertyQuestion.seller_id == seller_id))
+
+    return {"status": "success", "message": f"Deleted all questions for seller {seller_id}"}
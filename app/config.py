@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from typing import Optional
 
@@ -12,7 +13,22 @@ class Settings(BaseSettings):
     azure_postgres_password: str = os.getenv("AZURE_POSTGRES_PASSWORD", "")
     azure_postgres_db: str = os.getenv("AZURE_POSTGRES_DB", "postgres")
     azure_postgres_port: str = os.getenv("AZURE_POSTGRES_PORT", "5432")
-    
+    auto_create_tables: bool = os.getenv("AUTO_CREATE_TABLES", "true").lower() == "true"  # Create missing tables on startup
+    db_query_cache_size: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))  # Compiled SQL kept per engine
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))  # Prepared statements per connection
+    db_insert_page_size: int = int(os.getenv("DB_INSERT_PAGE_SIZE", "1000"))  # Rows per multi-row INSERT
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "20"))  # Persistent async connections
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))  # Burst connections above the pool size
+    db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "5"))  # Seconds to wait for a connection before failing
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # Reconnect connections older than this
+    db_behind_pgbouncer: bool = os.getenv("DB_BEHIND_PGBOUNCER", "false").lower() == "true"  # Transaction-pooling proxy
+    chat_async_commit: bool = os.getenv("CHAT_ASYNC_COMMIT", "false").lower() == "true"  # Don't wait on fsync for chat turns
+
+    # Logging
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    sql_echo: bool = os.getenv("SQL_ECHO", "false").lower() == "true"  # Log every SQL statement
+    debug_endpoints: bool = os.getenv("DEBUG_ENDPOINTS", "false").lower() == "true"  # Expose /debug/* diagnostics
+
     # Security
     secret_key: str = "your-secret-key"
     service_secret_key: str = "dev-secret-key"
@@ -34,6 +50,8 @@ class Settings(BaseSettings):
     # Cache Settings
     cache_ttl: int = 3600  # 1 hour
     max_cache_items: int = 1000
+    history_window: int = 5  # Recent messages passed to the LLM as context
+    listing_cache_ttl: int = int(os.getenv("LISTING_CACHE_TTL", "30"))  # Seconds a conversation listing is reused
 
     # Rate Limiting
     osm_rate_limit: int = 2  # requests per second
@@ -49,15 +67,21 @@ class Settings(BaseSettings):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        # Debug: Print API keys (masked)
-        if self.google_api_key:
+        # Debug: Print API keys (masked), only when asked for
+        if os.getenv("DEBUG_CONFIG") and self.google_api_key:
             masked_key = f"{self.google_api_key[:4]}...{self.google_api_key[-4:]}"
             print(f"Debug: Loaded Google API key from env: {masked_key}")
 
     class Config:
         env_file = ".env"
         case_sensitive = False
-        extra = "allow"  # Allow extra fields
+        extra = "ignore"  # Skip env entries that aren't settings
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide settings, read from the environment once."""
+    return Settings()
 
 
-settings = Settings() 
\ No newline at end of file
+settings = get_settings() 
\ No newline at end of file
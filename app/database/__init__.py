@@ -1,5 +1,8 @@
 # app/database/__init__.py
-from .db_connection import engine, SessionLocal, Base, get_db
+from .db_connection import (
+    engine, SessionLocal, Base, get_db,
+    async_engine, AsyncSessionLocal, get_async_db, get_pool_stats
+)
 from .models import (
     GeneralConversation as GeneralConversationModel,
     PropertyConversation as PropertyConversationModel,
@@ -21,6 +24,10 @@ __all__ = [
     "SessionLocal",
     "Base",
     "get_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
+    "get_pool_stats",
     "GeneralConversationModel",
     "PropertyConversationModel",
     "GeneralMessageModel",
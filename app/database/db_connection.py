@@ -1,13 +1,18 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
 import logging
-import json
+import uuid
+import orjson
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger('sqlalchemy.engine')
+# Root logging is configured by the app entrypoint, not as an import side effect
+logger = logging.getLogger(__name__)
+# SQLAlchemy logs every statement whenever its logger is enabled for INFO,
+# which the root level may otherwise allow; SQL_ECHO turns it back on
+logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 
 def get_connection_url():
     """Constructs a secure connection URL for Azure PostgreSQL."""
@@ -30,30 +35,96 @@ def get_connection_url():
     )
 
 
+def get_async_connection_url():
+    """Constructs the asyncpg connection URL used by the async engine."""
+    return get_connection_url().replace("postgresql://", "postgresql+asyncpg://", 1)
+
+
+def get_async_connect_args():
+    """asyncpg connection arguments for the async engine."""
+    if settings.db_behind_pgbouncer:
+        # PgBouncer in transaction mode hands each transaction a different server
+        # connection, so statements can't be cached and names must not collide
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    # Prepare each statement once per connection so Postgres plans it once too
+    return {"prepared_statement_cache_size": settings.db_statement_cache_size}
+
+
+def _orjson_dumps(value) -> str:
+    """Serialize JSON column values with orjson; the dialects expect str."""
+    return orjson.dumps(value).decode()
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     get_connection_url(),
-    echo=True,  # Enable SQL query logging for debugging
+    echo=settings.sql_echo,  # Set SQL_ECHO=true to log queries for debugging
     pool_pre_ping=True,  # Helps in detecting stale connections
     pool_size=10,  # Adjust based on workload
-    max_overflow=20  # Allow extra connections if needed
+    max_overflow=20,  # Allow extra connections if needed
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    json_serializer=_orjson_dumps,
+    json_deserializer=orjson.loads,
+    # Multi-row INSERT ... VALUES for inserts, execute_batch for other executemany
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=settings.db_insert_page_size,
 )
 
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create async SQLAlchemy engine for request handlers so DB I/O doesn't block the event loop.
+# The pool is named explicitly: the sync QueuePool must never back an asyncpg engine.
+async_engine = create_async_engine(
+    get_async_connection_url(),
+    poolclass=AsyncAdaptedQueuePool,
+    echo=settings.sql_echo,  # Set SQL_ECHO=true to log queries for debugging
+    pool_pre_ping=True,  # Helps in detecting stale connections
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    # Reuse the most recently returned connection, so quiet periods let the
+    # surplus idle out and be recycled instead of every connection going stale
+    pool_use_lifo=True,
+    # Fail fast when the pool is exhausted instead of queueing for 30 seconds
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    json_serializer=_orjson_dumps,
+    json_deserializer=orjson.loads,
+    query_cache_size=settings.db_query_cache_size,  # Compile each query shape once
+    # Rows flushed together go out as one multi-row INSERT per page
+    insertmanyvalues_page_size=settings.db_insert_page_size,
+    connect_args=get_async_connect_args(),
+)
 
-# Create Base class for ORM models
-Base = declarative_base()
 
-# Helper functions for JSON handling
-def json_to_str(value):
-    """Convert Python dict to JSON string for PostgreSQL storage."""
-    return json.dumps(value) if value is not None else None
+def get_pool_stats():
+    """Snapshot of the async engine's connection pool."""
+    pool = async_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.db_max_overflow,
+        "status": pool.status(),
+    }
+
 
-def str_to_json(value):
-    """Convert JSON string from PostgreSQL to Python dict."""
-    return json.loads(value) if value and isinstance(value, str) else value
+# Create SessionLocal class; like AsyncSessionLocal, objects stay loaded
+# after commit instead of being re-selected on next access
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Create AsyncSessionLocal class; objects stay loaded after commit so handlers
+# can build responses without triggering implicit (unsupported) async refreshes
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+# Create Base class for ORM models
+Base = declarative_base()
 
 def get_db():
     """Dependency to get DB session."""
@@ -62,3 +133,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """Dependency to get an async DB session."""
+    async with AsyncSessionLocal() as db:
+        yield db
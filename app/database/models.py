@@ -1,20 +1,79 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Text, JSON
+from sqlalchemy import (
+    Boolean, CheckConstraint, Column, DateTime, ForeignKey, Index, Integer, JSON,
+    SmallInteger, String, Text, text,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.types import TypeDecorator
-from . import Base
-from .db_connection import json_to_str, str_to_json
+from .db_connection import Base
 
-# Custom JSON Type for SQL Server
-class JSONString(TypeDecorator):
-    impl = String
+# JSON documents are stored as binary JSONB on PostgreSQL; other dialects
+# (the SQLite test database) keep their generic JSON type
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utc_now(FunctionElement):
+    """The current time as naive UTC, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _compile_utc_now(element, compiler, **kw):
+    # SQLite (the test database) keeps CURRENT_TIMESTAMP in UTC already
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _compile_utc_now_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+# Insert timestamps are filled in by the database as naive UTC, matching the
+# datetime.utcnow() values the application writes and compares against.
+# Updates keep a Python-side onupdate so the new value is known without a
+# re-select, which an AsyncSession can't do implicitly
+UTC_NOW = utc_now()
+
+class CodedString(TypeDecorator):
+    """One of a fixed set of strings, stored as its smallint code.
+
+    Codes are positions in values, starting at 1, so new values may only
+    be appended. Python code keeps reading and writing the strings.
+    """
+    impl = SmallInteger
     cache_ok = True
 
+    def __init__(self, values):
+        super().__init__()
+        self.values = tuple(values)
+        self._codes = {value: code for code, value in enumerate(self.values, start=1)}
+
+    def _code(self, value):
+        # Accepts str enums such as the API's Role and ConversationStatus
+        value = getattr(value, "value", value)
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not one of {', '.join(self.values)}") from None
+
     def process_bind_param(self, value, dialect):
-        return json_to_str(value)
+        return None if value is None else self._code(value)
+
+    def process_literal_param(self, value, dialect):
+        return str(self._code(value))
 
     def process_result_value(self, value, dialect):
-        return str_to_json(value)
+        return None if value is None else self.values[value - 1]
+
+    @property
+    def python_type(self):
+        return str
 
 # Removed Property, AvailabilitySlot, and Inquiry models as they are not used
 
@@ -23,52 +82,106 @@ class GeneralConversation(Base):
     __tablename__ = "general_conversations"
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String(255), unique=True, index=True)
+    session_id = Column(String(255), unique=True, index=True, nullable=False)  # Unique index backs per-turn lookups
     user_id = Column(String(255), nullable=True, index=True)  # UUID string for Firebase user ID
     is_logged_in = Column(Boolean, default=False)
-    started_at = Column(DateTime, default=datetime.utcnow)
-    last_message_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    context = Column(JSON)  # PostgreSQL native JSON type
+    started_at = Column(DateTime, server_default=UTC_NOW)
+    last_message_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow)
+    # Never NULL, and tracked in place so item updates mark the row dirty
+    context = Column(MutableDict.as_mutable(JSONDocument), nullable=False, default=dict, server_default=text("'{}'"))
+
+    # Relationship to messages; never loaded whole, only queried through
+    # messages.select(), and deleted with the conversation by the database
+    messages = relationship(
+        "GeneralMessage",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        lazy="write_only",
+        passive_deletes=True,
+        order_by="GeneralMessage.timestamp.desc()",
+    )
 
-    # Relationship to messages
-    messages = relationship("GeneralMessage", back_populates="conversation", cascade="all, delete-orphan")
+    # Backs keyset pagination of a user's conversations, most recent first
+    __table_args__ = (
+        Index(
+            "ix_general_conversations_user_id_last_message_at",
+            user_id, last_message_at.desc(), id.desc(),
+        ),
+    )
 
 class GeneralMessage(Base):
     """Messages within general conversations."""
     __tablename__ = "general_messages"
 
     id = Column(Integer, primary_key=True, index=True)
-    conversation_id = Column(Integer, ForeignKey("general_conversations.id"), index=True)
-    role = Column(String(50))  # 'user', 'assistant', or 'system'
+    conversation_id = Column(
+        Integer, ForeignKey("general_conversations.id", ondelete="CASCADE")
+    )  # Indexed by the composites below
+    role = Column(CodedString(("user", "assistant", "system")))
     content = Column(Text)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, server_default=UTC_NOW)
     intent = Column(String(50), nullable=True)  # Store classified intent
-    message_metadata = Column(JSON, nullable=True)  # PostgreSQL native JSON type
+    message_metadata = Column(JSONDocument, nullable=True)
 
     # Relationship to conversation
     conversation = relationship("GeneralConversation", back_populates="messages")
 
+    # Backs the "most recent N messages for a conversation" history lookup
+    __table_args__ = (
+        Index("ix_general_messages_conversation_id_timestamp", conversation_id, timestamp.desc()),
+        # Backs the history endpoint's pages, which walk back by message id
+        Index("ix_general_messages_conversation_id_id", conversation_id, id),
+    )
+
 class PropertyConversation(Base):
     """Tracks property-specific conversations between users and the chatbot."""
     __tablename__ = "property_conversations"
 
     id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(String(255), unique=True, index=True)
+    session_id = Column(String(255), unique=True, index=True, nullable=False)  # Unique index backs per-turn lookups
     user_id = Column(String(255), nullable=False, index=True)  # UUID string for Firebase user ID
     property_id = Column(String(255), nullable=False, index=True)  # Property being discussed
-    role = Column(String(50), nullable=False, index=True)  # 'buyer' or 'seller'
+    role = Column(CodedString(("buyer", "seller")), nullable=False, index=True)
     counterpart_id = Column(String(255), nullable=False, index=True)  # UUID string for the other party
-    conversation_status = Column(String(50), nullable=False, default="active")  # e.g., 'active', 'closed', 'pending'
-    started_at = Column(DateTime, default=datetime.utcnow)
-    last_message_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    property_context = Column(JSON)  # Store property-specific context
+    conversation_status = Column(
+        CodedString(("active", "pending", "closed")), nullable=False, default="active"
+    )
+    started_at = Column(DateTime, server_default=UTC_NOW)
+    last_message_at = Column(DateTime, server_default=UTC_NOW, onupdate=datetime.utcnow)
+    # Store property-specific context; never NULL, and tracked in place like context
+    property_context = Column(
+        MutableDict.as_mutable(JSONDocument), nullable=False, default=dict, server_default=text("'{}'")
+    )
 
-    # Relationship to messages
-    messages = relationship("PropertyMessage", back_populates="conversation", cascade="all, delete-orphan")
+    # Relationship to messages, write-only like GeneralConversation.messages
+    messages = relationship(
+        "PropertyMessage",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        lazy="write_only",
+        passive_deletes=True,
+        order_by="PropertyMessage.timestamp.desc()",
+    )
 
     # Add this to the PropertyConversation class relationships
     questions = relationship("PropertyQuestion", back_populates="conversation", cascade="all, delete-orphan")
 
+    # Backs keyset pagination of a user's conversations, most recent first
+    __table_args__ = (
+        Index(
+            "ix_property_conversations_user_id_last_message_at",
+            user_id, last_message_at.desc(), id.desc(),
+        ),
+        # Smaller index for listings filtered to open (active/pending) conversations
+        Index(
+            "ix_property_conversations_user_id_last_message_at_open",
+            user_id, last_message_at.desc(), id.desc(),
+            postgresql_where=conversation_status != "closed",
+        ),
+        # Backs listings filtered by role and status
+        Index("ix_property_conversations_user_id_role_status", user_id, role, conversation_status),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Validate role
@@ -80,32 +193,64 @@ class PropertyMessage(Base):
     __tablename__ = "property_messages"
 
     id = Column(Integer, primary_key=True, index=True)
-    conversation_id = Column(Integer, ForeignKey("property_conversations.id"), index=True)
-    role = Column(String(50))  # 'user', 'assistant', or 'system'
+    conversation_id = Column(
+        Integer, ForeignKey("property_conversations.id", ondelete="CASCADE")
+    )  # Indexed by the composites below
+    role = Column(CodedString(("user", "assistant", "system", "buyer", "seller")))  # buyer/seller for user turns
     content = Column(Text)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, server_default=UTC_NOW)
     intent = Column(String(50), nullable=True)  # Store classified intent
-    message_metadata = Column(JSON, nullable=True)  # PostgreSQL native JSON type
+    message_metadata = Column(JSONDocument, nullable=True)
 
     # Relationship to conversation
     conversation = relationship("PropertyConversation", back_populates="messages")
 
+    # Backs the "most recent N messages for a conversation" history lookup
+    __table_args__ = (
+        Index("ix_property_messages_conversation_id_timestamp", conversation_id, timestamp.desc()),
+        # Backs the history endpoint's pages, which walk back by message id
+        Index("ix_property_messages_conversation_id_id", conversation_id, id),
+    )
+
 class ExternalReference(Base):
     """Tracks references to external service data."""
     __tablename__ = "external_references"
 
     id = Column(Integer, primary_key=True, index=True)
-    general_conversation_id = Column(Integer, ForeignKey("general_conversations.id"), nullable=True, index=True)
-    property_conversation_id = Column(Integer, ForeignKey("property_conversations.id"), nullable=True, index=True)
+    # Each row sets at most one of these, so each is indexed only where set
+    general_conversation_id = Column(Integer, ForeignKey("general_conversations.id"), nullable=True)
+    property_conversation_id = Column(Integer, ForeignKey("property_conversations.id"), nullable=True)
     service_name = Column(String(100))  # e.g., 'property_service', 'availability_service'
     external_id = Column(String(255))   # ID in the external service
-    reference_metadata = Column(JSON, nullable=True)  # PostgreSQL native JSON type
-    last_synced = Column(DateTime, default=datetime.utcnow)
+    reference_metadata = Column(JSONDocument, nullable=True)
+    last_synced = Column(DateTime, server_default=UTC_NOW)
 
     # Relationships to conversations
     general_conversation = relationship("GeneralConversation")
     property_conversation = relationship("PropertyConversation")
 
+    __table_args__ = (
+        # Backs the lookup of conversations a user is the counterpart in
+        Index(
+            "ix_external_references_external_id_service_name_conversation",
+            external_id, service_name, property_conversation_id,
+        ),
+        Index(
+            "ix_external_references_general_conversation_id",
+            general_conversation_id,
+            postgresql_where=general_conversation_id.isnot(None),
+        ),
+        Index(
+            "ix_external_references_property_conversation_id",
+            property_conversation_id,
+            postgresql_where=property_conversation_id.isnot(None),
+        ),
+        CheckConstraint(
+            "general_conversation_id IS NULL OR property_conversation_id IS NULL",
+            name="ck_external_references_one_conversation",
+        ),
+    )
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Ensure only one conversation type is set
@@ -123,11 +268,21 @@ class PropertyQuestion(Base):
     conversation_id = Column(Integer, ForeignKey('property_conversations.id'), nullable=False)
     question_message_id = Column(Integer, ForeignKey('property_messages.id'), nullable=False)
     question_text = Column(Text, nullable=False)
-    status = Column(String(50), nullable=False, default="pending")  # pending, answered, expired
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(CodedString(("pending", "answered", "expired")), nullable=False, default="pending")
+    created_at = Column(DateTime, server_default=UTC_NOW)
     answered_at = Column(DateTime, nullable=True)
     answer_text = Column(Text, nullable=True)
     
     # Relationships
     conversation = relationship("PropertyConversation", back_populates="questions")
-    question_message = relationship("PropertyMessage", foreign_keys=[question_message_id]) 
\ No newline at end of file
+    question_message = relationship("PropertyMessage", foreign_keys=[question_message_id])
+
+    # Backs a seller's question list, newest first
+    __table_args__ = (
+        Index("ix_property_questions_seller_id_created_at", seller_id, created_at.desc()),
+        # ...and the same list filtered by status
+        Index(
+            "ix_property_questions_seller_id_status_created_at",
+            seller_id, status, created_at.desc(),
+        ),
+    ) 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pydantic import model_validator
@@ -19,8 +19,7 @@ class Property(PropertyBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Availability Slot Schemas
 class AvailabilitySlotBase(BaseModel):
@@ -35,8 +34,7 @@ class AvailabilitySlot(AvailabilitySlotBase):
     id: int
     property_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Inquiry Schemas
 class InquiryBase(BaseModel):
@@ -53,8 +51,7 @@ class Inquiry(InquiryBase):
     created_at: datetime
     status: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # General Conversation Schemas
 class GeneralMessageBase(BaseModel):
@@ -71,8 +68,7 @@ class GeneralMessage(GeneralMessageBase):
     conversation_id: int
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class GeneralConversationBase(BaseModel):
     session_id: str
@@ -89,8 +85,7 @@ class GeneralConversation(GeneralConversationBase):
     last_message_at: datetime
     messages: List[GeneralMessage] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Property Conversation Schemas
 class PropertyMessageBase(BaseModel):
@@ -107,8 +102,7 @@ class PropertyMessage(PropertyMessageBase):
     conversation_id: int
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PropertyConversationBase(BaseModel):
     session_id: str
@@ -134,8 +128,7 @@ class PropertyConversation(PropertyConversationBase):
     last_message_at: datetime
     messages: List[PropertyMessage] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Chat Response Schemas
 class GeneralChatResponse(BaseModel):
@@ -145,8 +138,7 @@ class GeneralChatResponse(BaseModel):
     intent: Optional[str] = None
     context: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class PropertyChatResponse(BaseModel):
     message: str
@@ -155,8 +147,7 @@ class PropertyChatResponse(BaseModel):
     intent: Optional[str] = None
     property_context: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # External Reference Schemas
 class ExternalReferenceBase(BaseModel):
@@ -182,8 +173,7 @@ class ExternalReference(ExternalReferenceBase):
     property_conversation_id: Optional[int] = None
     last_synced: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # Response Schemas
 class ChatResponse(BaseModel):
@@ -1,5 +1,7 @@
-from fastapi import FastAPI
+import logging
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -7,8 +9,13 @@ from datetime import datetime
 from sqlalchemy import inspect
 
 from .api.routes import router
-from .database import SessionLocal, engine, Base
+from .config import settings
+from .database import AsyncSessionLocal, async_engine, Base, get_pool_stats
 from .modules.session_management import SessionManager
+from .modules.llm import close_http_client
+
+logging.basicConfig(level=settings.log_level.upper())
+logger = logging.getLogger(__name__)
 
 # Create session manager instance
 session_manager = SessionManager()
@@ -19,38 +26,47 @@ scheduler = AsyncIOScheduler()
 async def cleanup_sessions():
     """Background task to clean up expired sessions."""
     try:
-        db = SessionLocal()
-        cleaned = await session_manager.cleanup_expired_sessions(db)
+        async with AsyncSessionLocal() as db:
+            cleaned = await session_manager.cleanup_expired_sessions(db)
         print(f"{datetime.utcnow()}: Cleaned up {cleaned} expired sessions")
     except Exception as e:
         print(f"Error in session cleanup: {str(e)}")
-    finally:
-        db.close()
 
-def create_tables_if_not_exist():
-    """Create database tables if they don't exist."""
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+def _create_missing_tables(connection):
+    """Create any model tables missing from the database, using one catalog lookup."""
+    existing_tables = set(inspect(connection).get_table_names())
     required_tables = [table_name for table_name in Base.metadata.tables.keys()]
-    
+
     print(f"Required tables: {', '.join(required_tables)}")
     print(f"Existing tables: {', '.join(existing_tables)}")
-    
+
     missing_tables = [table for table in required_tables if table not in existing_tables]
-    
+
     if missing_tables:
         print(f"Creating missing tables: {', '.join(missing_tables)}")
         # Create only the tables that don't exist yet
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(
+            connection,
+            tables=[Base.metadata.tables[table] for table in missing_tables],
+            checkfirst=False,
+        )
         print("Tables created successfully")
     else:
         print("All required tables already exist")
 
+
+async def create_tables_if_not_exist():
+    """Create database tables if they don't exist, without blocking the event loop."""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(_create_missing_tables)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create database tables if they don't exist
-    print("Checking and creating database tables if needed...")
-    create_tables_if_not_exist() 
+    # Create database tables if they don't exist; deployments that run
+    # `alembic upgrade head` can skip this with AUTO_CREATE_TABLES=false
+    if settings.auto_create_tables:
+        print("Checking and creating database tables if needed...")
+        await create_tables_if_not_exist()
     
     # Start the scheduler
     scheduler.add_job(
@@ -64,6 +80,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shut down the scheduler on app shutdown
     scheduler.shutdown()
+    # Release the pooled LLM API connections
+    await close_http_client()
 
 app = FastAPI(
     title="MaiSON Chatbot API",
@@ -72,6 +90,7 @@ app = FastAPI(
     root_path="",  # Remove the root_path as it's handled by Azure
     openapi_url="/openapi.json",
     docs_url="/docs",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -105,10 +124,26 @@ app.add_middleware(
 # Include routers
 app.include_router(router, prefix="/api/v1", tags=["chat"])
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Turn any error an endpoint lets escape into a 500 with its message.
+
+    HTTPExceptions keep FastAPI's own handling; this replaces the catch-all
+    try/except each endpoint used to carry.
+    """
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
 @app.get("/")
 async def root():
     return {
         "message": "Welcome to MaiSON Chatbot API",
         "docs_url": "/docs",
         "openapi_url": "/openapi.json"
-    } 
\ No newline at end of file
+    }
+
+if settings.debug_endpoints:
+    @app.get("/debug/pool", include_in_schema=False)
+    async def debug_pool():
+        """Live connection pool counters for diagnosing pool exhaustion."""
+        return get_pool_stats() 
\ No newline at end of file
@@ -1,9 +1,12 @@
-from typing import List, Dict, Optional
+import logging
+from typing import AsyncIterator, List, Dict, Optional
 from datetime import datetime
 from app.modules.property_context.property_context_module import Property
 from ..llm import LLMClient
 from ..data_integration.property_data_service import PropertyDataService
 
+logger = logging.getLogger(__name__)
+
 
 class AdvisoryModule:
     def __init__(self):
@@ -83,7 +86,7 @@ class AdvisoryModule:
             return insights_dict
 
         except Exception as e:
-            print(f"Error getting area insights: {str(e)}")
+            logger.error("Error getting area insights: %s", e)
             return {}
 
     async def _get_property_details(self, property_id: str) -> Optional[Dict]:
@@ -220,7 +223,7 @@ class AdvisoryModule:
             return response
 
         except Exception as e:
-            print(f"Error generating area analysis: {str(e)}")
+            logger.error("Error generating area analysis: %s", e)
             return "I apologize, but I couldn't generate an analysis for this area at the moment."
 
     async def _extract_locations(self, message: str) -> List[str]:
@@ -247,11 +250,11 @@ class AdvisoryModule:
             # Filter out empty strings and "None"
             locations = [loc for loc in locations if loc and loc.lower() != "none"]
 
-            print(f"Extracted locations: {locations}")
+            logger.debug("Extracted locations: %s", locations)
             return locations
 
         except Exception as e:
-            print(f"Error extracting locations: {str(e)}")
+            logger.error("Error extracting locations: %s", e)
             return []
 
     async def _is_asking_for_areas_within_city(self, message: str, locations: List[str]) -> Optional[str]:
@@ -286,145 +289,163 @@ class AdvisoryModule:
             # Check if the response matches one of our extracted locations
             for location in locations:
                 if location.lower() in response.lower() or response.lower() in location.lower():
-                    print(f"User is asking about areas within: {location}")
+                    logger.debug("User is asking about areas within: %s", location)
                     return location
 
             return None
         except Exception as e:
-            print(f"Error determining if asking about areas within city: {str(e)}")
+            logger.error("Error determining if asking about areas within city: %s", e)
             return None
 
     async def handle_general_inquiry(self, message: str, context: Optional[Dict] = None) -> str:
         """Handle general inquiries about real estate and the market."""
         try:
-            # Extract all locations from the message
-            locations = await self._extract_locations(message)
-            print(f"All extracted locations: {locations}")
-
-            # Check if the user is asking about areas within a specific city
-            parent_city = await self._is_asking_for_areas_within_city(message, locations)
-
-            # Get area insights for each location
-            location_insights = {}
-            for location in locations:
-                insights = await self.get_area_insights(location)
-                if insights:
-                    # Check if insights contain useful data
-                    has_data = self._check_insights_for_useful_data(insights)
-                    if has_data:
-                        location_insights[location] = insights
-                        print(f"Got useful insights for {location}")
-                    else:
-                        print(f"No useful data in insights for {location}")
-
-            # Prepare the prompt based on the available data
-            if location_insights:
-                # We have useful data for at least one location
-                prompt = f"User question: {message}\n\n"
-                prompt += "Area Information:\n"
-
-                for location, insights in location_insights.items():
-                    prompt += f"\n{location}:\n"
-
-                    # Add market overview if available
-                    market_overview = insights.get("market_overview", {})
-                    if market_overview and any(v is not None and v != 0 and v != "" for v in market_overview.values()):
-                        prompt += "Market Overview:\n"
-                        if market_overview.get("average_price") is not None:
-                            prompt += f"- Average Price: {market_overview.get('average_price')}\n"
-                        if market_overview.get("price_change_1y") is not None:
-                            prompt += f"- Annual Change: {market_overview.get('price_change_1y')}%\n"
-                        if market_overview.get("number_of_sales") is not None:
-                            prompt += f"- Market Activity: {market_overview.get('number_of_sales')} sales\n"
-
-                    # Add area profile if available
-                    area_profile = insights.get("area_profile", {})
-                    if area_profile:
-                        prompt += "Area Profile:\n"
-
-                        # Add demographics if available
-                        demographics = area_profile.get("demographics", {})
-                        if demographics and any(v for v in demographics.values() if v):
-                            prompt += f"- Demographics: {demographics}\n"
-
-                        # Add crime rate if available
-                        crime_rate = area_profile.get("crime_rate")
-                        if crime_rate is not None:
-                            prompt += f"- Crime Rate: {crime_rate}\n"
-
-                        # Add amenities if available
-                        amenities = area_profile.get("amenities_summary", {})
-                        if amenities and any(v for v in amenities.values() if v):
-                            prompt += f"- Amenities: {amenities}\n"
-
-                        # Add transport if available
-                        transport = area_profile.get("transport_summary", {})
-                        if transport and any(v for v in transport.values() if v):
-                            prompt += f"- Transport: {transport}\n"
-
-                        # Add education if available
-                        education = area_profile.get("education", {})
-                        if education and any(v for v in education.values() if v):
-                            prompt += f"- Education: {education}\n"
-
-                if parent_city:
-                    prompt += f"\nThe user is asking about specific areas or neighborhoods within {parent_city}. "
-                    prompt += f"Please recommend at least 3-5 specific neighborhoods or districts within {parent_city} "
-                    prompt += "that would be suitable based on their query. "
-                    prompt += "For each recommended area, include details about:\n"
-                    prompt += "1. The character and vibe of the neighborhood\n"
-                    prompt += "2. Typical property prices and types\n"
-                    prompt += "3. Transport connections\n"
-                    prompt += "4. Local amenities\n"
-                    prompt += "5. Who the area might be suitable for\n\n"
-
-                prompt += "\nPlease provide a detailed response to the user's question using both the information above and your own knowledge. "
-                prompt += "For any aspects where specific data is not provided, use your general knowledge to fill in the gaps. "
-                prompt += "DO NOT mention any lack of data in your response. Be specific, helpful, and informative."
-            else:
-                # No useful data for any location, fall back to using the LLM's own knowledge
-                if parent_city:
-                    # User is asking about areas within a city but we don't have data
-                    prompt = (
-                        f"User question: {message}\n\n"
-                        f"The user is asking about specific areas or neighborhoods within {parent_city}. "
-                        f"Please recommend at least 3-5 specific neighborhoods or districts within {parent_city} "
-                        f"that would be suitable based on their query. "
-                        f"For each recommended area, include details about:\n"
-                        f"1. The character and vibe of the neighborhood\n"
-                        f"2. Typical property prices and types\n"
-                        f"3. Transport connections\n"
-                        f"4. Local amenities\n"
-                        f"5. Who the area might be suitable for\n\n"
-                        f"DO NOT mention any lack of data or information in your response. "
-                        f"Use your knowledge to provide specific, helpful recommendations. "
-                        f"Be confident and detailed in your response."
-                    )
-                else:
-                    # General fallback
-                    prompt = (
-                        f"User question: {message}\n\n"
-                        f"Please provide a detailed and helpful response about this real estate inquiry using your own knowledge. "
-                        f"If the question is about specific locations, provide specific information about those locations such as "
-                        f"property market trends, typical prices, neighborhood characteristics, transport links, and amenities. "
-                        f"If the user is asking about areas or neighborhoods that would be suitable for certain criteria, recommend "
-                        f"specific areas and include details about their character, property prices, transport, amenities, and target demographic. "
-                        f"DO NOT mention any lack of data or information in your response. "
-                        f"Instead, confidently provide information based on your general knowledge about real estate and locations. "
-                        f"Be specific, helpful, and informative in your response."
-                    )
-
-            print(f"Using prompt type: {'areas-within-city' if parent_city else 'data-based' if location_insights else 'fallback'}")
-
+            prompt = await self._build_general_inquiry_prompt(message)
             response = await self.llm_client.generate_response(
                 messages=[{"role": "user", "content": prompt}], temperature=0.7, module_name="advisory"
             )
             return response
 
         except Exception as e:
-            print(f"Error in advisory module: {str(e)}")
+            logger.error("Error in advisory module: %s", e)
             return "I apologize, but I encountered an error processing your inquiry. Please try again."
 
+    async def stream_general_inquiry(self, message: str, context: Optional[Dict] = None) -> AsyncIterator[str]:
+        """Like handle_general_inquiry, but yields the answer as the LLM generates it."""
+        try:
+            prompt = await self._build_general_inquiry_prompt(message)
+        except Exception as e:
+            logger.error("Error in advisory module: %s", e)
+            yield "I apologize, but I encountered an error processing your inquiry. Please try again."
+            return
+
+        async for chunk in self.llm_client.stream_response(
+            messages=[{"role": "user", "content": prompt}], temperature=0.7, module_name="advisory"
+        ):
+            yield chunk
+
+    async def _build_general_inquiry_prompt(self, message: str) -> str:
+        """Gather area data for the locations in a question and build the answer prompt."""
+        # Extract all locations from the message
+        locations = await self._extract_locations(message)
+        logger.debug("All extracted locations: %s", locations)
+
+        # Check if the user is asking about areas within a specific city
+        parent_city = await self._is_asking_for_areas_within_city(message, locations)
+
+        # Get area insights for each location
+        location_insights = {}
+        for location in locations:
+            insights = await self.get_area_insights(location)
+            if insights:
+                # Check if insights contain useful data
+                has_data = self._check_insights_for_useful_data(insights)
+                if has_data:
+                    location_insights[location] = insights
+                    logger.debug("Got useful insights for %s", location)
+                else:
+                    logger.debug("No useful data in insights for %s", location)
+
+        # Prepare the prompt based on the available data
+        if location_insights:
+            # We have useful data for at least one location
+            prompt = f"User question: {message}\n\n"
+            prompt += "Area Information:\n"
+
+            for location, insights in location_insights.items():
+                prompt += f"\n{location}:\n"
+
+                # Add market overview if available
+                market_overview = insights.get("market_overview", {})
+                if market_overview and any(v is not None and v != 0 and v != "" for v in market_overview.values()):
+                    prompt += "Market Overview:\n"
+                    if market_overview.get("average_price") is not None:
+                        prompt += f"- Average Price: {market_overview.get('average_price')}\n"
+                    if market_overview.get("price_change_1y") is not None:
+                        prompt += f"- Annual Change: {market_overview.get('price_change_1y')}%\n"
+                    if market_overview.get("number_of_sales") is not None:
+                        prompt += f"- Market Activity: {market_overview.get('number_of_sales')} sales\n"
+
+                # Add area profile if available
+                area_profile = insights.get("area_profile", {})
+                if area_profile:
+                    prompt += "Area Profile:\n"
+
+                    # Add demographics if available
+                    demographics = area_profile.get("demographics", {})
+                    if demographics and any(v for v in demographics.values() if v):
+                        prompt += f"- Demographics: {demographics}\n"
+
+                    # Add crime rate if available
+                    crime_rate = area_profile.get("crime_rate")
+                    if crime_rate is not None:
+                        prompt += f"- Crime Rate: {crime_rate}\n"
+
+                    # Add amenities if available
+                    amenities = area_profile.get("amenities_summary", {})
+                    if amenities and any(v for v in amenities.values() if v):
+                        prompt += f"- Amenities: {amenities}\n"
+
+                    # Add transport if available
+                    transport = area_profile.get("transport_summary", {})
+                    if transport and any(v for v in transport.values() if v):
+                        prompt += f"- Transport: {transport}\n"
+
+                    # Add education if available
+                    education = area_profile.get("education", {})
+                    if education and any(v for v in education.values() if v):
+                        prompt += f"- Education: {education}\n"
+
+            if parent_city:
+                prompt += f"\nThe user is asking about specific areas or neighborhoods within {parent_city}. "
+                prompt += f"Please recommend at least 3-5 specific neighborhoods or districts within {parent_city} "
+                prompt += "that would be suitable based on their query. "
+                prompt += "For each recommended area, include details about:\n"
+                prompt += "1. The character and vibe of the neighborhood\n"
+                prompt += "2. Typical property prices and types\n"
+                prompt += "3. Transport connections\n"
+                prompt += "4. Local amenities\n"
+                prompt += "5. Who the area might be suitable for\n\n"
+
+            prompt += "\nPlease provide a detailed response to the user's question using both the information above and your own knowledge. "
+            prompt += "For any aspects where specific data is not provided, use your general knowledge to fill in the gaps. "
+            prompt += "DO NOT mention any lack of data in your response. Be specific, helpful, and informative."
+        else:
+            # No useful data for any location, fall back to using the LLM's own knowledge
+            if parent_city:
+                # User is asking about areas within a city but we don't have data
+                prompt = (
+                    f"User question: {message}\n\n"
+                    f"The user is asking about specific areas or neighborhoods within {parent_city}. "
+                    f"Please recommend at least 3-5 specific neighborhoods or districts within {parent_city} "
+                    f"that would be suitable based on their query. "
+                    f"For each recommended area, include details about:\n"
+                    f"1. The character and vibe of the neighborhood\n"
+                    f"2. Typical property prices and types\n"
+                    f"3. Transport connections\n"
+                    f"4. Local amenities\n"
+                    f"5. Who the area might be suitable for\n\n"
+                    f"DO NOT mention any lack of data or information in your response. "
+                    f"Use your knowledge to provide specific, helpful recommendations. "
+                    f"Be confident and detailed in your response."
+                )
+            else:
+                # General fallback
+                prompt = (
+                    f"User question: {message}\n\n"
+                    f"Please provide a detailed and helpful response about this real estate inquiry using your own knowledge. "
+                    f"If the question is about specific locations, provide specific information about those locations such as "
+                    f"property market trends, typical prices, neighborhood characteristics, transport links, and amenities. "
+                    f"If the user is asking about areas or neighborhoods that would be suitable for certain criteria, recommend "
+                    f"specific areas and include details about their character, property prices, transport, amenities, and target demographic. "
+                    f"DO NOT mention any lack of data or information in your response. "
+                    f"Instead, confidently provide information based on your general knowledge about real estate and locations. "
+                    f"Be specific, helpful, and informative in your response."
+                )
+
+        logger.debug("Using prompt type: %s", 'areas-within-city' if parent_city else 'data-based' if location_insights else 'fallback')
+        return prompt
+
     def _check_insights_for_useful_data(self, insights: Dict) -> bool:
         """Check if insights contain useful data."""
         if not insights:
@@ -1,7 +1,10 @@
+import logging
 from typing import Dict, List, Optional
 from enum import Enum
 from ..llm import LLMClient
 
+logger = logging.getLogger(__name__)
+
 
 class MessageType(Enum):
     GREETING = "greeting"
@@ -36,10 +39,10 @@ class CommunicationModule:
         try:
             return template.format(**kwargs)
         except KeyError:
-            print("Error formatting message: Missing required parameters")
+            logger.error("Error formatting message: Missing required parameters")
             return template
         except Exception:
-            print("Error formatting message")
+            logger.error("Error formatting message")
             return "I apologize, but I couldn't format the response correctly."
 
     async def generate_response(self, intent: str, context: Optional[Dict] = None) -> str:
@@ -60,7 +63,7 @@ class CommunicationModule:
             
             return response
         except Exception as e:
-            print(f"Error generating response: {str(e)}")
+            logger.error("Error generating response: %s", e)
             return self.format_message(MessageType.ERROR)
 
     async def handle_unclear_intent(
@@ -81,7 +84,7 @@ class CommunicationModule:
             )
             return response
         except Exception as e:
-            print(f"Error handling unclear intent: {str(e)}")
+            logger.error("Error handling unclear intent: %s", e)
             return self.format_message(MessageType.ERROR)
 
     async def generate_property_description(self, property_data: Dict) -> str:
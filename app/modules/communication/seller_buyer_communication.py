@@ -1,8 +1,18 @@
-from typing import Dict, Optional
+import logging
+from typing import Dict, Mapping, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...database import AsyncSessionLocal
 from ...database.models import ExternalReference, PropertyQuestion, PropertyConversation, PropertyMessage
 from ..llm import LLMClient
+from ..context_manager import (
+    conversation_history_cache,
+    conversation_list_cache,
+    history_page_cache,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class SellerBuyerCommunicationModule:
@@ -10,8 +20,13 @@ class SellerBuyerCommunicationModule:
 
     def __init__(self):
         self.llm_client = LLMClient()
+        self.history_cache = conversation_history_cache
+        self.history_page_cache = history_page_cache
+        self.conversation_list_cache = conversation_list_cache
 
-    async def handle_message(self, message: str, context: Dict) -> str:
+    async def handle_message(
+        self, message: str, context: Dict, db: Optional[AsyncSession] = None
+    ) -> str:
         """
         Handle messages between sellers and buyers.
 
@@ -23,6 +38,7 @@ class SellerBuyerCommunicationModule:
                     - counterpart_id: ID of the recipient
                     - property_id: ID of the property
                     - conversation_history: List of previous messages
+            db: Database session, used to record questions forwarded to the seller
         """
         try:
             # Store context for use in _needs_seller_input
@@ -40,7 +56,7 @@ class SellerBuyerCommunicationModule:
 
             # If this is a buyer asking a question that needs seller input
             if context["role"] == "buyer" and self._needs_seller_input(message):
-                return await self._handle_buyer_question(message, context)
+                return await self._handle_buyer_question(message, context, db)
 
             # For all other messages, just generate a response
             # Prepare message context for LLM
@@ -75,21 +91,29 @@ class SellerBuyerCommunicationModule:
             return response
 
         except Exception as e:
-            print(f"Error in seller-buyer communication: {str(e)}")
+            logger.error("Error in seller-buyer communication: %s", e)
             return "I apologize, but I encountered an error processing your message. Please try again."
 
     async def notify_counterpart(
-        self, conversation_id: int, message: str, db: Session, context: Dict
+        self,
+        conversation_id: int,
+        message: str,
+        db: AsyncSession,
+        context: Dict,
+        formatted_message: Optional[str] = None,
     ) -> bool:
         """
         Notify the counterpart (buyer/seller) about a new message.
-        Creates an external reference and notification record.
+        Adds an external reference and notification record to db's current
+        transaction; the caller commits.
 
         Args:
             conversation_id: ID of the current conversation
             message: The message to forward
             db: Database session
             context: Contains sender and recipient information
+            formatted_message: Message already run through format_message_for_counterpart,
+                    if the caller formatted it ahead of time
         """
         try:
             # Skip question creation if this is a notification for an existing question
@@ -109,18 +133,23 @@ class SellerBuyerCommunicationModule:
                     },
                 )
                 db.add(external_ref)
-                db.commit()
                 return True
 
             # Get original question from context if available
+            # The conversation's own property_context is a read-only view, so
+            # extend a copy rather than writing through to the row
             property_context = context.get("property_context", {})
             if "original_question" in context:
-                property_context["original_question"] = context["original_question"]
+                property_context = {
+                    **property_context,
+                    "original_question": context["original_question"],
+                }
 
             # Format message for the counterpart
-            formatted_message = await self.format_message_for_counterpart(
-                message, context["role"], property_context
-            )
+            if formatted_message is None:
+                formatted_message = await self.format_message_for_counterpart(
+                    message, context["role"], property_context
+                )
 
             # Create external reference for notification
             external_ref = ExternalReference(
@@ -140,18 +169,39 @@ class SellerBuyerCommunicationModule:
             # In a real implementation, this would integrate with a notification service
             # For example, sending an email, push notification, or SMS
             # For now, we'll just log it
-            print(
-                f"Notification sent to {context['counterpart_id']}: {formatted_message}"
-            )
+            logger.info("Notification sent to %s: %s", context["counterpart_id"], formatted_message)
 
-            db.commit()
             return True
 
         except Exception as e:
-            print(f"Error notifying counterpart: {str(e)}")
-            db.rollback()
+            logger.error("Error notifying counterpart: %s", e)
             return False
 
+    async def notify_counterpart_in_background(
+        self,
+        conversation_id: int,
+        message: str,
+        context: Dict,
+        formatted_message: Optional[str] = None,
+    ) -> bool:
+        """
+        Notify the counterpart from a background task, after the response is sent.
+
+        The request's session is closed by then, so the notification is written
+        through a session of its own.
+        """
+        async with AsyncSessionLocal() as db:
+            notified = await self.notify_counterpart(
+                conversation_id=conversation_id,
+                message=message,
+                db=db,
+                context=context,
+                formatted_message=formatted_message,
+            )
+            if notified:
+                await db.commit()
+            return notified
+
     def _classify_message_type(self, message: str) -> str:
         """
         Classify the type of message being sent.
@@ -177,7 +227,7 @@ class SellerBuyerCommunicationModule:
             return "general_inquiry"
 
     async def format_message_for_counterpart(
-        self, message: str, sender_role: str, property_context: Optional[Dict] = None
+        self, message: str, sender_role: str, property_context: Optional[Mapping] = None
     ) -> str:
         """
         Format a message to be sent to the counterpart.
@@ -185,13 +235,13 @@ class SellerBuyerCommunicationModule:
         """
         try:
             # If this is a notification for a question, use the original question if available
-            if isinstance(property_context, dict) and "original_question" in property_context:
+            if isinstance(property_context, Mapping) and "original_question" in property_context:
                 message = property_context["original_question"]
 
             # Prepare context for message formatting
             format_context = {
                 "sender_role": sender_role,
-                "property_context": property_context or {},
+                "property_context": dict(property_context or {}),
                 "message_type": self._classify_message_type(message),
             }
 
@@ -217,7 +267,7 @@ class SellerBuyerCommunicationModule:
             return formatted_message
 
         except Exception as e:
-            print(f"Error formatting message: {str(e)}")
+            logger.error("Error formatting message: %s", e)
             return message  # Return original message if formatting fails
 
     def validate_message_content(self, message: str, sender_role: str) -> bool:
@@ -287,7 +337,7 @@ class SellerBuyerCommunicationModule:
             return response.strip().lower() == 'true'
 
         except Exception as e:
-            print(f"Error in LLM-based seller input detection: {str(e)}")
+            logger.error("Error in LLM-based seller input detection: %s", e)
             # Fallback to basic pattern matching if LLM fails
             message_lower = message.lower()
             patterns = [
@@ -330,20 +380,22 @@ class SellerBuyerCommunicationModule:
             )
             return response.strip()
         except Exception as e:
-            print(f"Error reformatting buyer question: {str(e)}")
+            logger.error("Error reformatting buyer question: %s", e)
             return message  # Return original message if reformatting fails
 
-    async def _handle_buyer_question(self, message: str, context: Dict) -> str:
+    async def _handle_buyer_question(self, message: str, context: Dict, db: AsyncSession) -> str:
         """
         Handle a buyer's question that needs to be forwarded to the seller.
         Creates a PropertyQuestion record and notifies the seller.
         """
-        db = context["db"]
         try:
             # Check if a question with this message_id already exists
-            existing_question = db.query(PropertyQuestion).filter(
-                PropertyQuestion.question_message_id == context["message_id"]
-            ).first()
+            result = await db.execute(
+                select(PropertyQuestion).where(
+                    PropertyQuestion.question_message_id == context["message_id"]
+                )
+            )
+            existing_question = result.scalars().first()
             
             if existing_question:
                 return "I will forward your question to the seller and let you know once I have a response."
@@ -393,7 +445,7 @@ class SellerBuyerCommunicationModule:
             
             # Add to database
             db.add(question)
-            db.flush()  # Get the question ID
+            await db.flush()  # Get the question ID
 
             # Create notification reference
             external_ref = ExternalReference(
@@ -416,14 +468,14 @@ class SellerBuyerCommunicationModule:
             return "I will forward your question to the seller and let you know once I have a response."
 
         except Exception as e:
-            print(f"Error handling buyer question: {str(e)}")
+            logger.error("Error handling buyer question: %s", e)
             raise  # Let the transaction handling in the route handle the rollback
 
     async def handle_seller_response(
         self, 
         question_id: int, 
         answer: str, 
-        db: Session
+        db: AsyncSession
     ) -> bool:
         """
         Handle a seller's response to a buyer's question.
@@ -431,9 +483,10 @@ class SellerBuyerCommunicationModule:
         """
         try:
             # Get the question record
-            question = db.query(PropertyQuestion).filter(
-                PropertyQuestion.id == question_id
-            ).first()
+            result = await db.execute(
+                select(PropertyQuestion).where(PropertyQuestion.id == question_id)
+            )
+            question = result.scalar_one_or_none()
             
             if not question:
                 return False
@@ -448,9 +501,12 @@ class SellerBuyerCommunicationModule:
             question.answered_at = datetime.utcnow()
             
             # Get the original conversation
-            conversation = db.query(PropertyConversation).filter(
-                PropertyConversation.id == question.conversation_id
-            ).first()
+            result = await db.execute(
+                select(PropertyConversation).where(
+                    PropertyConversation.id == question.conversation_id
+                )
+            )
+            conversation = result.scalar_one_or_none()
 
             if not conversation:
                 return False
@@ -469,11 +525,18 @@ class SellerBuyerCommunicationModule:
             db.add(answer_message)
             
             # Commit changes
-            db.commit()
+            await db.commit()
+            # The answer lands outside the chat flow, so force a fresh history read
+            cache_key = (PropertyMessage.__tablename__, conversation.id)
+            self.history_cache.invalidate(cache_key)
+            self.history_page_cache.invalidate(cache_key)
+            self.conversation_list_cache.invalidate(
+                conversation.user_id, conversation.counterpart_id
+            )
             
             return True
 
         except Exception as e:
-            print(f"Error handling seller response: {str(e)}")
-            db.rollback()
+            logger.error("Error handling seller response: %s", e)
+            await db.rollback()
             return False
@@ -1,4 +1,18 @@
 # app/modules/context_manager/__init__.py
 from .context_manager import ContextManager
+from .conversation_cache import ConversationCache, conversation_cache
+from .history_cache import ConversationHistoryCache, conversation_history_cache
+from .history_page_cache import HistoryPageCache, history_page_cache
+from .conversation_list_cache import ConversationListCache, conversation_list_cache
 
-__all__ = ['ContextManager'] 
\ No newline at end of file
+__all__ = [
+    'ContextManager',
+    'ConversationCache',
+    'conversation_cache',
+    'ConversationHistoryCache',
+    'conversation_history_cache',
+    'HistoryPageCache',
+    'history_page_cache',
+    'ConversationListCache',
+    'conversation_list_cache',
+]
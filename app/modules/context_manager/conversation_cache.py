@@ -0,0 +1,33 @@
+from typing import Hashable, Optional
+from cachetools import TTLCache
+from app.config import settings
+
+
+class ConversationCache:
+    """In-memory map from a chat session to its last committed conversation row."""
+
+    def __init__(self, ttl: Optional[int] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl or settings.cache_ttl
+        self.maxsize = maxsize or settings.max_cache_items
+
+        self.conversation_cache: TTLCache = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Get the cached (detached) conversation for a session."""
+        return self.conversation_cache.get(key)
+
+    def set(self, key: Hashable, conversation: object) -> None:
+        """Cache a conversation; call only once its changes are committed."""
+        self.conversation_cache[key] = conversation
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached conversation for a session."""
+        self.conversation_cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all cached conversations."""
+        self.conversation_cache.clear()
+
+
+# Shared with the writers that change or delete conversations outside the chat flow
+conversation_cache = ConversationCache()
@@ -0,0 +1,48 @@
+from typing import Dict, Hashable, Optional
+from cachetools import TTLCache
+from app.config import settings
+
+
+class ConversationListCache:
+    """In-memory cache of serialized conversation listing responses per user.
+
+    Entries are short-lived: a user's listing also changes when a
+    counterpart writes to a shared conversation, and not every such write
+    knows every user it affects.
+    """
+
+    def __init__(self, ttl: Optional[int] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl or settings.listing_cache_ttl
+        self.maxsize = maxsize or settings.max_cache_items
+
+        self.listing_cache: TTLCache = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    def get(self, user_id: str, query: Hashable) -> Optional[bytes]:
+        """Get the cached response body for one listing query of a user."""
+        listings: Optional[Dict[Hashable, bytes]] = self.listing_cache.get(user_id)
+        if listings is None:
+            return None
+        return listings.get(query)
+
+    def set(self, user_id: str, query: Hashable, body: bytes) -> None:
+        """Cache the response body for one listing query of a user."""
+        listings = self.listing_cache.get(user_id)
+        if listings is None:
+            # Only a new user entry starts the TTL; adding queries doesn't extend it
+            self.listing_cache[user_id] = {query: body}
+        else:
+            listings[query] = body
+
+    def invalidate(self, *user_ids: Optional[str]) -> None:
+        """Drop every cached listing of the given users, e.g. after a conversation changes."""
+        for user_id in user_ids:
+            if user_id:
+                self.listing_cache.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Clear all cached listings."""
+        self.listing_cache.clear()
+
+
+# Shared by the listing endpoint and every writer of conversations
+conversation_list_cache = ConversationListCache()
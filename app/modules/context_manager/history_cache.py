@@ -0,0 +1,56 @@
+from collections import deque
+from typing import Deque, Dict, Hashable, Iterable, List, Optional
+from cachetools import TTLCache
+from app.config import settings
+
+
+class ConversationHistoryCache:
+    """In-memory sliding window of the most recent messages per conversation."""
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        ttl: Optional[int] = None,
+        maxsize: Optional[int] = None,
+    ):
+        self.window = window or settings.history_window
+        self.ttl = ttl or settings.cache_ttl
+        self.maxsize = maxsize or settings.max_cache_items
+
+        self.history_cache: TTLCache = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    def get(self, key: Hashable) -> Optional[List[Dict[str, str]]]:
+        """Get the cached window for a conversation, oldest message first."""
+        window = self.history_cache.get(key)
+        if window is None:
+            return None
+        return list(window)
+
+    def set(self, key: Hashable, messages: Iterable[Dict[str, str]]) -> None:
+        """Seed the window for a conversation, e.g. after a database read."""
+        self.history_cache[key] = deque(messages, maxlen=self.window)
+
+    def append(self, key: Hashable, *messages: Dict[str, str]) -> None:
+        """Push new messages onto a cached window, dropping the oldest ones.
+
+        Conversations that are not cached are left alone so the next read
+        falls back to the database and picks the messages up from there.
+        """
+        window: Optional[Deque[Dict[str, str]]] = self.history_cache.get(key)
+        if window is None:
+            return
+        window.extend(messages)
+        # Re-assign to refresh the entry's TTL
+        self.history_cache[key] = window
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached window for a conversation."""
+        self.history_cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all cached windows."""
+        self.history_cache.clear()
+
+
+# Shared by every writer of chat messages so the windows stay coherent
+conversation_history_cache = ConversationHistoryCache()
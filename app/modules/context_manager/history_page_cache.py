@@ -0,0 +1,43 @@
+from typing import Dict, Hashable, Optional, Tuple
+from cachetools import TTLCache
+from app.config import settings
+
+# (limit, before_id) as requested from a history endpoint
+Page = Tuple[int, Optional[int]]
+# A serialized response body and its ETag
+CachedPage = Tuple[bytes, str]
+
+
+class HistoryPageCache:
+    """In-memory cache of serialized history endpoint responses per conversation."""
+
+    def __init__(self, ttl: Optional[int] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl or settings.cache_ttl
+        self.maxsize = maxsize or settings.max_cache_items
+
+        self.page_cache: TTLCache = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    def get(self, key: Hashable, page: Page) -> Optional[CachedPage]:
+        """Get the cached response body and ETag for one page of a conversation's history."""
+        pages: Optional[Dict[Page, CachedPage]] = self.page_cache.get(key)
+        if pages is None:
+            return None
+        return pages.get(page)
+
+    def set(self, key: Hashable, page: Page, body: bytes, etag: str) -> None:
+        """Cache a response body and its ETag for one page of a conversation's history."""
+        pages = self.page_cache.get(key) or {}
+        pages[page] = (body, etag)
+        self.page_cache[key] = pages
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop every cached page of a conversation, e.g. after a message is added."""
+        self.page_cache.pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all cached pages."""
+        self.page_cache.clear()
+
+
+# Shared by the history endpoints and every writer of chat messages
+history_page_cache = HistoryPageCache()
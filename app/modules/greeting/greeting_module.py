@@ -1,7 +1,11 @@
+import logging
 from typing import Dict, Optional
 import random
 from ..llm import LLMClient
 
+logger = logging.getLogger(__name__)
+
+
 class GreetingModule:
     """Module for handling greeting messages with personalized responses."""
     
@@ -42,5 +46,5 @@ class GreetingModule:
             return random.choice(self.greeting_templates)
 
         except Exception as e:
-            print(f"Error in greeting module: {str(e)}")
+            logger.error("Error in greeting module: %s", e)
             return self.greeting_templates[0]  # Return default greeting on error 
\ No newline at end of file
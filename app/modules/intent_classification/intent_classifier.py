@@ -1,7 +1,13 @@
+import logging
 from enum import Enum
+from cachetools import TTLCache
 from ..llm import LLMClient
+from app.config import settings
 import re
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
 
 class Intent(Enum):
     GREETING = "greeting"
@@ -27,6 +33,10 @@ class Intent(Enum):
 class IntentClassifier:
     def __init__(self):
         self.llm_client = LLMClient()
+        # Classifications keyed on everything that goes into the prompt
+        self._classification_cache: TTLCache = TTLCache(
+            maxsize=settings.max_cache_items, ttl=settings.cache_ttl
+        )
         self._intent_descriptions = {
             Intent.GREETING: (
                 "Initial greetings, hellos, or conversation starters"
@@ -142,8 +152,22 @@ class IntentClassifier:
         )
         return prompt
 
+    def _get_cache_key(self, message: str, context: Optional[Dict] = None) -> Tuple[str, ...]:
+        """Build a cache key from the message and the history the prompt uses."""
+        key = (" ".join(message.lower().split()),)
+        if context and "conversation_history" in context:
+            history = context["conversation_history"]
+            if len(history) >= 2:
+                key += (history[-2]["content"], history[-1]["content"])
+        return key
+
     async def classify(self, message: str, context: Optional[Dict] = None) -> Intent:
         """Classify the intent of a given message using LLM."""
+        cache_key = self._get_cache_key(message, context)
+        cached_intent = self._classification_cache.get(cache_key)
+        if cached_intent is not None:
+            return cached_intent
+
         try:
             # Prepare the full prompt with context
             prompt = self._get_classification_prompt(message, context)
@@ -159,10 +183,12 @@ class IntentClassifier:
             
             # Clean up response and convert to Intent
             intent_str = response.strip().lower()
-            return Intent.from_string(intent_str)
+            intent = Intent.from_string(intent_str)
+            self._classification_cache[cache_key] = intent
+            return intent
             
         except Exception as e:
-            print(f"Error in intent classification: {str(e)}")
+            logger.error("Error in intent classification: %s", e)
             return Intent.UNKNOWN 
 
     async def classify_general(self, message: str) -> Intent:
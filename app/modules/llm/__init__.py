@@ -1,6 +1,7 @@
 # app/modules/llm/__init__.py
 from .types import LLMProvider
-from .llm_client import LLMClient
+from .llm_client import LLMClient, close_http_client
 from .prompts import SystemPrompts
+from .response_cache import ResponseCache
 
-__all__ = ['LLMClient', 'LLMProvider', 'SystemPrompts'] 
\ No newline at end of file
+__all__ = ['LLMClient', 'LLMProvider', 'SystemPrompts', 'ResponseCache', 'close_http_client'] 
\ No newline at end of file
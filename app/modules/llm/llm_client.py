@@ -1,13 +1,41 @@
-from typing import List, Dict, Optional
+import logging
+from typing import AsyncIterator, List, Dict, Optional
 import anthropic
 import google.generativeai as genai
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 from .types import LLMProvider
 from .prompts import SystemPrompts
 from functools import lru_cache
 from app.config import settings
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+logger = logging.getLogger(__name__)
+
+# One connection pool shared by every LLMClient in the process, so keep-alive
+# connections to the OpenAI/Anthropic APIs (and their TLS sessions) are reused
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client used by the OpenAI and Anthropic SDKs."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client on application shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class LLMClient:
     def __init__(
         self,
@@ -26,12 +54,16 @@ class LLMClient:
         # Setup OpenAI
         api_key = settings.openai_api_key
         if api_key and not api_key.startswith("sk-dummy"):
-            self.clients[LLMProvider.OPENAI] = OpenAI(api_key=api_key)
+            self.clients[LLMProvider.OPENAI] = AsyncOpenAI(
+                api_key=api_key, http_client=get_http_client()
+            )
 
         # Setup Anthropic
         api_key = settings.anthropic_api_key
         if api_key and not api_key.startswith("sk-ant-dummy"):
-            self.clients[LLMProvider.ANTHROPIC] = anthropic.Anthropic(api_key=api_key)
+            self.clients[LLMProvider.ANTHROPIC] = anthropic.AsyncAnthropic(
+                api_key=api_key, http_client=get_http_client()
+            )
 
         # Setup Gemini
         api_key = settings.google_api_key
@@ -109,13 +141,13 @@ class LLMClient:
                     if response:
                         return response
                 except Exception as e:
-                    print(f"Error with primary provider {self.provider}: {str(e)}")
+                    logger.error("Error with primary provider %s: %s", self.provider, e)
 
             # Try fallback providers
             for provider in self.fallback_providers:
                 if provider in self.clients:
                     try:
-                        print(f"Trying fallback provider: {provider}")
+                        logger.debug("Trying fallback provider: %s", provider)
                         # Update system prompt for fallback provider
                         fallback_system_prompt = (
                             SystemPrompts.get_module_prompt(module_name, provider)
@@ -132,16 +164,60 @@ class LLMClient:
                         if response:
                             return response
                     except Exception as e:
-                        print(f"Error with fallback provider {provider}: {str(e)}")
+                        logger.error("Error with fallback provider %s: %s", provider, e)
                         continue
 
             # If all providers fail, use mock response
             return self._get_mock_response(messages)
 
         except Exception as e:
-            print(f"Error generating response: {str(e)}")
+            logger.error("Error generating response: %s", e)
             return "I apologize, but I encountered an error generating a response. Please try again."
 
+    async def stream_response(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        module_name: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response as text chunks while the LLM generates it.
+        Only a Gemini primary provider streams; other providers, and Gemini
+        failures before the first chunk, fall back to generate_response
+        delivered as one chunk.
+        """
+        if self.provider == LLMProvider.GEMINI and LLMProvider.GEMINI in self.clients:
+            system_prompt = (
+                SystemPrompts.get_module_prompt(module_name, self.provider)
+                if module_name
+                else SystemPrompts.get_prompt(self.provider)
+            )
+            streamed_any = False
+            try:
+                response = await self.clients[LLMProvider.GEMINI].generate_content_async(
+                    self._format_gemini_prompt(messages, system_prompt),
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=temperature,
+                        max_output_tokens=max_tokens,
+                    ),
+                    stream=True,
+                )
+                async for chunk in response:
+                    if chunk.text:
+                        streamed_any = True
+                        yield chunk.text
+                if streamed_any:
+                    return
+            except Exception as e:
+                if streamed_any:
+                    # Part of the answer is already with the client; don't append a second one
+                    logger.error("Gemini stream interrupted: %s", e)
+                    return
+                logger.error("Error streaming from Gemini API: %s", e)
+
+        yield await self.generate_response(messages, temperature, max_tokens, module_name)
+
     async def _generate_with_provider(
         self,
         provider: LLMProvider,
@@ -224,51 +300,40 @@ class LLMClient:
     ) -> str:
         """Generate response using Google's Gemini API."""
         try:
-            # Prepare messages for Gemini
-            formatted_content = []
-            
-            # Add system prompt
-            formatted_content.append(system_prompt)
-            
-            # Add conversation history
-            for msg in messages:
-                role_prefix = "User: " if msg["role"] == "user" else "Assistant: "
-                formatted_content.append(f"{role_prefix}{msg['content']}")
-            
-            # Join all content with newlines
-            final_prompt = "\n".join(formatted_content)
-            
-            print(f"Debug: Sending request to Gemini API with prompt: {final_prompt}")
+            final_prompt = self._format_gemini_prompt(messages, system_prompt)
+
+            logger.debug("Sending request to Gemini API with prompt: %s", final_prompt)
             
-            # Use synchronous API with async wrapper
-            response = await self._run_sync_gemini(
+            # Native async call, so concurrent requests don't queue on the
+            # default thread pool while they wait on Gemini
+            response = await self.clients[LLMProvider.GEMINI].generate_content_async(
                 final_prompt,
-                temperature,
-                max_tokens
+                generation_config=genai.types.GenerationConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                ),
             )
             
             if not response or not response.text:
-                print("Warning: Received empty response from Gemini API")
+                logger.warning("Received empty response from Gemini API")
                 return self._get_mock_response(messages)
                 
-            print(f"Debug: Received response from Gemini API: {response.text}")
+            logger.debug("Received response from Gemini API: %s", response.text)
             return response.text
             
         except Exception as e:
-            print(f"Error in Gemini API call: {str(e)}")
+            logger.error("Error in Gemini API call: %s", e)
             return self._get_mock_response(messages)
 
-    async def _run_sync_gemini(self, prompt: str, temperature: float, max_tokens: int):
-        """Run Gemini's synchronous API in an async context."""
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            lambda: self.clients[LLMProvider.GEMINI].generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=temperature,
-                    max_output_tokens=max_tokens,
-                )
-            )
-        ) 
\ No newline at end of file
+    def _format_gemini_prompt(self, messages: List[Dict[str, str]], system_prompt: str) -> str:
+        """Flatten the system prompt and conversation into Gemini's single text prompt."""
+        # Add system prompt
+        formatted_content = [system_prompt]
+
+        # Add conversation history
+        for msg in messages:
+            role_prefix = "User: " if msg["role"] == "user" else "Assistant: "
+            formatted_content.append(f"{role_prefix}{msg['content']}")
+
+        # Join all content with newlines
+        return "\n".join(formatted_content)
@@ -0,0 +1,53 @@
+import hashlib
+import re
+from typing import Dict, Optional
+from cachetools import TTLCache
+from app.config import settings
+
+# Only intents whose answers depend on the question alone (no user,
+# property or conversation state) are safe to share between sessions.
+CACHEABLE_INTENTS = frozenset({"website_functionality", "company_information"})
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class ResponseCache:
+    """Cache of routed chat responses keyed on the normalised question."""
+
+    def __init__(self, ttl: Optional[int] = None, maxsize: Optional[int] = None):
+        self.ttl = ttl or settings.cache_ttl
+        self.maxsize = maxsize or settings.max_cache_items
+
+        self.response_cache: TTLCache = TTLCache(maxsize=self.maxsize, ttl=self.ttl)
+
+    @staticmethod
+    def normalize(message: str) -> str:
+        """Fold case, punctuation and spacing so trivially different phrasings match."""
+        message = _PUNCTUATION.sub(" ", message.lower())
+        return _WHITESPACE.sub(" ", message).strip()
+
+    @classmethod
+    def key(cls, message: str) -> bytes:
+        """Fixed-size digest of the normalised question, so long messages make small keys."""
+        return hashlib.blake2b(cls.normalize(message).encode(), digest_size=16).digest()
+
+    def get(self, message: str) -> Optional[Dict[str, str]]:
+        """Get a cached {response, intent} pair for a question."""
+        return self.response_cache.get(self.key(message))
+
+    def set(self, message: str, response: str, intent: str) -> None:
+        """Store a routed response if its intent is safe to share."""
+        if intent not in CACHEABLE_INTENTS:
+            return
+        # Fallback apologies are transient failures, not answers
+        if response.startswith("I apologize"):
+            return
+        self.response_cache[self.key(message)] = {
+            "response": response,
+            "intent": intent,
+        }
+
+    def clear(self) -> None:
+        """Clear all cached responses."""
+        self.response_cache.clear()
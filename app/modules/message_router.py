@@ -1,4 +1,6 @@
-from typing import Dict, Optional
+import logging
+from functools import cached_property
+from typing import AsyncIterator, Dict, Optional, Tuple
 from .intent_classification import IntentClassifier, Intent
 from .property_context import PropertyContextModule
 from .advisory import AdvisoryModule
@@ -9,18 +11,64 @@ from .greeting.greeting_module import GreetingModule
 from .website_info import WebsiteInfoModule
 from .property_listings import PropertyListingsModule
 
+logger = logging.getLogger(__name__)
+
+# Handler for each intent as (module attribute, method name), built once at
+# import and resolved on the router instance when a message is dispatched
+_HANDLER_BY_INTENT: Dict[Intent, Tuple[str, str]] = {
+    Intent.GREETING: ("greeting_module", "handle_greeting"),
+    Intent.PROPERTY_INQUIRY: ("property_context", "handle_inquiry"),
+    Intent.AVAILABILITY_AND_BOOKING_REQUEST: ("property_context", "handle_booking"),
+    Intent.PRICE_INQUIRY: ("property_context", "handle_pricing"),
+    Intent.BUYER_SELLER_COMMUNICATION: ("seller_buyer_communication", "handle_message"),
+    Intent.NEGOTIATION: ("seller_buyer_communication", "handle_message"),
+    Intent.GENERAL_QUESTION: ("advisory_module", "handle_general_inquiry"),
+    Intent.WEBSITE_FUNCTIONALITY: ("website_info_module", "handle_website_functionality"),
+    Intent.COMPANY_INFORMATION: ("website_info_module", "handle_company_information"),
+    Intent.PROPERTY_LISTINGS_INQUIRY: ("property_listings_module", "handle_inquiry"),
+    Intent.UNKNOWN: ("communication_module", "handle_unclear_intent"),
+}
+_FALLBACK_HANDLER = _HANDLER_BY_INTENT[Intent.UNKNOWN]
+
 
 class MessageRouter:
-    def __init__(self):
-        self.intent_classifier = IntentClassifier()
-        self.property_context = PropertyContextModule()
-        self.advisory_module = AdvisoryModule()
-        self.communication_module = CommunicationModule()
-        self.seller_buyer_communication = SellerBuyerCommunicationModule()
-        self.context_manager = ContextManager()
-        self.greeting_module = GreetingModule()
-        self.website_info_module = WebsiteInfoModule()
-        self.property_listings_module = PropertyListingsModule()
+    # Each module is built the first time a message is routed to it
+
+    @cached_property
+    def intent_classifier(self) -> IntentClassifier:
+        return IntentClassifier()
+
+    @cached_property
+    def property_context(self) -> PropertyContextModule:
+        return PropertyContextModule()
+
+    @cached_property
+    def advisory_module(self) -> AdvisoryModule:
+        return AdvisoryModule()
+
+    @cached_property
+    def communication_module(self) -> CommunicationModule:
+        return CommunicationModule()
+
+    @cached_property
+    def seller_buyer_communication(self) -> SellerBuyerCommunicationModule:
+        return SellerBuyerCommunicationModule()
+
+    @cached_property
+    def context_manager(self) -> ContextManager:
+        return ContextManager()
+
+    @cached_property
+    def greeting_module(self) -> GreetingModule:
+        return GreetingModule()
+
+    @cached_property
+    def website_info_module(self) -> WebsiteInfoModule:
+        return WebsiteInfoModule()
+
+    @cached_property
+    def property_listings_module(self) -> PropertyListingsModule:
+        return PropertyListingsModule()
 
     async def process_message(
         self, message: str, context: Optional[Dict] = None
@@ -42,33 +90,48 @@ class MessageRouter:
             return response
 
         except Exception as e:
-            print(f"Error processing message: {str(e)}")
+            logger.error("Error processing message: %s", e)
             return "I apologize, but I encountered an error processing your message. Please try again."
 
     async def _route_intent(self, intent: Intent, message: str, context: Dict) -> str:
         """Route the message to the appropriate handler based on intent."""
-        intent_handlers = {
-            Intent.GREETING: self.greeting_module.handle_greeting,
-            Intent.PROPERTY_INQUIRY: self.property_context.handle_inquiry,
-            Intent.AVAILABILITY_AND_BOOKING_REQUEST: self.property_context.handle_booking,
-            Intent.PRICE_INQUIRY: self.property_context.handle_pricing,
-            Intent.BUYER_SELLER_COMMUNICATION: self.seller_buyer_communication.handle_message,
-            Intent.NEGOTIATION: self.seller_buyer_communication.handle_message,
-            Intent.GENERAL_QUESTION: self.advisory_module.handle_general_inquiry,
-            Intent.WEBSITE_FUNCTIONALITY: self.website_info_module.handle_website_functionality,
-            Intent.COMPANY_INFORMATION: self.website_info_module.handle_company_information,
-            Intent.PROPERTY_LISTINGS_INQUIRY: self.property_listings_module.handle_inquiry,
-            Intent.UNKNOWN: self.communication_module.handle_unclear_intent,
-        }
-
         # Update context with the intent for use in handlers
         context["intent"] = intent.value
 
-        handler = intent_handlers.get(
-            intent, self.communication_module.handle_unclear_intent
-        )
+        module_name, method_name = _HANDLER_BY_INTENT.get(intent, _FALLBACK_HANDLER)
+        handler = getattr(getattr(self, module_name), method_name)
         return await handler(message, context)
 
+    async def classify_intent(self, message: str, context: Optional[Dict] = None) -> Intent:
+        """
+        Classify a property chat message without generating a response.
+        Used by callers that dispatch to their own handlers, so the message
+        isn't handled twice.
+        """
+        return await self.intent_classifier.classify(message, context)
+
+    async def route_message_stream(
+        self, message: str, context: Optional[Dict] = None
+    ) -> Tuple[str, AsyncIterator[str]]:
+        """
+        Route a general chat message and return its intent with a stream of
+        response chunks. Open-ended advisory answers stream from the LLM;
+        the short, structured intents are answered in a single chunk.
+        """
+        intent = await self.intent_classifier.classify_general(message)
+        if intent != Intent.GREETING:
+            specific_intent = await self.intent_classifier.classify(message, context)
+            if specific_intent not in [Intent.WEBSITE_FUNCTIONALITY, Intent.COMPANY_INFORMATION, Intent.PROPERTY_LISTINGS_INQUIRY]:
+                return intent.value, self.advisory_module.stream_general_inquiry(message, context or {})
+
+        # Classification results are cached, so re-routing doesn't repeat the LLM call
+        result = await self.route_message(message, context, chat_type="general")
+
+        async def single_chunk() -> AsyncIterator[str]:
+            yield result["response"]
+
+        return result["intent"], single_chunk()
+
     async def route_message(
         self, message: str, context: Optional[Dict] = None, chat_type: str = "general"
     ) -> Dict[str, str]:
@@ -130,7 +193,7 @@ class MessageRouter:
             }
             
         except Exception as e:
-            print(f"Error in message routing: {str(e)}")
+            logger.error("Error in message routing: %s", e)
             return {
                 "response": "I apologize, but I encountered an error processing your message. Please try again.",
                 "intent": Intent.UNKNOWN.value,
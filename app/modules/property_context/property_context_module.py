@@ -1,8 +1,12 @@
+import logging
 from typing import Dict, Optional, List
 import aiohttp
 from ..llm import LLMClient
 from ..data_integration.cache import cache_property_data
 
+logger = logging.getLogger(__name__)
+
+
 class Property:
     """Class representing a property with its details."""
     def __init__(self, id: str, name: str, type: str, location: str, details: Optional[Dict] = None):
@@ -34,7 +38,7 @@ class PropertyContextModule:
                         raise Exception(f"Failed to fetch property details: {response.status}")
                     return await response.json()
         except Exception as e:
-            print(f"Error fetching property details: {str(e)}")
+            logger.error("Error fetching property details: %s", e)
             return None
 
     async def get_or_fetch_property(self, property_id: str) -> Optional[Property]:
@@ -48,7 +52,7 @@ class PropertyContextModule:
             property_id_from_api = property_data.get('property_id')
             
             if not property_id_from_api:
-                print(f"Warning: No property_id found in property data for {property_id}")
+                logger.warning("No property_id found in property data for %s", property_id)
                 property_id_from_api = property_id
 
             # Create formatted address
@@ -71,7 +75,7 @@ class PropertyContextModule:
             return property_instance
 
         except Exception as e:
-            print(f"Error in get_or_fetch_property: {str(e)}")
+            logger.error("Error in get_or_fetch_property: %s", e)
             return None
 
     async def handle_inquiry(self, message: str, context: Optional[Dict] = None) -> str:
@@ -132,7 +136,7 @@ class PropertyContextModule:
             return response
 
         except Exception as e:
-            print(f"Error handling property inquiry: {str(e)}")
+            logger.error("Error handling property inquiry: %s", e)
             return "I apologize, but I encountered an error processing your inquiry. Please try again."
 
     async def handle_pricing(self, message: str, context: Optional[Dict] = None) -> str:
@@ -184,7 +188,7 @@ class PropertyContextModule:
             return response
 
         except Exception as e:
-            print(f"Error handling pricing inquiry: {str(e)}")
+            logger.error("Error handling pricing inquiry: %s", e)
             return "I apologize, but I encountered an error processing your pricing inquiry. Please try again."
 
     async def handle_booking(self, message: str, context: Optional[Dict] = None) -> str:
@@ -218,7 +222,7 @@ class PropertyContextModule:
             return response
 
         except Exception as e:
-            print(f"Error handling booking request: {str(e)}")
+            logger.error("Error handling booking request: %s", e)
             return "I apologize, but I encountered an error processing your booking request. Please try again."
 
     async def _get_area_insights(self, location: Dict) -> Dict:
@@ -239,7 +243,7 @@ class PropertyContextModule:
             return insights if isinstance(insights, dict) else {}
 
         except Exception as e:
-            print(f"Error getting area insights: {str(e)}")
+            logger.error("Error getting area insights: %s", e)
             return {}
 
     def _summarize_similar_properties(self, properties: List[Dict]) -> Dict:
@@ -316,7 +320,7 @@ class PropertyContextModule:
                     data = await response.json()
                     return data if isinstance(data, list) else []
         except Exception as e:
-            print(f"Error fetching similar properties: {str(e)}")
+            logger.error("Error fetching similar properties: %s", e)
             return []
 
     def _calculate_avg_price_per_sqft(self, properties: List[Dict]) -> Optional[float]:
@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database.models import GeneralConversation, PropertyConversation
+from ..database.models import GeneralConversation, GeneralMessage, PropertyConversation
+from .context_manager import conversation_cache, conversation_list_cache, history_page_cache
 
 
 class SessionManager:
@@ -14,7 +15,7 @@ class SessionManager:
         # Archived property conversations are kept indefinitely
         # self.completed_conversation_archive = timedelta(days=90)  # Removing this
 
-    async def cleanup_expired_sessions(self, db: Session) -> int:
+    async def cleanup_expired_sessions(self, db: AsyncSession) -> int:
         """
         Clean up expired sessions based on user type and conversation status.
         Returns the number of sessions cleaned up.
@@ -24,36 +25,40 @@ class SessionManager:
 
         # Clean up anonymous general conversations
         anonymous_expiry = now - self.anonymous_session_expiry
-        expired_anonymous = (
-            db.query(GeneralConversation)
-            .filter(
+        result = await db.execute(
+            select(GeneralConversation).where(
                 and_(
                     GeneralConversation.is_logged_in == False,  # noqa: E712 sqlqry
                     GeneralConversation.last_message_at < anonymous_expiry,
                 )
             )
-            .all()
         )
+        expired_anonymous = result.scalars().all()
 
         for conv in expired_anonymous:
-            db.delete(conv)
+            await db.delete(conv)
+            conversation_cache.invalidate((GeneralConversation.__tablename__, conv.session_id))
+            history_page_cache.invalidate((GeneralMessage.__tablename__, conv.id))
+            conversation_list_cache.invalidate(conv.user_id)
             cleaned_count += 1
 
         # Clean up old authenticated general conversations
         auth_expiry = now - self.authenticated_session_expiry
-        expired_auth = (
-            db.query(GeneralConversation)
-            .filter(
+        result = await db.execute(
+            select(GeneralConversation).where(
                 and_(
                     GeneralConversation.is_logged_in == True,  # noqa: E712 sqlqry  
                     GeneralConversation.last_message_at < auth_expiry,
                 )
             )
-            .all()
         )
+        expired_auth = result.scalars().all()
 
         for conv in expired_auth:
-            db.delete(conv)
+            await db.delete(conv)
+            conversation_cache.invalidate((GeneralConversation.__tablename__, conv.session_id))
+            history_page_cache.invalidate((GeneralMessage.__tablename__, conv.id))
+            conversation_list_cache.invalidate(conv.user_id)
             cleaned_count += 1
 
         # Property conversations are no longer automatically archived
@@ -61,9 +66,9 @@ class SessionManager:
         # Once closed, they will be kept indefinitely for record-keeping
 
         try:
-            db.commit()
+            await db.commit()
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise Exception(f"Failed to cleanup sessions: {str(e)}")
 
         return cleaned_count
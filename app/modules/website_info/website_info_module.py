@@ -1,8 +1,11 @@
+import logging
 import json
 import os
 from typing import Dict, Optional
 from ..llm import LLMClient
 
+logger = logging.getLogger(__name__)
+
 
 class WebsiteInfoModule:
     """Module for handling website functionality and company information queries."""
@@ -56,7 +59,7 @@ class WebsiteInfoModule:
         try:
             # Check if we have the data
             if not self._website_features:
-                print("Warning: No website features data available")
+                logger.warning("No website features data available")
                 return ("I apologize, but I don't have information about our website features at the moment." 
                         "Please contact our support team for assistance.")
             
@@ -87,7 +90,7 @@ class WebsiteInfoModule:
 
             # Format the prompt with the user's message
             formatted_prompt = prompt.format(message)
-            print(f"Debug - Formatted prompt length: {len(formatted_prompt)}")
+            logger.debug("Formatted prompt length: %s", len(formatted_prompt))
             
             # Generate response using LLM
             try:
@@ -98,15 +101,13 @@ class WebsiteInfoModule:
                 )
                 return response
             except Exception as llm_error:
-                print(f"LLM error in website functionality: {str(llm_error)}")
+                logger.error("LLM error in website functionality: %s", llm_error)
                 # Make sure to return an error message that contains "apologize" and "error"
                 return ("I apologize, but I encountered an error processing your question about our website. " 
                         "Please try again or contact our support team for assistance.")
 
         except Exception as e:
-            import traceback
-            print(f"Error handling website functionality query: {str(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error handling website functionality query: %s", e)
             return ("I apologize, but I encountered an error processing your question about our website. " 
                     "Please try again or contact our support team for assistance.")
 
@@ -115,7 +116,7 @@ class WebsiteInfoModule:
         try:
             # Check if we have the data
             if not self._company_info:
-                print("Warning: No company information data available")
+                logger.warning("No company information data available")
                 return "I apologize, but I don't have information about our company at the moment. Please visit our website for more information."
             
             # Create a simplified version of the company information
@@ -147,7 +148,7 @@ class WebsiteInfoModule:
 
             # Format the prompt with the user's message
             formatted_prompt = prompt.format(message)
-            print(f"Debug - Formatted company info prompt length: {len(formatted_prompt)}")
+            logger.debug("Formatted company info prompt length: %s", len(formatted_prompt))
             
             # Generate response using LLM
             try:
@@ -158,14 +159,12 @@ class WebsiteInfoModule:
                 )
                 return response
             except Exception as llm_error:
-                print(f"LLM error in company information: {str(llm_error)}")
+                logger.error("LLM error in company information: %s", llm_error)
                 # Make sure to return an error message that contains "apologize" and "error"
                 return ("I apologize, but I encountered an error processing your question about our company. " 
                         "Please try again or visit our website for more information.")
 
         except Exception as e:
-            import traceback
-            print(f"Error handling company information query: {str(e)}")
-            print(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error handling company information query: %s", e)
             return ("I apologize, but I encountered an error processing your question about our company. " 
                     "Please try again or visit our website for more information.")
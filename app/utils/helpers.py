@@ -1,4 +1,6 @@
 from datetime import datetime, timedelta
+import os
+import time
 
 def format_datetime(dt: datetime) -> str:
     """Format datetime to string."""
@@ -20,4 +22,19 @@ def sanitize_input(text: str) -> str:
 
 def format_price(price: float) -> str:
     """Format price with currency."""
-    return f"${price:,.2f}" 
\ No newline at end of file
+    return f"${price:,.2f}"
+
+def new_session_id() -> str:
+    """Generate a time-ordered (version 7) UUID string for a new chat session.
+
+    Unlike uuid4, consecutive IDs sort by creation time, so inserts into the
+    session_id indexes land on the rightmost page instead of scattering.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Stamp version 7 and the RFC 4122 variant over the random bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    # Format directly rather than building a uuid.UUID just to stringify it
+    digits = f"{value:032x}"
+    return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
@@ -1,4 +1,5 @@
 import logging
+from app.config import settings
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -39,7 +40,8 @@ def setup_logging(log_level=logging.INFO):
 
     # Get SQL Alchemy logger
     sql_logger = logging.getLogger('sqlalchemy.engine')
-    sql_logger.setLevel(logging.INFO)  # Set to logging.DEBUG for query logging
+    # INFO logs every statement, so only when SQL_ECHO asks for it
+    sql_logger.setLevel(logging.INFO if settings.sql_echo else logging.WARNING)
     sql_logger.addHandler(db_handler)
 
     # Add handlers to root logger
@@ -0,0 +1,32 @@
+"""add composite (user_id, last_message_at, id) indexes on conversation tables
+
+Revision ID: add_conversation_listing_indexes
+Revises: make_session_id_not_null
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'add_conversation_listing_indexes'
+down_revision = 'make_session_id_not_null'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Backs keyset pagination of a user's conversations, most recent first
+    op.create_index(
+        'ix_general_conversations_user_id_last_message_at',
+        'general_conversations',
+        ['user_id', sa.text('last_message_at DESC'), sa.text('id DESC')],
+    )
+    op.create_index(
+        'ix_property_conversations_user_id_last_message_at',
+        'property_conversations',
+        ['user_id', sa.text('last_message_at DESC'), sa.text('id DESC')],
+    )
+
+def downgrade():
+    op.drop_index('ix_property_conversations_user_id_last_message_at', table_name='property_conversations')
+    op.drop_index('ix_general_conversations_user_id_last_message_at', table_name='general_conversations')
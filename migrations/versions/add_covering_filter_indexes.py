@@ -0,0 +1,70 @@
+"""add composite indexes for the role, status and counterpart filters
+
+Revision ID: add_covering_filter_indexes
+Revises: add_endpoint_filter_indexes
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'add_covering_filter_indexes'
+down_revision = 'add_endpoint_filter_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # CONCURRENTLY can't run inside a transaction, but keeps the tables writable
+    with op.get_context().autocommit_block():
+        # Backs listings filtered by role and status
+        op.create_index(
+            'ix_property_conversations_user_id_role_status',
+            'property_conversations',
+            ['user_id', 'role', 'conversation_status'],
+            postgresql_concurrently=True,
+        )
+        # Lets the counterpart lookup answer from the index alone; supersedes
+        # the (external_id, service_name) index
+        op.create_index(
+            'ix_external_references_external_id_service_name_conversation',
+            'external_references',
+            ['external_id', 'service_name', 'property_conversation_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_external_references_external_id_service_name',
+            table_name='external_references',
+            postgresql_concurrently=True,
+        )
+        # Backs a seller's question list filtered by status, newest first
+        op.create_index(
+            'ix_property_questions_seller_id_status_created_at',
+            'property_questions',
+            ['seller_id', 'status', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_property_questions_seller_id_status_created_at',
+            table_name='property_questions',
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_external_references_external_id_service_name',
+            'external_references',
+            ['external_id', 'service_name'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_external_references_external_id_service_name_conversation',
+            table_name='external_references',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_property_conversations_user_id_role_status',
+            table_name='property_conversations',
+            postgresql_concurrently=True,
+        )
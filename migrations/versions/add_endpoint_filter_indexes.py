@@ -0,0 +1,54 @@
+"""add indexes for the history, listing and seller question filters
+
+Revision ID: add_endpoint_filter_indexes
+Revises: add_conversation_listing_indexes
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'add_endpoint_filter_indexes'
+down_revision = 'add_conversation_listing_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Backs the history endpoint's pages, which walk back by message id
+    op.create_index(
+        'ix_general_messages_conversation_id_id',
+        'general_messages',
+        ['conversation_id', 'id'],
+    )
+    op.create_index(
+        'ix_property_messages_conversation_id_id',
+        'property_messages',
+        ['conversation_id', 'id'],
+    )
+    # Smaller index for listings filtered to open (active/pending) conversations
+    op.create_index(
+        'ix_property_conversations_user_id_last_message_at_open',
+        'property_conversations',
+        ['user_id', sa.text('last_message_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("conversation_status != 'closed'"),
+    )
+    # Backs the lookup of conversations a user is the counterpart in
+    op.create_index(
+        'ix_external_references_external_id_service_name',
+        'external_references',
+        ['external_id', 'service_name'],
+    )
+    # Backs a seller's question list, newest first
+    op.create_index(
+        'ix_property_questions_seller_id_created_at',
+        'property_questions',
+        ['seller_id', sa.text('created_at DESC')],
+    )
+
+def downgrade():
+    op.drop_index('ix_property_questions_seller_id_created_at', table_name='property_questions')
+    op.drop_index('ix_external_references_external_id_service_name', table_name='external_references')
+    op.drop_index('ix_property_conversations_user_id_last_message_at_open', table_name='property_conversations')
+    op.drop_index('ix_property_messages_conversation_id_id', table_name='property_messages')
+    op.drop_index('ix_general_messages_conversation_id_id', table_name='general_messages')
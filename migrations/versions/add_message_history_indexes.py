@@ -0,0 +1,32 @@
+"""add composite (conversation_id, timestamp) indexes on message tables
+
+Revision ID: add_message_history_indexes
+Revises: add_property_questions
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'add_message_history_indexes'
+down_revision = 'add_property_questions'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Backs the "most recent N messages for a conversation" history lookup
+    op.create_index(
+        'ix_general_messages_conversation_id_timestamp',
+        'general_messages',
+        ['conversation_id', sa.text('timestamp DESC')],
+    )
+    op.create_index(
+        'ix_property_messages_conversation_id_timestamp',
+        'property_messages',
+        ['conversation_id', sa.text('timestamp DESC')],
+    )
+
+def downgrade():
+    op.drop_index('ix_property_messages_conversation_id_timestamp', table_name='property_messages')
+    op.drop_index('ix_general_messages_conversation_id_timestamp', table_name='general_messages')
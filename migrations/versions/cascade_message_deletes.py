@@ -0,0 +1,38 @@
+"""delete messages with their conversation in the database
+
+Revision ID: cascade_message_deletes
+Revises: store_json_columns_as_jsonb
+Create Date: 2026-10-17 03:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = 'cascade_message_deletes'
+down_revision = 'store_json_columns_as_jsonb'
+branch_labels = None
+depends_on = None
+
+# (message table, conversation table)
+TABLES = (
+    ('general_messages', 'general_conversations'),
+    ('property_messages', 'property_conversations'),
+)
+
+
+def _recreate_foreign_keys(ondelete):
+    for table, referent in TABLES:
+        name = f'{table}_conversation_id_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(
+            name, table, referent, ['conversation_id'], ['id'], ondelete=ondelete,
+        )
+
+
+def upgrade():
+    # The messages relationships are write-only, so the ORM no longer loads
+    # a conversation's messages to delete them one by one
+    _recreate_foreign_keys('CASCADE')
+
+def downgrade():
+    _recreate_foreign_keys(None)
@@ -0,0 +1,45 @@
+"""drop single-column message indexes covered by the composite ones
+
+Revision ID: drop_redundant_message_indexes
+Revises: store_role_and_status_as_smallint
+Create Date: 2026-10-17 01:30:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision = 'drop_redundant_message_indexes'
+down_revision = 'store_role_and_status_as_smallint'
+branch_labels = None
+depends_on = None
+
+TABLES = ('general_messages', 'property_messages')
+
+
+def upgrade():
+    # conversation_id lookups (history, cascading deletes) use the
+    # (conversation_id, timestamp) and (conversation_id, id) indexes, and
+    # nothing filters on timestamp alone; dropping these saves two index
+    # writes per inserted message
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(
+                f'ix_{table}_conversation_id', table_name=table, if_exists=True,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f'ix_{table}_timestamp', table_name=table, if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(
+                f'ix_{table}_timestamp', table, ['timestamp'],
+                postgresql_concurrently=True,
+            )
+            op.create_index(
+                f'ix_{table}_conversation_id', table, ['conversation_id'],
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,38 @@
+"""make conversation context columns NOT NULL with an empty-object default
+
+Revision ID: make_context_columns_not_null
+Revises: add_message_history_indexes
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'make_context_columns_not_null'
+down_revision = 'add_message_history_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Backfill before tightening so existing rows satisfy the constraint
+    op.execute("UPDATE general_conversations SET context = '{}' WHERE context IS NULL")
+    op.execute("UPDATE property_conversations SET property_context = '{}' WHERE property_context IS NULL")
+    op.alter_column(
+        'general_conversations', 'context',
+        existing_type=sa.JSON(), nullable=False, server_default=sa.text("'{}'"),
+    )
+    op.alter_column(
+        'property_conversations', 'property_context',
+        existing_type=sa.JSON(), nullable=False, server_default=sa.text("'{}'"),
+    )
+
+def downgrade():
+    op.alter_column(
+        'property_conversations', 'property_context',
+        existing_type=sa.JSON(), nullable=True, server_default=None,
+    )
+    op.alter_column(
+        'general_conversations', 'context',
+        existing_type=sa.JSON(), nullable=True, server_default=None,
+    )
@@ -0,0 +1,38 @@
+"""make conversation session_id NOT NULL
+
+Revision ID: make_session_id_not_null
+Revises: make_context_columns_not_null
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'make_session_id_not_null'
+down_revision = 'make_context_columns_not_null'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Rows without a session can never be looked up; give them a unique placeholder
+    op.execute("UPDATE general_conversations SET session_id = 'legacy-' || id WHERE session_id IS NULL")
+    op.execute("UPDATE property_conversations SET session_id = 'legacy-' || id WHERE session_id IS NULL")
+    op.alter_column(
+        'general_conversations', 'session_id',
+        existing_type=sa.String(length=255), nullable=False,
+    )
+    op.alter_column(
+        'property_conversations', 'session_id',
+        existing_type=sa.String(length=255), nullable=False,
+    )
+
+def downgrade():
+    op.alter_column(
+        'property_conversations', 'session_id',
+        existing_type=sa.String(length=255), nullable=True,
+    )
+    op.alter_column(
+        'general_conversations', 'session_id',
+        existing_type=sa.String(length=255), nullable=True,
+    )
@@ -0,0 +1,48 @@
+"""index external reference conversation ids only where set
+
+Revision ID: partial_external_reference_indexes
+Revises: cascade_message_deletes
+Create Date: 2026-10-17 04:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'partial_external_reference_indexes'
+down_revision = 'cascade_message_deletes'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('general_conversation_id', 'property_conversation_id')
+
+
+def _recreate_indexes(partial):
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            name = f'ix_external_references_{column}'
+            op.drop_index(name, table_name='external_references', postgresql_concurrently=True)
+            op.create_index(
+                name,
+                'external_references',
+                [column],
+                postgresql_where=sa.text(f'{column} IS NOT NULL') if partial else None,
+                postgresql_concurrently=True,
+            )
+
+
+def upgrade():
+    # A row references one conversation type, so each full index is half NULLs
+    _recreate_indexes(partial=True)
+    # Enforce in the database what ExternalReference.__init__ checks in Python
+    op.create_check_constraint(
+        'ck_external_references_one_conversation',
+        'external_references',
+        'general_conversation_id IS NULL OR property_conversation_id IS NULL',
+    )
+
+def downgrade():
+    op.drop_constraint(
+        'ck_external_references_one_conversation', 'external_references', type_='check'
+    )
+    _recreate_indexes(partial=False)
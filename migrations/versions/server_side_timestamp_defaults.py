@@ -0,0 +1,36 @@
+"""fill insert timestamps on the server
+
+Revision ID: server_side_timestamp_defaults
+Revises: partial_external_reference_indexes
+Create Date: 2026-10-17 05:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'server_side_timestamp_defaults'
+down_revision = 'partial_external_reference_indexes'
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    ('general_conversations', 'started_at'),
+    ('general_conversations', 'last_message_at'),
+    ('general_messages', 'timestamp'),
+    ('property_conversations', 'started_at'),
+    ('property_conversations', 'last_message_at'),
+    ('property_messages', 'timestamp'),
+    ('external_references', 'last_synced'),
+    ('property_questions', 'created_at'),
+)
+
+
+def upgrade():
+    # Naive UTC, like the datetime.utcnow() values written so far
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=sa.text("timezone('utc', now())"))
+
+def downgrade():
+    for table, column in COLUMNS:
+        op.alter_column(table, column, server_default=None)
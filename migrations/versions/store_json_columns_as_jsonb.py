@@ -0,0 +1,47 @@
+"""store JSON document columns as JSONB
+
+Revision ID: store_json_columns_as_jsonb
+Revises: drop_redundant_message_indexes
+Create Date: 2026-10-17 02:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic
+revision = 'store_json_columns_as_jsonb'
+down_revision = 'drop_redundant_message_indexes'
+branch_labels = None
+depends_on = None
+
+# (table, column, server default)
+COLUMNS = (
+    ('general_conversations', 'context', "'{}'"),
+    ('property_conversations', 'property_context', "'{}'"),
+    ('general_messages', 'message_metadata', None),
+    ('property_messages', 'message_metadata', None),
+    ('external_references', 'reference_metadata', None),
+)
+
+
+def _convert(type_, cast):
+    for table, column, default in COLUMNS:
+        # The default is a json literal; drop it so the type change doesn't
+        # have to cast it, then put it back for the new type
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=type_,
+            postgresql_using=f'{column}::{cast}',
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=sa.text(default))
+
+
+def upgrade():
+    _convert(JSONB(), 'jsonb')
+
+def downgrade():
+    _convert(sa.JSON(), 'json')
@@ -0,0 +1,82 @@
+"""store message roles and question status as smallint codes
+
+Revision ID: store_message_role_and_question_status_as_smallint
+Revises: server_side_timestamp_defaults
+Create Date: 2026-10-17 06:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'store_message_role_and_question_status_as_smallint'
+down_revision = 'server_side_timestamp_defaults'
+branch_labels = None
+depends_on = None
+
+# Must match the value order of the CodedString columns in app/database/models.py
+COLUMNS = (
+    ('general_messages', 'role', ('user', 'assistant', 'system')),
+    ('property_messages', 'role', ('user', 'assistant', 'system', 'buyer', 'seller')),
+    ('property_questions', 'status', ('pending', 'answered', 'expired')),
+)
+
+# Server defaults set by earlier migrations, as the stored string
+DEFAULTS = {
+    ('property_questions', 'status'): 'pending',
+}
+
+
+def _to_code(column, values):
+    cases = ' '.join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {cases} END"
+
+
+def _to_string(column, values):
+    cases = ' '.join(f"WHEN {code} THEN '{value}'" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {cases} END"
+
+
+def upgrade():
+    connection = op.get_bind()
+    for table, column, values in COLUMNS:
+        # Message roles are nullable, so an unknown value would silently
+        # become NULL; refuse to convert instead
+        unknown = connection.execute(
+            sa.text(
+                f"SELECT DISTINCT {column} FROM {table} "
+                f"WHERE {column} IS NOT NULL AND {column} NOT IN :values"
+            ).bindparams(sa.bindparam('values', expanding=True)),
+            {'values': list(values)},
+        ).scalars().all()
+        if unknown:
+            raise RuntimeError(f"{table}.{column} has unmapped values: {', '.join(unknown)}")
+
+        # A string default can't be cast to smallint; drop it for the type
+        # change and put it back as its code
+        default = DEFAULTS.get((table, column))
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=sa.SmallInteger(),
+            postgresql_using=_to_code(column, values),
+        )
+        if default is not None:
+            op.alter_column(
+                table, column, server_default=sa.text(str(values.index(default) + 1))
+            )
+
+
+def downgrade():
+    for table, column, values in COLUMNS:
+        default = DEFAULTS.get((table, column))
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table, column,
+            type_=sa.String(50),
+            postgresql_using=_to_string(column, values),
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=default)
@@ -0,0 +1,76 @@
+"""store property conversation role and status as smallint codes
+
+Revision ID: store_role_and_status_as_smallint
+Revises: add_covering_filter_indexes
+Create Date: 2026-10-17 00:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = 'store_role_and_status_as_smallint'
+down_revision = 'add_covering_filter_indexes'
+branch_labels = None
+depends_on = None
+
+# Must match the value order of the CodedString columns in app/database/models.py
+ROLES = ('buyer', 'seller')
+STATUSES = ('active', 'pending', 'closed')
+
+
+def _to_code(column, values):
+    cases = ' '.join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {cases} END"
+
+
+def _to_string(column, values):
+    cases = ' '.join(f"WHEN {code} THEN '{value}'" for code, value in enumerate(values, start=1))
+    return f"CASE {column} {cases} END"
+
+
+def upgrade():
+    # The partial index's predicate compares against the old string value
+    op.drop_index(
+        'ix_property_conversations_user_id_last_message_at_open',
+        table_name='property_conversations',
+    )
+    # Unknown strings map to NULL and fail the NOT NULL check, aborting the migration
+    op.alter_column(
+        'property_conversations', 'role',
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_code('role', ROLES),
+    )
+    op.alter_column(
+        'property_conversations', 'conversation_status',
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_code('conversation_status', STATUSES),
+    )
+    op.create_index(
+        'ix_property_conversations_user_id_last_message_at_open',
+        'property_conversations',
+        ['user_id', sa.text('last_message_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text(f"conversation_status != {STATUSES.index('closed') + 1}"),
+    )
+
+def downgrade():
+    op.drop_index(
+        'ix_property_conversations_user_id_last_message_at_open',
+        table_name='property_conversations',
+    )
+    op.alter_column(
+        'property_conversations', 'conversation_status',
+        type_=sa.String(50),
+        postgresql_using=_to_string('conversation_status', STATUSES),
+    )
+    op.alter_column(
+        'property_conversations', 'role',
+        type_=sa.String(50),
+        postgresql_using=_to_string('role', ROLES),
+    )
+    op.create_index(
+        'ix_property_conversations_user_id_last_message_at_open',
+        'property_conversations',
+        ['user_id', sa.text('last_message_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("conversation_status != 'closed'"),
+    )
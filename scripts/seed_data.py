@@ -60,8 +60,7 @@ def seed_database():
             ),
         ]
 
-        for message in general_messages:
-            db.add(message)
+        db.add_all(general_messages)
 
         # Create sample buyer-seller conversations
         buyer_conv = PropertyConversation(
@@ -128,8 +127,7 @@ def seed_database():
             ),
         ]
 
-        for message in buyer_messages:
-            db.add(message)
+        db.add_all(buyer_messages)
 
         # Create sample property messages for seller conversation
         seller_messages = [
@@ -154,8 +152,7 @@ def seed_database():
             ),
         ]
 
-        for message in seller_messages:
-            db.add(message)
+        db.add_all(seller_messages)
 
         # Create sample external references
         external_refs = [
@@ -182,8 +179,7 @@ def seed_database():
             ),
         ]
 
-        for ref in external_refs:
-            db.add(ref)
+        db.add_all(external_refs)
 
         db.commit()
         print("Sample data has been seeded successfully!")
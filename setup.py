@@ -10,7 +10,10 @@ setup(
         "uvicorn",
         "sqlalchemy",
         "psycopg2-binary",
+        "asyncpg",
         "pydantic",
+        "orjson",
+        "httpx",
         "pydantic-settings",
         "python-dotenv",
         "openai",
@@ -1,27 +1,54 @@
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
-from sqlalchemy.orm import Session
-from fastapi import HTTPException
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import BackgroundTasks, HTTPException
+import json
 import uuid
 
-from app.api.controllers import ChatController
+from app.api.controllers import ChatController, get_chat_controller
 from app.database.models import (
     GeneralConversation,
+    GeneralMessage,
     PropertyConversation,
 )
 from app.api.routes import Role
+from app.modules.intent_classification import Intent
+from app.modules.context_manager import ConversationCache, ConversationHistoryCache
+
+
+def _mock_session():
+    session = MagicMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
+    session.add = MagicMock()
+    session.refresh = AsyncMock()
+    session.rollback = AsyncMock()
+    session.merge = AsyncMock(side_effect=lambda instance, load=True: instance)
+    # Loaded objects stay in the session, unchanged after commit
+    session.__contains__.return_value = True
+    session.is_modified = MagicMock(return_value=False)
+
+    @asynccontextmanager
+    async def begin():
+        # Behave like AsyncSession.begin(): commit on exit, roll back on error
+        try:
+            yield
+        except BaseException:
+            await session.rollback()
+            raise
+        await session.commit()
+
+    session.begin = begin
+    return session
 
 
 @pytest.fixture
 def db_session():
     """Create a mock database session."""
-    session = MagicMock(spec=Session)
-    session.commit = MagicMock()
-    session.add = MagicMock()
-    session.refresh = MagicMock()
-    session.rollback = MagicMock()
-    return session
+    return _mock_session()
 
 
 @pytest.fixture
@@ -49,6 +76,10 @@ def chat_controller():
     # Set the mocked session manager
     controller.session_manager = mock_session_manager
 
+    # Isolate the history window and conversation cache from other tests
+    controller.history_cache = ConversationHistoryCache()
+    controller.conversation_cache = ConversationCache()
+
     return controller
 
 
@@ -72,7 +103,7 @@ async def test_handle_general_chat_new_conversation(db_session, chat_controller)
     mock_conversation.last_message_at = datetime.utcnow()  # Use real datetime
 
     # Mock database query
-    db_session.query.return_value.filter.return_value.first.return_value = (
+    db_session.execute.return_value.scalar_one_or_none.return_value = (
         mock_conversation
     )
 
@@ -107,7 +138,7 @@ async def test_handle_general_chat_existing_conversation(db_session, chat_contro
     existing_conv.messages = []
 
     # Mock database query
-    db_session.query.return_value.filter.return_value.first.return_value = existing_conv
+    db_session.execute.return_value.scalar_one_or_none.return_value = existing_conv
 
     # Mock message router response
     chat_controller.message_router.route_message.return_value = {
@@ -134,13 +165,9 @@ async def test_handle_general_chat_existing_conversation(db_session, chat_contro
 @pytest.mark.asyncio
 async def test_handle_property_chat_new_conversation(db_session, chat_controller):
     """Test handling a new property chat conversation."""
-    # Mock the message router to return a property inquiry intent
-    chat_controller.message_router.route_message = AsyncMock(
-        return_value={
-            "intent": "property_inquiry",
-            "response": None,
-            "context": {}
-        }
+    # Mock the message router to classify a property inquiry intent
+    chat_controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.PROPERTY_INQUIRY
     )
 
     # Mock the property context module
@@ -161,7 +188,7 @@ async def test_handle_property_chat_new_conversation(db_session, chat_controller
     mock_conversation.conversation_status = "active"
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_conversation,  # For conversation lookup
         None,  # For duplicate message check
     ]
@@ -190,16 +217,51 @@ async def test_handle_property_chat_new_conversation(db_session, chat_controller
     assert response.intent == "property_inquiry"
 
 
+@pytest.mark.asyncio
+async def test_handle_property_chat_dispatches_booking_requests(db_session, chat_controller):
+    """Test that availability and booking requests reach the booking handler."""
+    chat_controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.AVAILABILITY_AND_BOOKING_REQUEST
+    )
+    chat_controller.property_context.handle_booking = AsyncMock(
+        return_value="Viewings are available on Saturday morning."
+    )
+    chat_controller.property_context.handle_inquiry = AsyncMock()
+
+    mock_conversation = MagicMock(spec=PropertyConversation)
+    mock_conversation.id = 1
+    mock_conversation.session_id = "test_session"
+    mock_conversation.property_context = {}
+    mock_conversation.conversation_status = "active"
+    db_session.execute.return_value.scalar_one_or_none.return_value = mock_conversation
+
+    response = await chat_controller.handle_property_chat(
+        message="Can I view the house this weekend?",
+        user_id="test_user",
+        property_id="test_property",
+        role=Role.BUYER,
+        counterpart_id="test_seller",
+        session_id="test_session",
+        db=db_session,
+    )
+
+    assert response.message == "Viewings are available on Saturday morning."
+    assert response.intent == "availability_and_booking_request"
+    chat_controller.property_context.handle_booking.assert_called_once_with(
+        message="Can I view the house this weekend?",
+        context={"property_id": "test_property"},
+    )
+    chat_controller.property_context.handle_inquiry.assert_not_called()
+    # Nothing needs the user message's ID, so it is inserted with the reply at commit
+    db_session.flush.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_handle_property_chat_existing_conversation(db_session, chat_controller):
     """Test handling an existing property chat conversation."""
-    # Mock the message router to return a negotiation intent
-    chat_controller.message_router.route_message = AsyncMock(
-        return_value={
-            "intent": "negotiation",
-            "response": None,
-            "context": {}
-        }
+    # Mock the message router to classify a negotiation intent
+    chat_controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.NEGOTIATION
     )
 
     # Mock the seller-buyer communication module
@@ -209,6 +271,9 @@ async def test_handle_property_chat_existing_conversation(db_session, chat_contr
     chat_controller.seller_buyer_communication.notify_counterpart = AsyncMock(
         return_value=True
     )
+    chat_controller.seller_buyer_communication.format_message_for_counterpart = AsyncMock(
+        return_value="The buyer would like to make an offer."
+    )
 
     # Create a mock existing conversation
     mock_conversation = MagicMock(spec=PropertyConversation)
@@ -223,7 +288,7 @@ async def test_handle_property_chat_existing_conversation(db_session, chat_contr
     mock_conversation.conversation_status = "active"
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_conversation,  # For conversation lookup
         None,  # For duplicate message check
     ]
@@ -256,13 +321,9 @@ async def test_handle_property_chat_existing_conversation(db_session, chat_contr
 @pytest.mark.asyncio
 async def test_handle_property_chat_notification(db_session, chat_controller):
     """Test that notifications are sent during property chat."""
-    # Mock the message router to return a buyer_seller_communication intent
-    chat_controller.message_router.route_message = AsyncMock(
-        return_value={
-            "intent": "buyer_seller_communication",
-            "response": None,
-            "context": {}
-        }
+    # Mock the message router to classify a buyer_seller_communication intent
+    chat_controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.BUYER_SELLER_COMMUNICATION
     )
 
     # Mock the seller-buyer communication module
@@ -272,6 +333,9 @@ async def test_handle_property_chat_notification(db_session, chat_controller):
     chat_controller.seller_buyer_communication.notify_counterpart = AsyncMock(
         return_value=True
     )
+    chat_controller.seller_buyer_communication.format_message_for_counterpart = AsyncMock(
+        return_value="The buyer would like to make an offer."
+    )
 
     # Create a mock existing conversation
     mock_conversation = MagicMock(spec=PropertyConversation)
@@ -286,7 +350,7 @@ async def test_handle_property_chat_notification(db_session, chat_controller):
     mock_conversation.conversation_status = "active"
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_conversation,  # For conversation lookup
         None,  # For duplicate message check
     ]
@@ -314,6 +378,58 @@ async def test_handle_property_chat_notification(db_session, chat_controller):
     assert response.session_id == "test_session"
     assert response.intent == "buyer_seller_communication"
     chat_controller.seller_buyer_communication.notify_counterpart.assert_called_once()
+    # The counterpart copy is formatted alongside the reply, not again inside notify
+    notify_kwargs = chat_controller.seller_buyer_communication.notify_counterpart.call_args.kwargs
+    assert notify_kwargs["formatted_message"] == "The buyer would like to make an offer."
+    db_session.flush.assert_awaited_once()
+    # The session travels as its own argument, keeping the context serializable
+    handle_kwargs = chat_controller.seller_buyer_communication.handle_message.call_args.kwargs
+    assert handle_kwargs["db"] is db_session
+    assert "db" not in handle_kwargs["context"]
+
+
+@pytest.mark.asyncio
+async def test_handle_property_chat_defers_notification_to_background(db_session, chat_controller):
+    """Test that the counterpart is notified after the response when background tasks are given."""
+    chat_controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.NEGOTIATION
+    )
+    chat_controller.seller_buyer_communication.handle_message = AsyncMock(
+        return_value="I'll forward your offer to the seller."
+    )
+    chat_controller.seller_buyer_communication.format_message_for_counterpart = AsyncMock(
+        return_value="The buyer would like to make an offer."
+    )
+    chat_controller.seller_buyer_communication.notify_counterpart = AsyncMock()
+
+    mock_conversation = MagicMock(spec=PropertyConversation)
+    mock_conversation.id = 1
+    mock_conversation.session_id = "test_session"
+    mock_conversation.property_context = {}
+    mock_conversation.conversation_status = "active"
+    mock_conversation.last_message_at = datetime.utcnow()
+    db_session.execute.return_value.scalar_one_or_none.return_value = mock_conversation
+    db_session.execute.return_value.scalars.return_value.all.return_value = []
+
+    background_tasks = BackgroundTasks()
+    response = await chat_controller.handle_property_chat(
+        message="I'd like to make an offer of $450,000",
+        user_id="test_buyer",
+        property_id="test_property",
+        role=Role.BUYER,
+        counterpart_id="test_seller",
+        session_id="test_session",
+        db=db_session,
+        background_tasks=background_tasks,
+    )
+
+    assert response.message == "I'll forward your offer to the seller."
+    chat_controller.seller_buyer_communication.notify_counterpart.assert_not_called()
+    assert len(background_tasks.tasks) == 1
+    task = background_tasks.tasks[0]
+    assert task.func == chat_controller.seller_buyer_communication.notify_counterpart_in_background
+    assert task.kwargs["conversation_id"] == 1
+    assert task.kwargs["formatted_message"] == "The buyer would like to make an offer."
 
 
 @pytest.mark.asyncio
@@ -332,7 +448,7 @@ async def test_handle_property_chat_error(db_session, chat_controller):
     mock_conversation.counterpart_id = "test_seller"
 
     # Mock database to return the conversation
-    db_session.query.return_value.filter.return_value.first.return_value = (
+    db_session.execute.return_value.scalar_one_or_none.return_value = (
         mock_conversation
     )
 
@@ -361,7 +477,7 @@ async def test_handle_general_chat_error(db_session, chat_controller):
     mock_conversation = MagicMock(spec=GeneralConversation)
     mock_conversation.is_logged_in = True  # Simulate authenticated user
     mock_conversation.last_message_at = datetime.utcnow()
-    db_session.query.return_value.filter.return_value.first.return_value = (
+    db_session.execute.return_value.scalar_one_or_none.return_value = (
         mock_conversation
     )
 
@@ -381,6 +497,27 @@ async def test_handle_general_chat_error(db_session, chat_controller):
     assert "Database error" in str(exc_info.value.detail)
 
 
+@pytest.mark.asyncio
+async def test_handle_general_chat_expired_login_rolls_back_with_401(db_session, chat_controller):
+    """Test that an expired authenticated session is reported as 401, not wrapped in a 500."""
+    mock_conversation = MagicMock(spec=GeneralConversation)
+    mock_conversation.is_logged_in = True
+    db_session.execute.return_value.scalar_one_or_none.return_value = mock_conversation
+    chat_controller.session_manager.is_session_valid.return_value = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        await chat_controller.handle_general_chat(
+            message="Test message",
+            session_id="test_session",
+            user_id="test_user",
+            db=db_session,
+        )
+
+    assert exc_info.value.status_code == 401
+    db_session.rollback.assert_awaited_once()
+    db_session.commit.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_handle_expired_anonymous_session(db_session, chat_controller):
     """Test handling of expired anonymous session."""
@@ -405,7 +542,7 @@ async def test_handle_expired_anonymous_session(db_session, chat_controller):
     new_conv.context = {}
 
     # Set up the database mock to return the expired conversation first
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         expired_conv,
         new_conv,
     ]
@@ -421,3 +558,269 @@ async def test_handle_expired_anonymous_session(db_session, chat_controller):
     # Verify that a new session was created
     assert response.session_id != "old_session"
     assert response.session_id == new_conv.session_id
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_history_returns_oldest_first(db_session, chat_controller):
+    """Test that the bounded history query is returned in chronological order."""
+    # Rows come back newest first from the ORDER BY ... DESC LIMIT query
+    db_session.execute.return_value.all.return_value = [
+        ("assistant", "Second"),
+        ("user", "First"),
+    ]
+
+    history = await chat_controller._get_conversation_history(
+        db_session, GeneralMessage, conversation_id=1
+    )
+
+    assert history == [
+        {"role": "user", "content": "First"},
+        {"role": "assistant", "content": "Second"},
+    ]
+    db_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_history_served_from_cache(db_session, chat_controller):
+    """Test that a cached history window skips the database and tracks new turns."""
+    db_session.execute.return_value.all.return_value = [("user", "First")]
+
+    await chat_controller._get_conversation_history(db_session, GeneralMessage, conversation_id=1)
+    chat_controller.history_cache.append(
+        (GeneralMessage.__tablename__, 1),
+        {"role": "assistant", "content": "Second"},
+    )
+    history = await chat_controller._get_conversation_history(
+        db_session, GeneralMessage, conversation_id=1
+    )
+
+    assert history == [
+        {"role": "user", "content": "First"},
+        {"role": "assistant", "content": "Second"},
+    ]
+    db_session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_general_chat_reuses_cached_stateless_answer(db_session, chat_controller):
+    """Test that repeated website questions are answered without re-routing."""
+    chat_controller.message_router.route_message.return_value = {
+        "response": "You can list your property from the dashboard.",
+        "intent": "website_functionality",
+    }
+
+    conversation = MagicMock(spec=GeneralConversation)
+    conversation.id = 1
+    conversation.session_id = "test_session"
+    conversation.user_id = None
+    conversation.is_logged_in = False
+    conversation.last_message_at = datetime.utcnow()
+    conversation.context = {}
+    db_session.execute.return_value.scalar_one_or_none.return_value = conversation
+
+    first = await chat_controller.handle_general_chat(
+        message="How do I list my property?", session_id="test_session", db=db_session
+    )
+    second = await chat_controller.handle_general_chat(
+        message="how do I list my property", session_id="test_session", db=db_session
+    )
+
+    assert first.message == second.message
+    assert second.intent == "website_functionality"
+    chat_controller.message_router.route_message.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_general_chat_reuses_conversation_from_previous_turn(db_session, chat_controller):
+    """Test that a session's second turn attaches the cached conversation instead of selecting it."""
+    conversation = MagicMock(spec=GeneralConversation)
+    conversation.id = 1
+    conversation.session_id = "test_session"
+    conversation.user_id = None
+    conversation.is_logged_in = False
+    conversation.last_message_at = datetime.utcnow()
+    conversation.context = {}
+    db_session.execute.return_value.scalar_one_or_none.return_value = conversation
+    db_session.execute.return_value.all.return_value = []
+
+    await chat_controller.handle_general_chat(
+        message="Hello", session_id="test_session", db=db_session
+    )
+    db_session.execute.reset_mock()
+
+    response = await chat_controller.handle_general_chat(
+        message="Hello again", session_id="test_session", db=db_session
+    )
+
+    assert response.conversation_id == 1
+    db_session.merge.assert_awaited_once_with(conversation, load=False)
+    # The history window is cached too, so the second turn doesn't query at all
+    db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_conversation_selects_row_when_cached_instance_cannot_merge(db_session, chat_controller):
+    """Test that a cached conversation merge refuses is dropped and the row selected instead."""
+    stale = MagicMock(spec=GeneralConversation)
+    fresh = MagicMock(spec=GeneralConversation)
+    chat_controller.conversation_cache.set(("general_conversations", "test_session"), stale)
+    db_session.merge.side_effect = InvalidRequestError("merge() with load=False on a dirty instance")
+    db_session.execute.return_value.scalar_one_or_none.return_value = fresh
+
+    conversation = await chat_controller._find_conversation(db_session, GeneralConversation, "test_session")
+
+    assert conversation is fresh
+    db_session.execute.assert_awaited_once()
+    assert chat_controller.conversation_cache.get(("general_conversations", "test_session")) is None
+
+
+def test_cache_conversation_skips_instances_with_unsaved_changes(db_session, chat_controller):
+    """Test that only clean conversations held by the session are cached."""
+    conversation = MagicMock(spec=GeneralConversation)
+    conversation.session_id = "test_session"
+    key = ("general_conversations", "test_session")
+    chat_controller._cache_conversation(db_session, GeneralConversation, conversation)
+    assert chat_controller.conversation_cache.get(key) is conversation
+
+    db_session.is_modified.return_value = True
+    chat_controller._cache_conversation(db_session, GeneralConversation, conversation)
+    assert chat_controller.conversation_cache.get(key) is None
+
+    db_session.is_modified.return_value = False
+    db_session.__contains__.return_value = False  # detached, e.g. its session was closed
+    chat_controller._cache_conversation(db_session, GeneralConversation, conversation)
+    assert chat_controller.conversation_cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_handle_general_chat_persists_turn_in_one_batch(db_session, chat_controller):
+    """Test that the user and assistant messages are added together before one commit."""
+    conversation = MagicMock(spec=GeneralConversation)
+    conversation.id = 1
+    conversation.session_id = "test_session"
+    conversation.user_id = "test_user"
+    conversation.is_logged_in = True
+    conversation.last_message_at = datetime.utcnow()
+    conversation.context = {}
+    db_session.execute.return_value.scalar_one_or_none.return_value = conversation
+
+    await chat_controller.handle_general_chat(
+        message="Hello", session_id="test_session", user_id="test_user", db=db_session
+    )
+
+    db_session.add.assert_not_called()
+    db_session.add_all.assert_called_once()
+    user_message, assistant_message = db_session.add_all.call_args[0][0]
+    assert (user_message.role, user_message.content) == ("user", "Hello")
+    assert (assistant_message.role, assistant_message.content) == ("assistant", "Test response")
+    db_session.commit.assert_awaited_once()
+
+
+def test_get_chat_controller_is_a_shared_singleton():
+    """Test that the controller is built once and reuses the router's modules."""
+    controller = get_chat_controller()
+
+    assert get_chat_controller() is controller
+    assert controller.property_context is controller.message_router.property_context
+    assert (
+        controller.seller_buyer_communication
+        is controller.message_router.seller_buyer_communication
+    )
+
+
+def test_chat_controller_builds_collaborators_on_first_use():
+    """Test that constructing the controller doesn't build the routing modules."""
+    controller = ChatController()
+
+    assert "message_router" not in vars(controller)
+    assert "session_manager" not in vars(controller)
+
+    router = controller.message_router
+    assert controller.message_router is router
+    assert "property_listings_module" not in vars(router)
+
+
+@pytest.mark.asyncio
+async def test_handle_general_chat_stream_relays_chunks_then_persists(db_session, chat_controller, monkeypatch):
+    """Test that streamed chunks are relayed as SSE events before the turn is saved."""
+    async def chunks():
+        yield "Islington is "
+        yield "a great choice."
+
+    chat_controller.message_router.route_message_stream = AsyncMock(
+        return_value=("general_question", chunks())
+    )
+    conversation = MagicMock(spec=GeneralConversation)
+    conversation.id = 1
+    conversation.session_id = "test_session"
+    conversation.user_id = None
+    conversation.is_logged_in = False
+    conversation.last_message_at = datetime.utcnow()
+    conversation.context = {}
+    db_session.execute.return_value.scalar_one_or_none.return_value = conversation
+
+    # The body streams after the request's session has closed, so the turn
+    # is written through a session of its own
+    stream_session = _mock_session()
+    stream_session.get = AsyncMock(return_value=conversation)
+    stream_session.__aenter__.return_value = stream_session
+    monkeypatch.setattr("app.api.controllers.AsyncSessionLocal", lambda: stream_session)
+
+    events = await chat_controller.handle_general_chat_stream(
+        message="Where should I live?", session_id="test_session", user_id=None, db=db_session
+    )
+    # The lookup is committed before the response is returned
+    db_session.commit.assert_awaited_once()
+    stream_session.commit.assert_not_awaited()
+
+    payloads = [json.loads(event[len("data: "):]) async for event in events]
+
+    assert payloads[:2] == [
+        {"type": "chunk", "content": "Islington is "},
+        {"type": "chunk", "content": "a great choice."},
+    ]
+    assert payloads[2] == {
+        "type": "done",
+        "conversation_id": 1,
+        "session_id": "test_session",
+        "intent": "general_question",
+    }
+    stream_session.get.assert_awaited_once_with(GeneralConversation, 1)
+    _, assistant_message = stream_session.add_all.call_args[0][0]
+    assert assistant_message.content == "Islington is a great choice."
+    stream_session.commit.assert_awaited_once()
+    stream_session.__aexit__.assert_awaited_once()
+    db_session.add_all.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_general_conversation_recovers_from_insert_conflict(db_session, chat_controller):
+    """Test that losing an insert race returns the conversation the other request created."""
+    existing = MagicMock(spec=GeneralConversation)
+    lookup, conflicting_insert, reread = MagicMock(), MagicMock(), MagicMock()
+    lookup.scalar_one_or_none.return_value = None
+    conflicting_insert.scalar_one_or_none.return_value = None  # ON CONFLICT DO NOTHING
+    reread.scalar_one.return_value = existing
+    db_session.execute.side_effect = [lookup, conflicting_insert, reread]
+
+    conversation = await chat_controller._get_or_create_general_conversation(
+        db=db_session, session_id="test_session", user_id=None
+    )
+
+    assert conversation is existing
+    insert_sql = str(db_session.execute.await_args_list[1].args[0])
+    assert "ON CONFLICT" in insert_sql
+    db_session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_relax_commit_only_when_enabled(db_session, monkeypatch):
+    """Test chat turns skip the WAL flush wait only when async commit is switched on."""
+    monkeypatch.setattr("app.api.controllers.settings.chat_async_commit", False)
+    await ChatController._relax_commit(db_session)
+    db_session.execute.assert_not_awaited()
+
+    monkeypatch.setattr("app.api.controllers.settings.chat_async_commit", True)
+    await ChatController._relax_commit(db_session)
+    statement = db_session.execute.await_args[0][0]
+    assert "synchronous_commit" in str(statement)
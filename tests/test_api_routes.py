@@ -1,52 +1,62 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.main import app
-from app.api.controllers import chat_controller
-from app.database import get_db
+from app.api.controllers import get_chat_controller
+from app.database import get_async_db
+from app.database.models import GeneralConversation, GeneralMessage
+from app.modules.context_manager import history_page_cache
 from app.database.schemas import GeneralChatResponse, PropertyChatResponse
 from app.api.routes import Role
 
 # Create a test client
 client = TestClient(app)
+# Unhandled errors are served by the app's exception handler; let the
+# client return that response rather than re-raising the error
+error_client = TestClient(app, raise_server_exceptions=False)
 
 
 @pytest.fixture
 def db_session():
     """Create a mock database session."""
-    session = MagicMock(spec=Session)
-    session.commit = MagicMock()
+    session = MagicMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
     session.add = MagicMock()
-    session.refresh = MagicMock()
-    session.rollback = MagicMock()
+    session.refresh = AsyncMock()
+    session.rollback = AsyncMock()
     return session
 
 
 @pytest.fixture
 def override_get_db(db_session):
-    """Override the get_db dependency."""
+    """Override the get_async_db dependency."""
 
-    def _get_db():
+    async def _get_db():
         try:
             yield db_session
         finally:
             pass
 
-    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_db
     return _get_db
 
 
 @pytest.fixture
 def mock_chat_controller():
-    """Create a mock chat controller."""
-    original_controller = chat_controller
+    """Create a mock chat controller and inject it into the routes."""
+    chat_controller = MagicMock()
     chat_controller.handle_general_chat = AsyncMock()
     chat_controller.handle_property_chat = AsyncMock()
+    app.dependency_overrides[get_chat_controller] = lambda: chat_controller
     yield chat_controller
-    # Restore original controller after tests
-    app.chat_controller = original_controller
+    app.dependency_overrides.pop(get_chat_controller, None)
 
 
 def test_general_chat_endpoint_success(override_get_db, mock_chat_controller):
@@ -115,6 +125,28 @@ def test_general_chat_endpoint_missing_session_id(
     assert isinstance(call_kwargs["session_id"], str)
 
 
+def test_general_chat_stream_endpoint(override_get_db, mock_chat_controller):
+    """Test that the streaming endpoint relays the controller's SSE events."""
+
+    async def events():
+        yield 'data: {"type": "chunk", "content": "Hello"}\n\n'
+        yield 'data: {"type": "done", "conversation_id": 1}\n\n'
+
+    mock_chat_controller.handle_general_chat_stream = AsyncMock(return_value=events())
+
+    response = client.post("/api/v1/chat/general/stream", json={"message": "Hi there!"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'data: {"type": "chunk", "content": "Hello"}\n\n'
+        'data: {"type": "done", "conversation_id": 1}\n\n'
+    )
+    # Anonymous users get their generated session ID back in a cookie
+    session_id = mock_chat_controller.handle_general_chat_stream.call_args.kwargs["session_id"]
+    assert response.cookies["session_id"] == session_id
+
+
 def test_property_chat_endpoint_success(override_get_db, mock_chat_controller):
     """Test successful property chat endpoint."""
     # Mock the chat controller response
@@ -166,6 +198,17 @@ def test_property_chat_endpoint_missing_required_fields(override_get_db):
     assert response.status_code == 422  # Validation error
 
 
+def test_general_chat_endpoint_rejects_unknown_and_coerced_fields(override_get_db):
+    """Test chat requests with extra fields or non-string values fail validation."""
+    response = client.post(
+        "/api/v1/chat/general", json={"message": "Hello", "unexpected": True}
+    )
+    assert response.status_code == 422
+
+    response = client.post("/api/v1/chat/general", json={"message": 42})
+    assert response.status_code == 422
+
+
 def test_general_chat_endpoint_error_handling(override_get_db, mock_chat_controller):
     """Test error handling in general chat endpoint."""
     # Mock the chat controller to raise an exception
@@ -179,7 +222,7 @@ def test_general_chat_endpoint_error_handling(override_get_db, mock_chat_control
         "user_id": "test_user",
     }
 
-    response = client.post("/api/v1/chat/general", json=request_data)
+    response = error_client.post("/api/v1/chat/general", json=request_data)
 
     assert response.status_code == 500
     assert "Internal server error" in response.json()["detail"]
@@ -201,7 +244,118 @@ def test_property_chat_endpoint_error_handling(override_get_db, mock_chat_contro
         "counterpart_id": "test_seller",
     }
 
-    response = client.post("/api/v1/chat/property", json=request_data)
+    response = error_client.post("/api/v1/chat/property", json=request_data)
 
     assert response.status_code == 500
     assert "Internal server error" in response.json()["detail"]
+
+
+def test_general_chat_endpoint_keeps_http_errors(override_get_db, mock_chat_controller):
+    """Test an HTTPException from the controller keeps its status code."""
+    mock_chat_controller.handle_general_chat.side_effect = HTTPException(
+        status_code=401, detail="Session expired"
+    )
+
+    response = client.post(
+        "/api/v1/chat/general",
+        json={"message": "Hi there!", "session_id": "test_session", "user_id": "test_user"},
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Session expired"
+
+
+def test_general_history_endpoint_pages_backwards():
+    """Test history is served a page at a time, oldest first, with a cursor to older messages."""
+    conversation = GeneralConversation(id=1, session_id="test_session", context={})
+    # Newest first, as the endpoint queries them, plus the one extra row
+    rows = [
+        GeneralMessage(id=message_id, role="user", content=f"message {message_id}")
+        for message_id in (9, 8, 7)
+    ]
+
+    db = MagicMock(spec=AsyncSession)
+    db.get = AsyncMock(return_value=conversation)
+    db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=rows)))
+    app.dependency_overrides[get_async_db] = lambda: db
+    history_page_cache.clear()
+    try:
+        response = client.get("/api/v1/conversations/general/1/history?limit=2&before_id=10")
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+        history_page_cache.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [message["id"] for message in data["messages"]] == [8, 9]
+    assert data["next_before_id"] == 8
+    db.get.assert_awaited_once()
+    assert db.get.await_args[0] == (GeneralConversation, 1)
+    # Relationships are blocked so a stray access can't lazy-load every message
+    assert db.get.await_args[1]["options"]
+    # One extra row is fetched to tell whether an older page exists
+    assert db.execute.await_args[0][1] == {"conversation_id": 1, "limit": 3, "before_id": 10}
+
+
+def test_general_history_endpoint_revalidates_with_etag():
+    """Test a client holding the current page gets a 304 without touching the database."""
+    conversation = GeneralConversation(id=2, session_id="test_session", context={})
+    db = MagicMock(spec=AsyncSession)
+    db.get = AsyncMock(return_value=conversation)
+    db.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    app.dependency_overrides[get_async_db] = lambda: db
+    history_page_cache.clear()
+    try:
+        first = client.get("/api/v1/conversations/general/2/history")
+        db.get.reset_mock()
+        second = client.get(
+            "/api/v1/conversations/general/2/history",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+        history_page_cache.clear()
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == first.headers["ETag"]
+    db.get.assert_not_called()
+
+
+def test_general_history_export_streams_every_message(override_get_db, db_session):
+    """Test the export endpoint streams the full history as one JSON document."""
+    rows = [
+        SimpleNamespace(id=message_id, role="user", content=f"message {message_id}",
+                        timestamp=datetime(2024, 3, 1, 12, 0, message_id), intent=None)
+        for message_id in (1, 2, 3)
+    ]
+
+    async def stream_rows():
+        for row in rows:
+            yield row
+
+    @asynccontextmanager
+    async def session_factory():
+        session = MagicMock()
+        session.stream = AsyncMock(return_value=stream_rows())
+        yield session
+
+    db_session.scalar = AsyncMock(return_value=1)
+    with patch("app.api.routes.AsyncSessionLocal", session_factory):
+        response = client.get("/api/v1/conversations/general/1/export")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["conversation_id"] == 1
+    assert [message["id"] for message in data["messages"]] == [1, 2, 3]
+    assert data["messages"][0]["timestamp"] == "2024-03-01T12:00:01"
+
+
+def test_property_history_export_not_found(override_get_db, db_session):
+    """Test exporting an unknown conversation is a 404."""
+    db_session.scalar = AsyncMock(return_value=None)
+
+    response = client.get("/api/v1/conversations/property/999/export")
+
+    assert response.status_code == 404
@@ -1,17 +1,21 @@
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.api.controllers import ChatController
-from app.database import get_db
+from app.api.controllers import ChatController, get_chat_controller
+from app.database import get_db, get_async_db
 from app.database.models import (
     GeneralConversation as GeneralConversationModel,
     PropertyConversation as PropertyConversationModel,
 )
 from app.modules.property_context.property_context_module import Property
+from app.modules.context_manager import ConversationCache, ConversationHistoryCache
+from app.modules.intent_classification import Intent
 
 
 @pytest.fixture
@@ -26,15 +30,46 @@ def db_session():
 
 
 @pytest.fixture
-def override_get_db(db_session):
-    """Override the get_db dependency."""
+def async_db_session():
+    """Create a mock async database session."""
+    session = MagicMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
+    session.commit = AsyncMock()
+    session.add = MagicMock()
+    session.refresh = AsyncMock()
+    session.rollback = AsyncMock()
+
+    @asynccontextmanager
+    async def begin():
+        # Behave like AsyncSession.begin(): commit on exit, roll back on error
+        try:
+            yield
+        except BaseException:
+            await session.rollback()
+            raise
+        await session.commit()
+
+    session.begin = begin
+    return session
+
+
+@pytest.fixture
+def override_get_db(db_session, async_db_session):
+    """Override the get_db and get_async_db dependencies."""
     def _get_db():
         try:
             yield db_session
         finally:
             pass
 
+    async def _get_async_db():
+        try:
+            yield async_db_session
+        finally:
+            pass
+
     app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
     yield _get_db
     app.dependency_overrides.clear()
 
@@ -74,6 +109,8 @@ def mock_chat_controller():
     controller.session_manager.is_property_session_valid.return_value = True
     controller.session_manager.is_session_valid.return_value = True
     controller.session_manager.refresh_session = AsyncMock()
+    controller.history_cache = ConversationHistoryCache()
+    controller.conversation_cache = ConversationCache()
 
     # Mock message router
     controller.message_router = MagicMock()
@@ -84,6 +121,9 @@ def mock_chat_controller():
             "context": {},
         }
     )
+    controller.message_router.classify_intent = AsyncMock(
+        return_value=Intent.BUYER_SELLER_COMMUNICATION
+    )
 
     # Mock seller-buyer communication
     controller.seller_buyer_communication = MagicMock()
@@ -91,6 +131,9 @@ def mock_chat_controller():
         return_value="I'll help you with that property inquiry."
     )
     controller.seller_buyer_communication.notify_counterpart = AsyncMock()
+    controller.seller_buyer_communication.format_message_for_counterpart = AsyncMock(
+        return_value="The buyer is interested in this property."
+    )
 
     # Mock conversation creation methods
     async def mock_get_or_create_general_conversation(db, session_id, user_id=None):
@@ -135,12 +178,9 @@ def mock_chat_controller():
 @pytest.fixture
 def override_chat_controller(mock_chat_controller):
     """Override the chat controller in the app."""
-    from app.api import routes
-
-    original_controller = routes.chat_controller
-    routes.chat_controller = mock_chat_controller
+    app.dependency_overrides[get_chat_controller] = lambda: mock_chat_controller
     yield mock_chat_controller
-    routes.chat_controller = original_controller
+    app.dependency_overrides.pop(get_chat_controller, None)
 
 
 @pytest.mark.asyncio
@@ -219,7 +259,7 @@ async def test_complete_property_chat_flow(
 
 @pytest.mark.asyncio
 async def test_mixed_chat_flow_with_context_switching(
-    client, db_session, mock_property, override_chat_controller
+    client, db_session, async_db_session, mock_property, override_chat_controller
 ):
     """
     Test a complex flow that involves both general and property-specific conversations:
@@ -255,8 +295,9 @@ async def test_mixed_chat_flow_with_context_switching(
         if args and isinstance(args[0], type) and args[0].__name__ == 'PropertyMessage':
             mock_filter.filter = MagicMock(return_value=mock_filter)
             mock_filter.first.return_value = None
-        # For conversation queries
+        # For conversation queries (db.query(...).filter(...).first())
         else:
+            mock_filter.filter = MagicMock(return_value=mock_filter)
             mock_filter.first.return_value = mock_general_conversation
 
         return mock_filter
@@ -280,8 +321,9 @@ async def test_mixed_chat_flow_with_context_switching(
         if args and isinstance(args[0], type) and args[0].__name__ == 'PropertyMessage':
             mock_filter.filter = MagicMock(return_value=mock_filter)
             mock_filter.first.return_value = None
-        # For conversation queries
+        # For conversation queries (db.query(...).filter(...).first())
         else:
+            mock_filter.filter = MagicMock(return_value=mock_filter)
             mock_filter.first.return_value = mock_property_conversation
 
         return mock_filter
@@ -313,12 +355,14 @@ async def test_mixed_chat_flow_with_context_switching(
     assert response3.json()["session_id"] == general_session_id
 
     # Verify both conversation histories
+    async_db_session.get = AsyncMock(return_value=mock_general_conversation)
     response4 = client.get(
         f"/api/v1/conversations/general/{response1.json()['conversation_id']}/history"
     )
     assert response4.status_code == 200
 
     db_session.query.side_effect = mock_query_side_effect_property
+    async_db_session.get = AsyncMock(return_value=mock_property_conversation)
     response5 = client.get(
         f"/api/v1/conversations/property/{response2.json()['conversation_id']}/history"
     )
@@ -1,4 +1,5 @@
 from app.modules.context_manager.context_manager import ContextManager
+from app.modules.context_manager import HistoryPageCache
 
 
 def test_context_manager_initialization():
@@ -29,3 +30,17 @@ def test_clear_context():
     manager.update_context(test_context)
     manager.clear_context()
     assert manager.current_context == {}
+
+
+def test_history_page_cache_invalidates_every_page():
+    cache = HistoryPageCache()
+    key = ("general_messages", 1)
+    cache.set(key, (50, None), b"latest", 'W/"1"')
+    cache.set(key, (50, 10), b"older", 'W/"2"')
+
+    assert cache.get(key, (50, None)) == (b"latest", 'W/"1"')
+    assert cache.get(key, (20, None)) is None
+
+    cache.invalidate(key)
+    assert cache.get(key, (50, None)) is None
+    assert cache.get(key, (50, 10)) is None
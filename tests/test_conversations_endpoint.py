@@ -1,11 +1,15 @@
 import pytest
-from unittest.mock import MagicMock
+from contextlib import asynccontextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 import uuid
 
 from app.main import app
 from app.database import get_db
+from app.modules.context_manager import conversation_list_cache
 from app.database.models import (
     PropertyConversation,
     GeneralConversation,
@@ -185,4 +189,86 @@ def test_get_user_conversations_with_status_filter(override_get_db, db_session):
     
     # Verify that the external reference links to the counterpart conversation
     assert db_session.test_data["external_ref"].property_conversation_id == db_session.test_data["counterpart_property_conv"].id
-    assert db_session.test_data["external_ref"].external_id == user_id 
\ No newline at end of file
+    assert db_session.test_data["external_ref"].external_id == user_id 
+
+def test_get_user_conversations_rejects_oversized_page(override_get_db, db_session):
+    """Test that a page size above the cap is rejected before querying."""
+    user_id = db_session.test_data["user_id"]
+
+    response = client.get(f"/api/v1/conversations/user/{user_id}?limit=500")
+
+    assert response.status_code == 422
+
+
+def test_get_user_conversations_rejects_malformed_cursor(override_get_db, db_session):
+    """Test that a cursor not issued by the endpoint is a client error."""
+    user_id = db_session.test_data["user_id"]
+
+    response = client.get(f"/api/v1/conversations/user/{user_id}?general_cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+def test_get_user_conversations_pages_both_lists():
+    """Test both listings are fetched, each on its own session, and paged with cursors."""
+    user_id = str(uuid.uuid4())
+    general_rows = [
+        SimpleNamespace(id=conversation_id, session_id=f"general-{conversation_id}",
+                        started_at=datetime(2023, 1, conversation_id),
+                        last_message_at=datetime(2023, 1, conversation_id))
+        for conversation_id in (3, 2)
+    ]
+    property_rows = [
+        SimpleNamespace(id=1, session_id="property-1", user_id=user_id, property_id="property123",
+                        role="buyer", counterpart_id="seller", conversation_status="active",
+                        started_at=datetime(2023, 1, 1), last_message_at=datetime(2023, 1, 1)),
+    ]
+    sessions = []
+
+    @asynccontextmanager
+    async def session_factory():
+        # Listings are requested general first, then property
+        rows = property_rows if sessions else general_rows
+        session = MagicMock()
+        session.scalar = AsyncMock(return_value=len(rows) + 1)
+        session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=rows)))
+        sessions.append(session)
+        yield session
+
+    with patch("app.api.routes.AsyncSessionLocal", session_factory):
+        response = client.get(f"/api/v1/conversations/user/{user_id}?limit=1")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(sessions) == 2
+    assert [conv["id"] for conv in data["general_conversations"]] == [3]
+    assert [conv["id"] for conv in data["property_conversations"]] == [1]
+    assert data["property_conversations"][0]["is_counterpart"] is False
+    assert data["total_general_conversations"] == 3
+    assert data["next_general_cursor"] is not None
+    assert data["next_property_cursor"] is None
+    assert data["has_more"] is True
+
+
+def test_get_user_conversations_serves_repeats_from_cache():
+    """Test a repeated listing skips the database until the user's conversations change."""
+    user_id = str(uuid.uuid4())
+    sessions = []
+
+    @asynccontextmanager
+    async def session_factory():
+        session = MagicMock()
+        session.scalar = AsyncMock(return_value=0)
+        session.execute = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+        sessions.append(session)
+        yield session
+
+    with patch("app.api.routes.AsyncSessionLocal", session_factory):
+        first = client.get(f"/api/v1/conversations/user/{user_id}")
+        second = client.get(f"/api/v1/conversations/user/{user_id}")
+        assert len(sessions) == 2
+        assert second.json() == first.json()
+
+        conversation_list_cache.invalidate(user_id)
+        client.get(f"/api/v1/conversations/user/{user_id}")
+        assert len(sessions) == 4
@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy import text
@@ -55,4 +56,51 @@ def test_inquiries_table_dropped():
         with pytest.raises(ProgrammingError):
             session.execute(text("SELECT * FROM inquiries"))
     finally:
-        session.close() 
\ No newline at end of file
+        session.close() 
+
+def test_role_and_status_are_stored_as_codes():
+    """Test role and status round-trip through their smallint codes."""
+    from app.api.routes import ConversationStatus
+
+    status_type = PropertyConversation.__table__.c.conversation_status.type
+    role_type = PropertyConversation.__table__.c.role.type
+
+    assert role_type.process_bind_param("seller", None) == 2
+    assert status_type.process_bind_param(ConversationStatus.CLOSED, None) == 3
+    assert status_type.process_result_value(2, None) == "pending"
+    with pytest.raises(ValueError):
+        role_type.process_bind_param("agent", None)
+
+
+def test_message_collections_are_write_only():
+    """Test a conversation's messages can only be queried, never loaded whole."""
+    conversation = GeneralConversation(session_id="test_session")
+
+    statement = str(conversation.messages.select().limit(5))
+
+    assert "ORDER BY general_messages.timestamp DESC" in statement
+    assert PropertyConversation.messages.property.lazy == "write_only"
+
+
+def test_timestamps_default_on_insert(test_db):
+    """Test conversations and messages get a timestamp when none is given."""
+    from app.database import db_connection
+    from app.database.models import GeneralMessage
+
+    session = db_connection.SessionLocal()
+    try:
+        conversation = GeneralConversation(session_id="timestamp_default_session")
+        session.add(conversation)
+        session.flush()
+        message = GeneralMessage(conversation_id=conversation.id, role="user", content="Hello")
+        session.add(message)
+        session.flush()
+        session.refresh(conversation)
+        session.refresh(message)
+
+        assert isinstance(conversation.started_at, datetime)
+        assert isinstance(conversation.last_message_at, datetime)
+        assert isinstance(message.timestamp, datetime)
+    finally:
+        session.rollback()
+        session.close()
@@ -153,3 +153,46 @@ async def test_classify_company_information_examples(intent_classifier, mock_llm
     for message in messages:
         result = await intent_classifier.classify(message)
         assert result == Intent.COMPANY_INFORMATION
+
+
+@pytest.mark.asyncio
+async def test_classify_caches_repeated_messages(intent_classifier, mock_llm_client):
+    """Test that a repeated message is classified once."""
+    intent_classifier.llm_client = mock_llm_client
+    mock_llm_client.generate_response.return_value = "price_inquiry"
+
+    first = await intent_classifier.classify("How much does it cost?")
+    second = await intent_classifier.classify("  how much does it COST? ")
+
+    assert first == second == Intent.PRICE_INQUIRY
+    mock_llm_client.generate_response.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_classify_shares_first_turns_across_sessions(intent_classifier, mock_llm_client):
+    """Test that a message with no prior turn is keyed on the message alone."""
+    intent_classifier.llm_client = mock_llm_client
+    mock_llm_client.generate_response.return_value = "general_question"
+
+    for session_id in ("session_a", "session_b"):
+        await intent_classifier.classify(
+            "How long does the buying process take?",
+            {"session_id": session_id, "user_id": None, "conversation_history": []},
+        )
+
+    mock_llm_client.generate_response.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_classify_cache_respects_conversation_context(intent_classifier, mock_llm_client):
+    """Test that the same message is re-classified when the prompt context differs."""
+    intent_classifier.llm_client = mock_llm_client
+    mock_llm_client.generate_response.side_effect = ["negotiation", "availability_and_booking_request"]
+    history_a = [{"role": "user", "content": "Can I offer less?"}, {"role": "assistant", "content": "Sure"}]
+    history_b = [{"role": "user", "content": "Can I visit?"}, {"role": "assistant", "content": "Sure"}]
+
+    first = await intent_classifier.classify("Yes please", {"conversation_history": history_a})
+    second = await intent_classifier.classify("Yes please", {"conversation_history": history_b})
+
+    assert first == Intent.NEGOTIATION
+    assert second == Intent.AVAILABILITY_AND_BOOKING_REQUEST
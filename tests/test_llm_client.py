@@ -1,5 +1,7 @@
 import pytest
-from app.modules.llm import LLMClient, LLMProvider, SystemPrompts
+from unittest.mock import AsyncMock, MagicMock
+from app.modules.llm import LLMClient, LLMProvider, ResponseCache, SystemPrompts, close_http_client
+from app.modules.llm.llm_client import get_http_client
 
 
 @pytest.fixture
@@ -64,3 +66,71 @@ def test_provider_specific_prompts():
             assert "bullet points" in prompt.lower()
         elif provider == LLMProvider.GEMINI:
             assert "natural language" in prompt.lower()
+
+
+@pytest.mark.asyncio
+async def test_stream_response_yields_gemini_chunks():
+    client = LLMClient()
+    chunks = [MagicMock(text="Hello"), MagicMock(text=""), MagicMock(text=" there")]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    gemini = MagicMock()
+    gemini.generate_content_async = AsyncMock(return_value=stream())
+    client.clients = {LLMProvider.GEMINI: gemini}
+
+    streamed = [chunk async for chunk in client.stream_response([{"role": "user", "content": "Hi"}])]
+
+    assert streamed == ["Hello", " there"]
+    assert gemini.generate_content_async.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_response_falls_back_to_single_chunk(llm_client):
+    llm_client.generate_response = AsyncMock(return_value="Full answer")
+
+    streamed = [chunk async for chunk in llm_client.stream_response([{"role": "user", "content": "Hi"}])]
+
+    assert streamed == ["Full answer"]
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_until_closed():
+    client = get_http_client()
+    assert get_http_client() is client
+
+    await close_http_client()
+
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_generate_response_awaits_gemini_natively():
+    client = LLMClient()
+    gemini = MagicMock()
+    gemini.generate_content_async = AsyncMock(return_value=MagicMock(text="Hello there"))
+    client.clients = {LLMProvider.GEMINI: gemini}
+
+    response = await client.generate_response([{"role": "user", "content": "Hi"}])
+
+    assert response == "Hello there"
+    gemini.generate_content_async.assert_awaited_once()
+    gemini.generate_content.assert_not_called()
+
+
+def test_response_cache_matches_rephrasings_by_digest():
+    cache = ResponseCache(ttl=60, maxsize=10)
+    cache.set("How do I list my property?", "Use the Sell tab.", "website_functionality")
+
+    assert cache.get("how do I   list my property") == {
+        "response": "Use the Sell tab.",
+        "intent": "website_functionality",
+    }
+    # Keys are fixed-size digests, not the question text
+    assert all(len(key) == 16 for key in cache.response_cache)
+    cache.set("What is this house worth?", "About 500k.", "price_inquiry")
+    assert cache.get("What is this house worth?") is None
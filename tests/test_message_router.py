@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from app.modules.message_router import MessageRouter
 from app.modules.intent_classification.intent_classifier import Intent
 from app.modules.property_context.property_context_module import Property
@@ -242,4 +242,30 @@ async def test_route_company_information(message_router):
 
     response = await message_router.process_message("Tell me about MaiSON's history.")
     assert response == "Company information response"
-    message_router.website_info_module.handle_company_information.assert_called_once()
\ No newline at end of file
+    message_router.website_info_module.handle_company_information.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_classify_intent_does_not_route(message_router):
+    message_router.intent_classifier.classify.return_value = Intent.PRICE_INQUIRY
+
+    intent = await message_router.classify_intent("How much is it?", {"property_id": "123"})
+
+    assert intent == Intent.PRICE_INQUIRY
+    message_router.property_context.handle_pricing.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_route_message_stream_streams_advisory_answers(message_router):
+    async def chunks():
+        yield "Try "
+        yield "Hackney."
+
+    message_router.intent_classifier.classify_general = AsyncMock(return_value=Intent.GENERAL_QUESTION)
+    message_router.intent_classifier.classify.return_value = Intent.GENERAL_QUESTION
+    message_router.advisory_module.stream_general_inquiry = MagicMock(return_value=chunks())
+
+    intent, stream = await message_router.route_message_stream("Where should I live in London?")
+
+    assert intent == "general_question"
+    assert [chunk async for chunk in stream] == ["Try ", "Hackney."]
+    message_router.advisory_module.handle_general_inquiry.assert_not_called()
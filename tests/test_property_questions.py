@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.testclient import TestClient
 
 from app.main import app
@@ -15,7 +15,8 @@ client = TestClient(app)
 @pytest.fixture
 def db_session():
     """Create a mock database session."""
-    session = MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+    session.execute = AsyncMock(return_value=MagicMock())
     return session
 
 @pytest.fixture
@@ -53,13 +54,14 @@ def mock_property_question():
 @pytest.fixture
 def override_get_db(db_session):
     """Override the get_db dependency for testing."""
-    from app.database import get_db
+    from app.database import get_db, get_async_db
     from app.main import app
     
     async def _get_db_override():
         yield db_session
     
     app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = _get_db_override
     yield
     app.dependency_overrides.clear()
 
@@ -70,7 +72,7 @@ async def test_buyer_asking_question(db_session, mock_property_conversation):
     comm_module = SellerBuyerCommunicationModule()
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalars.return_value.first.side_effect = [
         None,  # No existing question with this message_id
         mock_property_conversation  # For conversation lookup
     ]
@@ -82,13 +84,12 @@ async def test_buyer_asking_question(db_session, mock_property_conversation):
         "role": "buyer",
         "counterpart_id": "test_seller",
         "property_id": "test_property",
-        "db": db_session,
         "message_id": 1
     }
 
     # Test asking a question
     message = "Can you ask the seller how far the nearest tube station is?"
-    response = await comm_module.handle_message(message=message, context=context)
+    response = await comm_module.handle_message(message=message, context=context, db=db_session)
 
     # Verify response
     assert response == "I will forward your question to the seller and let you know once I have a response."
@@ -109,7 +110,7 @@ async def test_seller_answering_question(db_session, mock_property_question, moc
     comm_module = SellerBuyerCommunicationModule()
     
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_property_question,  # First query for the question
         mock_property_conversation  # Second query for the conversation
     ]
@@ -142,16 +143,21 @@ async def test_seller_answering_question(db_session, mock_property_question, moc
     assert added_message.message_metadata["is_seller_response"] is True
     assert added_message.message_metadata["original_question_id"] == mock_property_question.id
 
+def test_get_seller_questions_rejects_unknown_status(db_session, override_get_db):
+    """Test a status filter outside the stored values is a validation error."""
+    response = client.get("/api/v1/seller/questions/test_seller_1?status=archived")
+
+    assert response.status_code == 422
+    db_session.execute.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_get_seller_questions_endpoint(db_session, mock_property_question, override_get_db):
     """Test the endpoint for getting a seller's questions."""
     # Mock database query to return a list of questions
-    mock_questions = [mock_property_question]
-    mock_query = MagicMock()
-    mock_query.filter.return_value = mock_query
-    mock_query.order_by.return_value = mock_query
-    mock_query.all.return_value = mock_questions
-    db_session.query.return_value = mock_query
+    columns = ("id", "property_id", "buyer_id", "question_text", "status",
+               "created_at", "answered_at", "answer_text")
+    row = MagicMock(_mapping={column: getattr(mock_property_question, column) for column in columns})
+    db_session.execute.return_value.all.return_value = [row]
     
     # Make request to get seller's questions
     response = client.get("/api/v1/seller/questions/test_seller_1")
@@ -183,7 +189,7 @@ async def test_answer_question_endpoint(db_session, mock_property_question, mock
     mock_property_question.answered_at = None
     
     # Mock database queries to return the question and conversation
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_property_question,  # First query for the question
         mock_property_conversation  # Second query for the conversation
     ]
@@ -226,7 +232,7 @@ async def test_question_not_found(db_session):
     comm_module = SellerBuyerCommunicationModule()
     
     # Mock database query to return None (question not found)
-    db_session.query.return_value.filter.return_value.first.return_value = None
+    db_session.execute.return_value.scalar_one_or_none.return_value = None
     
     # Test answering a non-existent question
     result = await comm_module.handle_seller_response(
@@ -254,7 +260,7 @@ async def test_invalid_question_status_transition(db_session, mock_property_ques
     mock_property_question.answered_at = datetime.utcnow()
     
     # Mock database queries to return the question but no conversation
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalar_one_or_none.side_effect = [
         mock_property_question,  # First query for the question
         None  # Second query for the conversation (not found)
     ]
@@ -286,7 +292,7 @@ async def test_question_reformatting(db_session, mock_property_conversation):
     )
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalars.return_value.first.side_effect = [
         None,  # No existing question with this message_id
         mock_property_conversation  # For conversation lookup
     ]
@@ -298,13 +304,12 @@ async def test_question_reformatting(db_session, mock_property_conversation):
         "role": "buyer",
         "counterpart_id": "test_seller",
         "property_id": "test_property",
-        "db": db_session,
         "message_id": 1
     }
 
     # Test asking a question that needs reformatting
     message = "yes please can you ask the seller if the property has an underground bunker"
-    response = await comm_module.handle_message(message=message, context=context)
+    response = await comm_module.handle_message(message=message, context=context, db=db_session)
 
     # Verify response
     assert response == "I will forward your question to the seller and let you know once I have a response."
@@ -333,7 +338,7 @@ async def test_question_confirmation_handling(db_session, mock_property_conversa
     )
 
     # Mock database queries
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalars.return_value.first.side_effect = [
         None,  # No existing question with this message_id
         mock_property_conversation  # For conversation lookup
     ]
@@ -345,7 +350,6 @@ async def test_question_confirmation_handling(db_session, mock_property_conversa
         "role": "buyer",
         "counterpart_id": "test_seller",
         "property_id": "test_property",
-        "db": db_session,
         "message_id": 1,
         "conversation_history": [
             {"role": "user", "content": "Are there any bakeries near the property?"},
@@ -355,7 +359,7 @@ async def test_question_confirmation_handling(db_session, mock_property_conversa
 
     # Test simple confirmation response
     message = "Yes please"
-    response = await comm_module.handle_message(message=message, context=context)
+    response = await comm_module.handle_message(message=message, context=context, db=db_session)
 
     # Verify response
     assert response == "I will forward your question to the seller and let you know once I have a response."
@@ -376,7 +380,7 @@ async def test_question_confirmation_handling(db_session, mock_property_conversa
 
     # Reset mock call history
     db_session.reset_mock()
-    db_session.query.return_value.filter.return_value.first.side_effect = [
+    db_session.execute.return_value.scalars.return_value.first.side_effect = [
         None,  # No existing question with this message_id
         mock_property_conversation  # For conversation lookup
     ]
@@ -390,7 +394,7 @@ async def test_question_confirmation_handling(db_session, mock_property_conversa
     ]
     
     message = "Yes please"
-    response = await comm_module.handle_message(message=message, context=context)
+    response = await comm_module.handle_message(message=message, context=context, db=db_session)
     
     # Verify it's treated as a normal message, not a question confirmation
     assert response != "I will forward your question to the seller and let you know once I have a response."
@@ -465,7 +469,6 @@ async def test_llm_based_question_detection(db_session, mock_property_conversati
             "role": "buyer",
             "counterpart_id": "test_seller",
             "property_id": "test_property",
-            "db": db_session,
             "message_id": 1,
             "conversation_history": [
                 {"role": "user", "content": "Is there a garage?"},
@@ -480,10 +483,33 @@ async def test_llm_based_question_detection(db_session, mock_property_conversati
 
         if expected_needs_input:
             # Test full message handling
-            response = await comm_module.handle_message(message=message, context=context)
+            response = await comm_module.handle_message(message=message, context=context, db=db_session)
             assert response == "I will forward your question to the seller and let you know once I have a response."
 
     # Test LLM failure fallback
     comm_module.llm_client.generate_response = AsyncMock(side_effect=Exception("LLM Error"))
     needs_input = await comm_module._needs_seller_input("yes please ask the seller")
-    assert needs_input == True  # Should fall back to pattern matching 
\ No newline at end of file
+    assert needs_input == True  # Should fall back to pattern matching 
+@pytest.mark.asyncio
+async def test_notify_counterpart_leaves_conversation_context_untouched(db_session):
+    """Test that forwarding an answer does not write into the conversation's property context."""
+    comm_module = SellerBuyerCommunicationModule()
+    comm_module.format_message_for_counterpart = AsyncMock(return_value="Formatted answer")
+    db_session.commit = AsyncMock()
+
+    property_context = {"price": 450000}
+    context = {
+        "role": "seller",
+        "counterpart_id": "test_buyer",
+        "property_id": "test_property",
+        "property_context": property_context,
+        "original_question": "Is there a garage?",
+    }
+
+    assert await comm_module.notify_counterpart(
+        conversation_id=1, message="Yes, a double garage.", db=db_session, context=context
+    )
+
+    assert property_context == {"price": 450000}
+    forwarded_context = comm_module.format_message_for_counterpart.call_args.args[2]
+    assert forwarded_context["original_question"] == "Is there a garage?"
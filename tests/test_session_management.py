@@ -1,9 +1,12 @@
+import time
+import uuid
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.modules.session_management import SessionManager
 from app.database.models import GeneralConversation, PropertyConversation
+from app.utils.helpers import new_session_id
 
 
 @pytest.fixture
@@ -14,10 +17,11 @@ def session_manager():
 @pytest.fixture
 def db_session():
     """Create a mock database session."""
-    session = MagicMock(spec=Session)
-    session.commit = MagicMock()
-    session.rollback = MagicMock()
-    session.query = MagicMock()
+    session = MagicMock(spec=AsyncSession)
+    session.execute = AsyncMock()
+    session.delete = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
     return session
 
 
@@ -55,21 +59,21 @@ async def test_cleanup_expired_anonymous_sessions(session_manager, db_session):
     expired_conv.last_message_at = datetime.utcnow() - timedelta(hours=25)
 
     # Set up mock query results
-    mock_query = MagicMock()
+    mock_result = MagicMock()
     # Return expired anonymous conversation for anonymous query
-    mock_query.filter.return_value.all.side_effect = [
+    mock_result.scalars.return_value.all.side_effect = [
         [expired_conv],
         [],
     ]  # First call returns expired anonymous, second call returns no authenticated
-    db_session.query.return_value = mock_query
+    db_session.execute.return_value = mock_result
 
     # Run cleanup
     cleaned_count = await session_manager.cleanup_expired_sessions(db_session)
 
     # Verify results
     assert cleaned_count == 1
-    db_session.delete.assert_called_once_with(expired_conv)
-    db_session.commit.assert_called_once()
+    db_session.delete.assert_awaited_once_with(expired_conv)
+    db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -81,21 +85,21 @@ async def test_cleanup_expired_authenticated_sessions(session_manager, db_sessio
     expired_conv.last_message_at = datetime.utcnow() - timedelta(days=31)
 
     # Set up mock query results
-    mock_query = MagicMock()
+    mock_result = MagicMock()
     # Return expired authenticated conversation for authenticated query
-    mock_query.filter.return_value.all.side_effect = [
+    mock_result.scalars.return_value.all.side_effect = [
         [],
         [expired_conv],
     ]  # First call returns no anonymous, second call returns expired authenticated
-    db_session.query.return_value = mock_query
+    db_session.execute.return_value = mock_result
 
     # Run cleanup
     cleaned_count = await session_manager.cleanup_expired_sessions(db_session)
 
     # Verify results
     assert cleaned_count == 1
-    db_session.delete.assert_called_once_with(expired_conv)
-    db_session.commit.assert_called_once()
+    db_session.delete.assert_awaited_once_with(expired_conv)
+    db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -111,12 +115,12 @@ async def test_cleanup_both_types_of_sessions(session_manager, db_session):
     expired_authenticated.last_message_at = datetime.utcnow() - timedelta(days=31)
 
     # Set up mock query results
-    mock_query = MagicMock()
-    mock_query.filter.return_value.all.side_effect = [
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.side_effect = [
         [expired_anonymous],
         [expired_authenticated],
     ]
-    db_session.query.return_value = mock_query
+    db_session.execute.return_value = mock_result
 
     # Run cleanup
     cleaned_count = await session_manager.cleanup_expired_sessions(db_session)
@@ -126,7 +130,7 @@ async def test_cleanup_both_types_of_sessions(session_manager, db_session):
     assert db_session.delete.call_count == 2
     db_session.delete.assert_any_call(expired_anonymous)
     db_session.delete.assert_any_call(expired_authenticated)
-    db_session.commit.assert_called_once()
+    db_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -137,16 +141,16 @@ async def test_cleanup_error_handling(session_manager, db_session):
 
     # Create mock expired conversation
     expired_conv = MagicMock(spec=GeneralConversation)
-    mock_query = MagicMock()
-    mock_query.filter.return_value.all.return_value = [expired_conv]
-    db_session.query.return_value = mock_query
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [expired_conv]
+    db_session.execute.return_value = mock_result
 
     # Verify error handling
     with pytest.raises(Exception) as exc_info:
         await session_manager.cleanup_expired_sessions(db_session)
 
     assert "Failed to cleanup sessions" in str(exc_info.value)
-    db_session.rollback.assert_called_once()
+    db_session.rollback.assert_awaited_once()
 
 
 def test_is_session_valid_anonymous(session_manager, mock_general_conversation):
@@ -211,3 +215,14 @@ async def test_refresh_session_none(session_manager):
     """Test session refresh with None conversation."""
     # Should not raise an exception
     await session_manager.refresh_session(None)
+
+
+def test_new_session_id_is_time_ordered():
+    """Test new session IDs are version 7 UUIDs that sort by creation time."""
+    first = new_session_id()
+    time.sleep(0.002)
+    second = new_session_id()
+
+    assert uuid.UUID(first).version == 7
+    assert uuid.UUID(first).variant == uuid.RFC_4122
+    assert first < second